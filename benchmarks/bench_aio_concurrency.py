@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_aio_concurrency
+
+:Synopsis:
+    Concurrent is_authorized checks: sequential, thread-based, and asyncio (httpx) clients against a stand-in server
+    with simulated latency. The asyncio run uses a single thread; both concurrent runs are capped at the same number
+    of connections. The stand-in server shares the process, so run on a multi-core host for meaningful numbers.
+
+    Usage: python benchmarks/bench_aio_concurrency.py [checks] [concurrency]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import time
+
+from iam_lib.aio.authorized import AsyncAuthorizedClient
+from iam_lib.api.authorized import AuthorizedClient
+from stand_in import StandInHandler, StandInServer, make_key_pair
+
+
+class SlowHandler(StandInHandler):
+    delay = 0.02
+
+
+def client_kwargs(host: str, public_key_path: str, concurrency: int) -> dict:
+    return dict(
+        scheme="http",
+        host=host,
+        accept="json",
+        public_key_path=public_key_path,
+        algorithm="ES256",
+        token=None,
+        pool_size=concurrency,
+    )
+
+
+def run_sequential(kwargs: dict, keys: list) -> float:
+    with AuthorizedClient(**kwargs) as client:
+        start = time.perf_counter()
+        for key in keys:
+            client.is_authorized(resource_key=key, permission="read")
+        return len(keys) / (time.perf_counter() - start)
+
+
+def run_threads(kwargs: dict, keys: list, concurrency: int) -> float:
+    with AuthorizedClient(**kwargs) as client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda key: client.is_authorized(resource_key=key, permission="read"), keys))
+        return len(keys) / (time.perf_counter() - start)
+
+
+async def run_asyncio(kwargs: dict, keys: list) -> float:
+    async with AsyncAuthorizedClient(**kwargs) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(client.is_authorized(resource_key=key, permission="read") for key in keys))
+        return len(keys) / (time.perf_counter() - start)
+
+
+def main():
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    public_key_path, _ = make_key_pair()
+    keys = [f"resource_{i}" for i in range(checks)]
+    with StandInServer(SlowHandler) as server:
+        kwargs = client_kwargs(server.host, public_key_path, concurrency)
+        sequential = run_sequential(kwargs, keys[:max(1, checks // 10)])
+        threads = run_threads(kwargs, keys, concurrency)
+        aio = asyncio.run(run_asyncio(kwargs, keys))
+    print(f"checks: {checks}, concurrency: {concurrency}, latency: {SlowHandler.delay * 1000:.0f} ms")
+    print(f"sequential: {sequential:10.1f} checks/s")
+    print(f"threads:    {threads:10.1f} checks/s")
+    print(f"asyncio:    {aio:10.1f} checks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_codec
+
+:Synopsis:
+    Decode and encode throughput of each installed JSON codec backend (iam_lib.models.codec) on a large rule listing
+    and a resource tree, the response bodies that dominate IAM client time
+
+    Usage: python benchmarks/bench_codec.py [records] [repeat]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+import sys
+import time
+
+from iam_lib.models import codec
+
+
+PERMISSIONS = ("read", "write", "changePermission")
+
+
+def make_rules(records: int) -> list:
+    return [
+        {"resource_key": f"resource_{i // 10}", "principal": f"EDI-{i % 500:032x}", "permission": PERMISSIONS[i % 3]}
+        for i in range(records)
+    ]
+
+
+def make_tree(records: int) -> dict:
+    children = [
+        {
+            "key": f"resource_{i}",
+            "label": f"Data entity {i}",
+            "type": "data",
+            "children": [],
+            "principals": [{"edi_id": f"EDI-{i % 500:032x}", "permission": "WRITE"}],
+        }
+        for i in range(records)
+    ]
+    return {"key": "package", "label": "Data package", "type": "package", "children": children, "principals": []}
+
+
+def best(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    documents = {"rules": make_rules(records), "tree": make_tree(records // 10)}
+    for document_name, document in documents.items():
+        body = json.dumps(document).encode("utf-8")
+        print(f"{document_name}: {len(body) / 1e6:.1f} MB")
+        for name in codec.available_codecs():
+            json_codec = codec.set_codec(name)
+            decode = best(lambda: json_codec.loads(body), repeat)
+            encode = best(lambda: json_codec.dumps(document), repeat)
+            print(
+                f"  {name:8} decode: {len(body) / decode / 1e6:8.1f} MB/s"
+                f"   encode: {len(body) / encode / 1e6:8.1f} MB/s"
+            )
+        stdlib = codec.set_codec("json")
+        decode = best(lambda: stdlib.loads(body.decode("utf-8")), repeat)
+        print(f"  {'json str':8} decode: {len(body) / decode / 1e6:8.1f} MB/s   (previous decode of response.text)")
+    codec.set_codec(None)
+
+
+if __name__ == "__main__":
+    main()
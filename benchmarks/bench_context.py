@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_context
+
+:Synopsis:
+    Cost of creating the nine IAM API clients per request: by their constructors, each validating the configuration
+    and creating a session, and from a shared IAMContext (iam_lib.context)
+
+    Usage: python benchmarks/bench_context.py public_key_path [rounds]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import sys
+import time
+
+from iam_lib.api.access import AccessClient
+from iam_lib.api.api_key import ApiKeyClient
+from iam_lib.api.authorized import AuthorizedClient
+from iam_lib.api.edi_token import EdiTokenClient
+from iam_lib.api.eml import EMLClient
+from iam_lib.api.group import GroupClient
+from iam_lib.api.profile import ProfileClient
+from iam_lib.api.resource import ResourceClient
+from iam_lib.api.rule import RuleClient
+from iam_lib.context import IAMContext
+
+
+CLIENT_CLASSES = (
+    AccessClient,
+    ApiKeyClient,
+    AuthorizedClient,
+    EdiTokenClient,
+    EMLClient,
+    GroupClient,
+    ProfileClient,
+    ResourceClient,
+    RuleClient,
+)
+CONTEXT_METHODS = ("access", "api_key", "authorized", "edi_token", "eml", "group", "profile", "resource", "rule")
+
+
+def main():
+    public_key_path = sys.argv[1]
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    config = ("https", "localhost:5000", "json", public_key_path, "ES256", None)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for client_class in CLIENT_CLASSES:
+            client_class(*config).close()
+    constructed = (time.perf_counter() - start) / rounds
+
+    context = IAMContext(*config)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for method in CONTEXT_METHODS:
+            getattr(context, method)()
+    handed_out = (time.perf_counter() - start) / rounds
+    context.close()
+
+    print(f"constructors: {constructed * 1e6:9.1f} us per nine clients")
+    print(f"IAMContext:   {handed_out * 1e6:9.1f} us per nine clients ({constructed / handed_out:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_policy_engine
+
+:Synopsis:
+    Decisions/sec of the local access control rule engine compared with AuthorizedClient.is_authorized round trips
+    to a stand-in server (no simulated latency, so the round trips are a best case)
+
+    Usage: python benchmarks/bench_policy_engine.py [decisions] [resources]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+import random
+import sys
+import time
+
+from iam_lib.api.authorized import AuthorizedClient
+from iam_lib.api.resource import ResourceClient
+from iam_lib.api.rule import RuleClient
+from iam_lib.policy import PolicyEngine
+from stand_in import StandInHandler, StandInServer, make_key_pair
+
+
+PERMISSIONS = ("READ", "WRITE", "CHANGE")
+
+
+def make_tree(resources: int, principals: list) -> dict:
+    rng = random.Random(0)
+    children = [
+        {
+            "key": f"resource_{i}",
+            "children": [],
+            "principals": [
+                {"edi_id": principal, "permission": rng.choice(PERMISSIONS)}
+                for principal in rng.sample(principals, 4)
+            ],
+        }
+        for i in range(resources)
+    ]
+    return {"key": "package", "children": children, "principals": []}
+
+
+def main():
+    decisions = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    resources = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    principals = [f"EDI-{i:032x}" for i in range(50)]
+    public_key_path, _ = make_key_pair()
+
+    class TreeHandler(StandInHandler):
+        body = json.dumps(make_tree(resources, principals)).encode("utf-8")
+
+    rng = random.Random(1)
+    checks = [
+        (
+            rng.sample(principals, 3),
+            f"resource_{rng.randrange(resources)}",
+            rng.choice(("read", "write", "changePermission")),
+        )
+        for _ in range(decisions)
+    ]
+    kwargs = dict(accept="json", public_key_path=public_key_path, algorithm="ES256", token=None, scheme="http")
+    with StandInServer(TreeHandler) as server:
+        resource_client = ResourceClient(host=server.host, **kwargs)
+        rule_client = RuleClient(host=server.host, **kwargs)
+        with resource_client, rule_client:
+            engine = PolicyEngine(resource_client, rule_client, ["package"], refresh_interval=None)
+            start = time.perf_counter()
+            engine.load()
+            load = time.perf_counter() - start
+            start = time.perf_counter()
+            for check in checks:
+                engine.is_authorized(*check)
+            local = decisions / (time.perf_counter() - start)
+        remote_count = min(decisions, 1000)
+        with AuthorizedClient(host=server.host, **kwargs) as client:
+            start = time.perf_counter()
+            for _, resource_key, permission in checks[:remote_count]:
+                client.is_authorized(resource_key, permission)
+            remote = remote_count / (time.perf_counter() - start)
+    print(f"resources: {resources}, load: {load * 1000:.1f} ms")
+    print(f"is_authorized (server): {remote:12.1f} decisions/s")
+    print(f"PolicyEngine (local):   {local:12.1f} decisions/s ({local / remote:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_records
+
+:Synopsis:
+    Memory per record and throughput of response record models (iam_lib.models.records) compared with the decoded
+    dicts returned today, for a large rule listing
+
+    Usage: python benchmarks/bench_records.py [records]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from iam_lib.models.records import Rule
+
+
+PERMISSIONS = ("read", "write", "changePermission")
+
+
+def make_body(records: int) -> str:
+    return json.dumps([
+        {"resource_key": f"resource_{i // 10}", "principal": f"EDI-{i % 500:032x}", "permission": PERMISSIONS[i % 3]}
+        for i in range(records)
+    ])
+
+
+def retained(build) -> tuple[int, float]:
+    # Bytes still allocated once the result is built, and the time taken to build it
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size, elapsed
+
+
+def throughput(build, records: int) -> float:
+    start = time.perf_counter()
+    for record in build():
+        _ = record["permission"] if isinstance(record, dict) else record.permission
+    return records / (time.perf_counter() - start)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    body = make_body(records)
+    cases = {
+        "dict (json.loads)": lambda: json.loads(body),
+        "Rule, lazy": lambda: Rule.from_list(json.loads(body)),
+        "Rule, compact": lambda: Rule.from_list(json.loads(body), compact=True),
+    }
+    print(f"records: {records}, body: {len(body) / 1e6:.1f} MB")
+    print(f"{'':20} {'bytes/record':>14} {'build records/s':>16} {'build+read records/s':>22}")
+    for name, build in cases.items():
+        size, _ = retained(build)
+        start = time.perf_counter()
+        build()
+        build_rate = records / (time.perf_counter() - start)
+        print(f"{name:20} {size / records:14.1f} {build_rate:16.0f} {throughput(build, records):22.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    bench_session_pool
+
+:Synopsis:
+    Requests/sec against a local stand-in server of a new connection per request (requests.get), the IAM client with
+    keep-alive off, and the IAM client with its pooled keep-alive session
+
+    Usage: python benchmarks/bench_session_pool.py [requests]
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import sys
+import time
+
+import requests
+
+from iam_lib.api.client import Client
+from stand_in import StandInServer, make_key_pair
+
+
+def run(host: str, public_key_path: str, keep_alive: bool, count: int) -> float:
+    with Client(
+        scheme="http",
+        host=host,
+        accept="json",
+        public_key_path=public_key_path,
+        algorithm="ES256",
+        token=None,
+        keep_alive=keep_alive,
+    ) as client:
+        client.get(route="auth/v1/ping")  # Warm up
+        start = time.perf_counter()
+        for _ in range(count):
+            client.get(route="auth/v1/ping")
+        return count / (time.perf_counter() - start)
+
+
+def run_requests_get(host: str, count: int) -> float:
+    url = f"http://{host}/auth/v1/ping"
+    requests.get(url)  # Warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        requests.get(url)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    public_key_path, _ = make_key_pair()
+    with StandInServer() as server:
+        per_request = run_requests_get(server.host, count)
+        keep_alive_off = run(server.host, public_key_path, keep_alive=False, count=count)
+        pooled = run(server.host, public_key_path, keep_alive=True, count=count)
+    print(f"requests: {count}")
+    print(f"requests.get:   {per_request:10.1f} req/s")
+    print(f"keep-alive off: {keep_alive_off:10.1f} req/s")
+    print(f"pooled:         {pooled:10.1f} req/s ({pooled / per_request:.2f}x requests.get)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    stand_in
+
+:Synopsis:
+    Local stand-in IAM server and key material for benchmarks
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import tempfile
+import threading
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers every request with a small JSON body over HTTP/1.1 keep-alive"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Buffer headers and body into a single write
+    body = b'{"STAND_IN": "OK"}'
+    delay = 0.0  # Simulated service latency in seconds
+
+    def _reply(self):
+        if self.delay:
+            time.sleep(self.delay)
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        if self.headers.get("Connection", "").lower() == "close":
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # Accept bursts of concurrent connections without SYN retries
+
+
+class StandInServer:
+    """Context manager running the stand-in server on a background thread"""
+
+    def __init__(self, handler=StandInHandler):
+        self.server = _Server(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_key_pair() -> tuple[str, str]:
+    """Write an ES256 key pair to a temporary directory and return (public, private) paths"""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    directory = Path(tempfile.mkdtemp(prefix="iam_lib_bench_"))
+    private_path = directory / "private.pem"
+    public_path = directory / "public.pem"
+    private_path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    public_path.write_bytes(
+        private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return public_path.as_posix(), private_path.as_posix()
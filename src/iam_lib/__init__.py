@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    __init__.py
+
+:Synopsis:
+    IAM client library. The public classes are exported here and imported on first use, so that importing iam_lib
+    loads no module, nor any dependency, that the program does not use.
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import importlib
+from typing import Callable
+
+
+def _lazy_exports(package: str, exports: dict[str, str]) -> tuple[list, Callable, Callable]:
+    # Module __all__, __getattr__, and __dir__ exporting each name of exports from its module on first access
+    package_globals = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        package_globals[name] = value  # Later lookups do not reach __getattr__
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(package_globals) | set(exports))
+
+    return sorted(exports), __getattr__, __dir__
+
+
+__all__, __getattr__, __dir__ = _lazy_exports(
+    __name__,
+    {
+        "AccessClient": "iam_lib.api.access",
+        "ApiKeyClient": "iam_lib.api.api_key",
+        "AuthorizedClient": "iam_lib.api.authorized",
+        "EdiTokenClient": "iam_lib.api.edi_token",
+        "EMLClient": "iam_lib.api.eml",
+        "GroupClient": "iam_lib.api.group",
+        "ProfileClient": "iam_lib.api.profile",
+        "ResourceClient": "iam_lib.api.resource",
+        "RuleClient": "iam_lib.api.rule",
+        "IAMContext": "iam_lib.context",
+        "DecisionCache": "iam_lib.cache",
+        "KeyTokenCache": "iam_lib.cache",
+        "ResponseCache": "iam_lib.cache",
+        "RequestCoalescer": "iam_lib.coalescing",
+        "Permission": "iam_lib.models.permission",
+        "PolicyEngine": "iam_lib.policy",
+        "ResourceTree": "iam_lib.models.resource_tree",
+        "Token": "iam_lib.token",
+        "TokenManager": "iam_lib.token_manager",
+    },
+)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    __init__.py
+
+:Synopsis:
+    IAM REST API asyncio clients, imported on first use (requires the "aio" extra)
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from iam_lib import _lazy_exports
+
+__all__, __getattr__, __dir__ = _lazy_exports(
+    __name__,
+    {
+        "AsyncClient": "iam_lib.aio.client",
+        "create_session": "iam_lib.aio.client",
+        "AsyncIAMContext": "iam_lib.aio.context",
+        "AsyncAccessClient": "iam_lib.aio.access",
+        "AsyncApiKeyClient": "iam_lib.aio.api_key",
+        "AsyncAuthorizedClient": "iam_lib.aio.authorized",
+        "AsyncEdiTokenClient": "iam_lib.aio.edi_token",
+        "AsyncEMLClient": "iam_lib.aio.eml",
+        "AsyncGroupClient": "iam_lib.aio.group",
+        "AsyncProfileClient": "iam_lib.aio.profile",
+        "AsyncResourceClient": "iam_lib.aio.resource",
+        "AsyncRuleClient": "iam_lib.aio.rule",
+    },
+)
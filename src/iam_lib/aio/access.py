@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    access
+
+:Synopsis:
+    IAM REST API asyncio access element client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.access import AccessClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncAccessClient(AsyncClient, AccessClient):
+    """IAM Access asyncio client class. Methods are those of AccessClient, returned as coroutines."""
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    api_key
+
+:Synopsis:
+    IAM REST API asyncio api_key client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.api_key import ApiKeyClient
+from iam_lib.cache import KeyTokenCache
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncApiKeyClient(AsyncClient, ApiKeyClient):
+    """IAM ApiKey asyncio client class. Methods are those of ApiKeyClient, returned as coroutines."""
+
+    async def key_to_token(self, key: str) -> str | dict:
+        """See ApiKeyClient.key_to_token. Concurrent tasks of the event loop share one request per key."""
+        route = f"auth/v1/key"
+        form_params = {
+            "key": key,
+        }
+        if self._token_cache is None:
+            return await self._call("post", route, form_params)
+        digest = KeyTokenCache.digest(f"{self.scheme}://{self.host}", key)
+        return await self._token_cache.aget(digest, lambda: self._call("post", route, form_params))
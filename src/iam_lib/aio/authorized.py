@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    authorized
+
+:Synopsis:
+    IAM REST API asyncio authorization client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import asyncio
+from functools import partial
+from typing import Iterable
+
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.authorized import AuthorizedClient, MAX_WORKERS, PERMISSION_HIERARCHY, _highest_permission
+from iam_lib.models.permission import Permission
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncAuthorizedClient(AsyncClient, AuthorizedClient):
+    """IAM Authorized asyncio client class. Methods are those of AuthorizedClient, returned as coroutines."""
+
+    async def is_authorized(self, resource_key: str, permission: str) -> bool:
+        """See AuthorizedClient.is_authorized. Stale cached decisions are refreshed as event loop tasks."""
+        return await self._decide(resource_key, permission)
+
+    async def is_authorized_many(
+        self,
+        resource_keys: Iterable[str],
+        permission: str,
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[str, bool]:
+        """See AuthorizedClient.is_authorized_many. Resources are tested as concurrent tasks, at most max_workers at
+        a time."""
+        decisions = await self.is_authorized_pairs(((key, permission) for key in resource_keys), max_workers)
+        return {resource_key: decision for (resource_key, _), decision in decisions.items()}
+
+    async def is_authorized_pairs(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[tuple[str, str], bool]:
+        """See AuthorizedClient.is_authorized_pairs. Pairs are tested as concurrent tasks, at most max_workers at a
+        time."""
+        pairs = list(dict.fromkeys(pairs))
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def decide(pair: tuple[str, str]) -> bool:
+            async with semaphore:
+                return await self._decide(*pair, record=False)
+
+        return dict(zip(pairs, await asyncio.gather(*(decide(pair) for pair in pairs))))
+
+    async def effective_permission(self, resource_key: str) -> Permission:
+        """See AuthorizedClient.effective_permission. Undecided tests are cancelled once the result is settled."""
+        probes = {
+            asyncio.ensure_future(self._decide(resource_key, name, False)): permission
+            for permission, name in PERMISSION_HIERARCHY
+        }
+        decisions = {}
+        pending = set(probes)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for probe in done:
+                    decisions[probes[probe]] = probe.result()
+                permission = _highest_permission(decisions)
+                if permission is not None:
+                    return permission
+        finally:
+            for probe in pending:
+                probe.cancel()
+
+    async def effective_permissions(
+        self,
+        resource_keys: Iterable[str],
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[str, Permission]:
+        """See AuthorizedClient.effective_permissions. Tests run as concurrent tasks, at most max_workers at a time."""
+        resource_keys = list(dict.fromkeys(resource_keys))
+        pairs = [(key, name) for key in resource_keys for _, name in PERMISSION_HIERARCHY]
+        decisions = await self.is_authorized_pairs(pairs, max_workers)
+        return {
+            key: _highest_permission(
+                {permission: decisions[(key, name)] for permission, name in PERMISSION_HIERARCHY}
+            )
+            for key in resource_keys
+        }
+
+    async def _decide(self, resource_key: str, permission: str, record: bool = True) -> bool:
+        if self._decision_cache is None:
+            return await self._is_authorized(resource_key, permission, record)
+        return await self._decision_cache.adecide(
+            self._decision_key(resource_key, permission),
+            partial(self._is_authorized, resource_key, permission, record=record),
+            partial(self._is_authorized, resource_key, permission, record=False),
+        )
@@ -0,0 +1,295 @@
+"""
+:Mod: client
+
+:Synopsis:
+    IAM REST API asyncio HTTP request client
+
+:Author:
+    Mark Servilla
+
+:Created:
+    2026-10-18
+
+"""
+from functools import wraps
+import ssl
+from typing import AsyncIterator, Callable
+
+import daiquiri
+import httpx
+
+from iam_lib.api.client import (
+    Client,
+    JSON_CONTENT,
+    STREAM_CHUNK_SIZE,
+    _response,
+    _retry_error,
+    _share,
+    _validate_parameters,
+)
+import iam_lib.exceptions
+from iam_lib.models.codec import get_codec
+import iam_lib.models.response_model as response_model
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+def retry_connection(func):
+    """Retry a request coroutine of a client after an IAMRequestError or a transient error status, as its retry
+    policy allows (see Client.retry_policy); each attempt passes the circuit breaker of the service (see
+    Client.circuit_breakers)"""
+    @wraps(func)
+    async def wrapper(self, verb, route, *args, **kwargs):
+        policy = self._retry_policy
+        if policy is None:
+            with self._guard():
+                return await func(self, verb, route, *args, **kwargs)
+        started = policy.clock()
+        failures = 0
+        while True:
+            wait = policy.wait(f"{self.scheme}://{self.host}", policy.clock() - started)
+            if wait:
+                await policy.asleep(wait)
+            try:
+                with self._guard():
+                    return await func(self, verb, route, *args, **kwargs)
+            except iam_lib.exceptions.IAMCircuitOpenError:
+                raise
+            except (iam_lib.exceptions.IAMRequestError, iam_lib.exceptions.IAMResponseError) as e:
+                error = e
+            failures += 1
+            delay = self._retry_delay(policy, verb, error, failures, policy.clock() - started)
+            if delay is None:
+                raise _retry_error(verb, route, failures, error)
+            logger.warning(f"{verb.upper()} {route} failed: {error}. Retrying in {delay:.2f} seconds...")
+            await policy.asleep(delay)
+    return wrapper
+
+
+class AsyncClient(Client):
+    """IAM REST API asyncio client
+
+    Takes the same arguments and performs the same validation as the synchronous client, but sends requests over a
+    pooled, non-blocking httpx.AsyncClient. A shared session must be an httpx.AsyncClient. Requires the "aio" extra.
+
+    The asyncio API clients combine this class with their synchronous counterpart, e.g.
+    AsyncResourceClient(AsyncClient, ResourceClient), so that only the I/O layer differs between the two.
+    """
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        return self._session
+
+    async def close(self):
+        """Close the client HTTP session if it is owned by this client instance"""
+        if self._owns_session:
+            await self._session.aclose()
+
+    def __enter__(self):
+        raise TypeError(f"{type(self).__name__} is an asynchronous context manager; use \"async with\"")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def post(self, route: str, form_params: dict = None) -> httpx.Response:
+        """Send a POST request to the IAM REST API
+
+        Args:
+            route (str): IAM route
+            form_params (dict): IAM POST form parameters
+
+        Returns:
+            response (httpx.Response): httpx response object
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+         """
+        return await self._request("post", route, form_params)
+
+    async def put(self, route: str, form_params: dict = None) -> httpx.Response:
+        """Send a PUT request to the IAM REST API
+
+        Args:
+            route (str): IAM route
+            form_params (dict): IAM POST form parameters
+
+        Returns:
+            response (httpx.Response): httpx response object
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+         """
+        return await self._request("put", route, form_params)
+
+    async def get(self, route: str, query_params: dict = None) -> httpx.Response:
+        """Send a GET request to the IAM REST API
+
+        Args:
+            query_params (dict): IAM GET query parameters (optional)
+            route (str): IAM route
+
+        Returns:
+            response (httpx.Response): httpx response object
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+         """
+        return await self._call("get", route, query_params, result=_response)
+
+    async def delete(self, route: str) -> httpx.Response:
+        """Send a DELETE request to the IAM REST API
+
+        Args:
+            route (str): IAM route
+
+        Returns:
+            response (httpx.Response): httpx response object
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+         """
+        return await self._request("delete", route)
+
+    async def _call(
+            self,
+            verb: str,
+            route: str,
+            params: dict = None,
+            result: Callable = None,
+            on_response_error: Callable = None,
+            record: bool = True,
+    ):
+        coalesce_key = self._coalesce_key(verb, route, params, result, on_response_error)
+        if coalesce_key is None:
+            try:
+                response = await self._request(verb, route, params, record)
+            except iam_lib.exceptions.IAMResponseError as e:
+                if on_response_error is None:
+                    raise
+                return on_response_error(e)
+            return self._result(response, result)
+        try:
+            response, value = await self._coalescer.arun(
+                coalesce_key, lambda: self._fetch(verb, route, params, result, on_response_error), _share
+            )
+        except iam_lib.exceptions.IAMResponseError as e:
+            if record:
+                self._record(e.response)
+            raise
+        if record:
+            self._record(response)
+        return value
+
+    async def _fetch(self, verb: str, route: str, params: dict, result: Callable, on_response_error: Callable) -> tuple:
+        try:
+            response = await self._request(verb, route, params, record=False)
+        except iam_lib.exceptions.IAMResponseError as e:
+            if on_response_error is None:
+                raise
+            return e.response, on_response_error(e)
+        return response, self._result(response, result)
+
+    async def _iter_items(self, route: str, params: dict = None, model: type = None) -> AsyncIterator:
+        response = await self._request("get", route, params, record=False, stream=True)
+        try:
+            async for item in response_model.aiter_items(self._accept, response.aiter_bytes(STREAM_CHUNK_SIZE)):
+                yield item if model is None else model(item).compact()
+        finally:
+            await response.aclose()
+
+    @retry_connection
+    async def _request(
+            self,
+            verb: str,
+            route: str,
+            params: dict = None,
+            record: bool = True,
+            stream: bool = False,
+    ) -> httpx.Response:
+        if params is None: params = {}
+        if verb in ("post", "put"):
+            _validate_parameters(params, self._public_key_path, self._algorithm)
+            response = await self._send(verb, route, record, content=get_codec().dumps(params), headers=JSON_CONTENT)
+        elif verb == "get":
+            # Like requests, omit parameters whose value is None
+            params = {key: value for key, value in params.items() if value is not None}
+            return await self._send(verb, route, record, stream, params=params)
+        else:
+            response = await self._send(verb, route, record)
+        self._invalidate_cache(verb, route, params)
+        return response
+
+    def _create_session(self, pool_size: int, keep_alive: bool) -> httpx.AsyncClient:
+        return create_session(self._truststore, self._timeout, pool_size, keep_alive)
+
+    @staticmethod
+    def _connected(error: iam_lib.exceptions.IAMRequestError) -> bool:
+        return not isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    async def _send(
+            self,
+            verb: str,
+            route: str,
+            record: bool = True,
+            stream: bool = False,
+            **kwargs,
+    ) -> httpx.Response:
+        if self._token_manager is not None:
+            self._token_manager.ensure_fresh()
+        url = self.scheme + "://" + self.host + "/" + route
+        headers = {"Accept-Type": f"{self._accept}", **kwargs.pop("headers", {})}
+        if self._cookies is not None:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self._cookies.items())
+        cache_key, cached = self._cache_lookup(verb, route, kwargs.get("params"), stream)
+        if cached is not None:
+            headers.update(cached.validators())
+        try:
+            request = self._session.build_request(verb.upper(), url, headers=headers, **kwargs)
+            response = await self._session.send(request, stream=stream)
+            if stream and response.status_code != 200:
+                await response.aread()  # The error reports the body
+        except httpx.HTTPError as e:
+            raise iam_lib.exceptions.IAMRequestError(e) from e
+        if cache_key is not None:
+            response = self._response_cache.update(cache_key, response, cached)
+        if record:
+            self._record(response)
+        if response.status_code != 200:
+            raise iam_lib.exceptions.IAMResponseError(response)
+        return response
+
+
+def create_session(
+        truststore: str | bool = True,
+        timeout: int = 10,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+) -> httpx.AsyncClient:
+    """Create a pooled asyncio HTTP session suitable for sharing between IAM asyncio clients
+
+    Args:
+        truststore (str | bool): path to truststore, or True to verify certificates with the default CA bundle
+        timeout (int): request timeout to IAM service (defaults to 10 seconds)
+        pool_size (int): maximum number of connections kept open (defaults to 10)
+        keep_alive (bool): reuse connections between requests (defaults to True)
+
+    Returns:
+        session (httpx.AsyncClient): httpx asyncio client object
+    """
+    if isinstance(truststore, bool):
+        verify = truststore
+    else:
+        verify = ssl.create_default_context(cafile=truststore)
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size if keep_alive else 0)
+    return httpx.AsyncClient(verify=verify, timeout=timeout, limits=limits)
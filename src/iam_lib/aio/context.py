@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    context
+
+:Synopsis:
+    Shared IAM configuration, asyncio connection pool, and caches handing out lightweight asyncio API clients
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+import httpx
+
+from iam_lib.aio.client import create_session
+from iam_lib.context import ClientClass, IAMContext
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncIAMContext(IAMContext):
+    """IAMContext handing out asyncio API clients over a pooled httpx.AsyncClient. A shared session must be an
+    httpx.AsyncClient. Requires the "aio" extra."""
+
+    access_class = ClientClass("iam_lib.aio.access", "AsyncAccessClient")
+    api_key_class = ClientClass("iam_lib.aio.api_key", "AsyncApiKeyClient")
+    authorized_class = ClientClass("iam_lib.aio.authorized", "AsyncAuthorizedClient")
+    edi_token_class = ClientClass("iam_lib.aio.edi_token", "AsyncEdiTokenClient")
+    eml_class = ClientClass("iam_lib.aio.eml", "AsyncEMLClient")
+    group_class = ClientClass("iam_lib.aio.group", "AsyncGroupClient")
+    profile_class = ClientClass("iam_lib.aio.profile", "AsyncProfileClient")
+    resource_class = ClientClass("iam_lib.aio.resource", "AsyncResourceClient")
+    rule_class = ClientClass("iam_lib.aio.rule", "AsyncRuleClient")
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session if it is owned by this context"""
+        if self._owns_session:
+            await self._session.aclose()
+
+    def __enter__(self):
+        raise TypeError(f"{type(self).__name__} is an asynchronous context manager; use \"async with\"")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _create_session(self, pool_size: int, keep_alive: bool) -> httpx.AsyncClient:
+        return create_session(self._truststore, self._timeout, pool_size, keep_alive)
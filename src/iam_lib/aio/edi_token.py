@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    edi_token
+
+:Synopsis:
+    IAM REST API asyncio edi_token client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.edi_token import EdiTokenClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncEdiTokenClient(AsyncClient, EdiTokenClient):
+    """IAM EdiToken asyncio client class. Methods are those of EdiTokenClient, returned as coroutines."""
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    eml
+
+:Synopsis:
+    IAM REST API asyncio eml client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.eml import EMLClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncEMLClient(AsyncClient, EMLClient):
+    """IAM EML asyncio client class. Methods are those of EMLClient, returned as coroutines."""
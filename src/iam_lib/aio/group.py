@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    group
+
+:Synopsis:
+    IAM REST API asyncio group client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.group import GroupClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncGroupClient(AsyncClient, GroupClient):
+    """IAM Group asyncio client class. Methods are those of GroupClient, returned as coroutines."""
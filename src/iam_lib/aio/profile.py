@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    profile
+
+:Synopsis:
+    IAM REST API asyncio profile client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.profile import ProfileClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncProfileClient(AsyncClient, ProfileClient):
+    """IAM Profile asyncio client class. Methods are those of ProfileClient, returned as coroutines."""
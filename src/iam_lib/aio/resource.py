@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    resource
+
+:Synopsis:
+    IAM REST API asyncio resource client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.resource import ResourceClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncResourceClient(AsyncClient, ResourceClient):
+    """IAM Resource asyncio client class. Methods are those of ResourceClient, returned as coroutines."""
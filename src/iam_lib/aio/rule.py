@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    rule
+
+:Synopsis:
+    IAM REST API asyncio rule client
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import daiquiri
+
+from iam_lib.aio.client import AsyncClient
+from iam_lib.api.rule import RuleClient
+
+logger = daiquiri.getLogger(__name__)
+
+
+class AsyncRuleClient(AsyncClient, RuleClient):
+    """IAM Rule asyncio client class. Methods are those of RuleClient, returned as coroutines."""
@@ -6,6 +6,7 @@
     __init__.py
 
 :Synopsis:
+    IAM REST API clients, imported on first use
 
 :Author:
     servilla
@@ -13,3 +14,21 @@
 :Created:
     5/12/25
 """
+from iam_lib import _lazy_exports
+
+__all__, __getattr__, __dir__ = _lazy_exports(
+    __name__,
+    {
+        "Client": "iam_lib.api.client",
+        "create_session": "iam_lib.api.client",
+        "AccessClient": "iam_lib.api.access",
+        "ApiKeyClient": "iam_lib.api.api_key",
+        "AuthorizedClient": "iam_lib.api.authorized",
+        "EdiTokenClient": "iam_lib.api.edi_token",
+        "EMLClient": "iam_lib.api.eml",
+        "GroupClient": "iam_lib.api.group",
+        "ProfileClient": "iam_lib.api.profile",
+        "ResourceClient": "iam_lib.api.resource",
+        "RuleClient": "iam_lib.api.rule",
+    },
+)
@@ -14,10 +14,16 @@
 :Created:
     6/1/25
 """
+from typing import TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
-import iam_lib.models.response_model as response_model
+from iam_lib.cache import key_tokens, KeyTokenCache, ResponseCache
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -35,14 +41,60 @@ class ApiKeyClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
+        token_cache: KeyTokenCache | None = key_tokens,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
+        self._token_cache = token_cache
+
+    @classmethod
+    def _from_context(cls, context, thread_safe: bool = None):
+        client = super()._from_context(context, thread_safe)
+        client._token_cache = context.token_cache
+        return client
+
+    @property
+    def token_cache(self) -> KeyTokenCache | None:
+        """Cache of the tokens issued by key_to_token (defaults to the process-wide cache; None disables caching)"""
+        return self._token_cache
+
+    @token_cache.setter
+    def token_cache(self, token_cache: KeyTokenCache | None):
+        self._token_cache = token_cache
+
+    @classmethod
+    def _from_context(cls, context, thread_safe: bool = None):
+        client = super()._from_context(context, thread_safe)
+        client._token_cache = context.token_cache
+        return client
 
     def key_to_token(
         self,
         key: str
     ) -> str | dict:
         """API key to token. Returns an EDI IAM JWT base64 digitally signed token.
+
+        The token issued for a key is cached and returned until close to its expiry, and concurrent calls for the same
+        key share one request (see KeyTokenCache). A cached token does not replace the client's last response.
+
         Args:
             key (str): authentication key
 
@@ -58,5 +110,7 @@ class ApiKeyClient(Client):
         form_params = {
             "key": key,
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        if self._token_cache is None:
+            return self._call("post", route, form_params)
+        digest = KeyTokenCache.digest(f"{self.scheme}://{self.host}", key)
+        return self._token_cache.get(digest, lambda: self._call("post", route, form_params))
@@ -14,14 +14,33 @@
 :Created:
     5/13/25
 """
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, TYPE_CHECKING
 
 import daiquiri
 
 from iam_lib.api.client import Client
+from iam_lib.cache import DecisionCache, ResponseCache
 from iam_lib.exceptions import IAMResponseError
+from iam_lib.models.permission import Permission
+from iam_lib.token import Token
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
+MAX_WORKERS = 10  # Matches the default connection pool size of a client session
+
+# Permission levels from lowest to highest; each level implies the levels below it
+PERMISSION_HIERARCHY = (
+    (Permission.READ, "read"),
+    (Permission.WRITE, "write"),
+    (Permission.CHANGE_PERMISSION, "changePermission"),
+)
+
 
 class AuthorizedClient(Client):
     """IAM Authorized client class"""
@@ -36,8 +55,64 @@ class AuthorizedClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        decision_cache: DecisionCache = None,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
+        self._decision_cache = decision_cache
+        self._decision_identity = (None, (None, ()))  # Token and the (subject, principals) decoded from it
+
+    @classmethod
+    def _from_context(cls, context, thread_safe: bool = None):
+        client = super()._from_context(context, thread_safe)
+        client._decision_cache = context.decision_cache
+        client._decision_identity = (None, (None, ()))
+        return client
+
+    @property
+    def decision_cache(self) -> DecisionCache | None:
+        return self._decision_cache
+
+    @decision_cache.setter
+    def decision_cache(self, decision_cache: DecisionCache | None):
+        self._decision_cache = decision_cache
+
+    def invalidate_decisions(self, resource_key: str = None) -> int:
+        """Remove cached authorization decisions
+
+        Use after changing the access rules of a resource, since the decision cache cannot observe such changes.
+
+        Args:
+            resource_key (str): resource key whose decisions (for all subjects) are removed (defaults to all
+                decisions of this client's token subject)
+
+        Returns:
+            int: number of decisions removed
+        """
+        if self._decision_cache is None:
+            return 0
+        if resource_key is not None:
+            return self._decision_cache.invalidate(resource_key=resource_key)
+        subject, _ = self._decision_subject()
+        return self._decision_cache.invalidate(subject=subject)
 
     def is_authorized(
         self,
@@ -57,14 +132,180 @@ class AuthorizedClient(Client):
         Raises:
             iam_lib.exceptions.IAMRequestError: On HTTP request error
         """
+        return self._decide(resource_key, permission)
+
+    def is_authorized_many(
+        self,
+        resource_keys: Iterable[str],
+        permission: str,
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[str, bool]:
+        """Test if principal(s) as identified in the authentication token are authorized to access each resource at the
+        given permission
+
+        Duplicate resource keys are tested once. Resources are tested concurrently by a bounded pool of worker threads,
+        so the call takes about as long as the slowest single test. Does not update the client response.
+
+        Args:
+            resource_keys (Iterable[str]): unique identifiers for the resources
+            permission (str): IAM permission (read, write, or changePermission)
+            max_workers (int): maximum number of concurrent requests (defaults to 10)
+
+        Returns:
+            dict: resource key to Boolean, True if at least one principal is authorized to access the resource
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+        """
+        decisions = self.is_authorized_pairs(((key, permission) for key in resource_keys), max_workers)
+        return {resource_key: decision for (resource_key, _), decision in decisions.items()}
+
+    def is_authorized_pairs(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[tuple[str, str], bool]:
+        """Test if principal(s) as identified in the authentication token are authorized to access each resource at
+        its paired permission
+
+        Duplicate pairs are tested once. Pairs are tested concurrently by a bounded pool of worker threads. Does not
+        update the client response.
+
+        Args:
+            pairs (Iterable[tuple[str, str]]): (resource_key, permission) pairs
+            max_workers (int): maximum number of concurrent requests (defaults to 10)
+
+        Returns:
+            dict: (resource_key, permission) pair to Boolean, True if at least one principal is authorized
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if len(pairs) <= 1 or max_workers <= 1:
+            return {pair: self._decide(*pair, record=False) for pair in pairs}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            decisions = executor.map(lambda pair: self._decide(*pair, record=False), pairs)
+            return dict(zip(pairs, decisions))
+
+    def effective_permission(self, resource_key: str) -> Permission:
+        """Return the highest permission that principal(s) as identified in the authentication token hold on the
+        resource
+
+        The read, write, and changePermission tests run concurrently. Because changePermission implies write and
+        write implies read, the result is returned as soon as it is decided (e.g., on a granted changePermission or a
+        denied read) without waiting for the remaining tests.
+
+        Args:
+            resource_key (str): unique identifier for the resource
+
+        Returns:
+            Permission: READ, WRITE, CHANGE_PERMISSION, or NONE
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+        """
+        executor = ThreadPoolExecutor(max_workers=len(PERMISSION_HIERARCHY))
+        try:
+            probes = {
+                executor.submit(self._decide, resource_key, name, False): permission
+                for permission, name in PERMISSION_HIERARCHY
+            }
+            decisions = {}
+            for probe in as_completed(probes):
+                decisions[probes[probe]] = probe.result()
+                permission = _highest_permission(decisions)
+                if permission is not None:
+                    return permission
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def effective_permissions(
+        self,
+        resource_keys: Iterable[str],
+        max_workers: int = MAX_WORKERS,
+    ) -> dict[str, Permission]:
+        """Return the highest permission that principal(s) as identified in the authentication token hold on each
+        resource
+
+        All tests of all resources run concurrently on a bounded pool of worker threads (see is_authorized_pairs).
+
+        Args:
+            resource_keys (Iterable[str]): unique identifiers for the resources
+            max_workers (int): maximum number of concurrent requests (defaults to 10)
+
+        Returns:
+            dict: resource key to Permission (READ, WRITE, CHANGE_PERMISSION, or NONE)
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+        """
+        resource_keys = list(dict.fromkeys(resource_keys))
+        pairs = [(key, name) for key in resource_keys for _, name in PERMISSION_HIERARCHY]
+        decisions = self.is_authorized_pairs(pairs, max_workers)
+        return {
+            key: _highest_permission(
+                {permission: decisions[(key, name)] for permission, name in PERMISSION_HIERARCHY}
+            )
+            for key in resource_keys
+        }
+
+    def _decide(self, resource_key: str, permission: str, record: bool = True) -> bool:
+        if self._decision_cache is None:
+            return self._is_authorized(resource_key, permission, record)
+        return self._decision_cache.decide(
+            self._decision_key(resource_key, permission),
+            partial(self._is_authorized, resource_key, permission, record=record),
+            partial(self._is_authorized, resource_key, permission, record=False),
+        )
+
+    def _is_authorized(self, resource_key: str, permission: str, record: bool = True):
+        # Background refreshes and bulk tests pass record=False so that concurrent requests do not replace the
+        # response of the caller's last request
         query_params = {
             "resource_key": resource_key,
             "permission": permission,
         }
         route = f"auth/v1/authorized"
-        try:
-            self.get(route=route, query_params=query_params)
-            return True
-        except IAMResponseError as e:
-            logger.error(e)
-            return False
+        return self._call(
+            "get", route, query_params, result=_authorized, on_response_error=_not_authorized, record=record
+        )
+
+    def _decision_key(self, resource_key: str, permission: str) -> tuple:
+        subject, principals = self._decision_subject()
+        return subject, principals, resource_key, permission
+
+    def _decision_subject(self) -> tuple:
+        # Decode the token once per token value rather than on every decision. The token and its identity are
+        # replaced in one assignment, so that concurrent threads never pair a token with another token's identity
+        token = self._token
+        decoded_token, identity = self._decision_identity
+        if token is not None and token != decoded_token:
+            decoded = Token(token)
+            identity = (decoded.subject, tuple(sorted(decoded.principals or ())))
+            self._decision_identity = (token, identity)
+        return identity
+
+
+def _authorized(response) -> bool:
+    return True
+
+
+def _not_authorized(error: IAMResponseError) -> bool:
+    logger.error(error)
+    return False
+
+
+def _highest_permission(decisions: dict[Permission, bool]) -> Permission | None:
+    # Return the highest granted permission, or None while the tests decided so far do not settle it
+    denied = False
+    known = {}
+    for permission, _ in PERMISSION_HIERARCHY:
+        denied = denied or decisions.get(permission) is False  # A denied level denies all levels above it
+        known[permission] = False if denied else decisions.get(permission)
+    for permission, _ in reversed(PERMISSION_HIERARCHY):
+        if known[permission] is None:
+            return None
+        if known[permission]:
+            return permission
+    return Permission.NONE
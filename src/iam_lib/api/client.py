@@ -11,36 +11,67 @@
     2025-05-05
 
 """
+import contextlib
+import copy
+import hashlib
 from pathlib import Path
+import threading
 import time
 from functools import wraps
+from typing import Callable, Iterator, TYPE_CHECKING
 
 import daiquiri
-import requests
-import jwt
 
+from iam_lib.breaker import circuit_breakers, CircuitBreakers
+from iam_lib.cache import ResponseCache
+from iam_lib.coalescing import coalescer, RequestCoalescer
 import iam_lib.exceptions
+from iam_lib.models.codec import get_codec
+import iam_lib.models.response_model as response_model
 import iam_lib.token
 from iam_lib.models.permission import Permission, PERMISSION_MAP
+from iam_lib.retry import parse_retry_after, retry_policy, RetryPolicy
 
+if TYPE_CHECKING:
+    import requests
 
-logger = daiquiri.getLogger(__name__)
 
+logger = daiquiri.getLogger(__name__)
 
-def retry_connection(retries=3, delay=5):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for i in range(retries):
-                try:
-                    return func(*args, **kwargs)
-                except iam_lib.exceptions.IAMRequestError as e:
-                    logger.warning(f"Connection failed: {e}. Retrying in {delay} seconds...")
-                    time.sleep(delay)
-            logger.error("Connection failed after multiple retries")
-            raise iam_lib.exceptions.IAMRequestError("Connection failed after multiple retries")
-        return wrapper
-    return decorator
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read at a time from streamed responses
+JSON_CONTENT = {"Content-Type": "application/json"}  # Request body encoded by the JSON codec
+
+
+def retry_connection(func):
+    """Retry a request method of a client after an IAMRequestError or a transient error status, as its retry policy
+    allows (see Client.retry_policy); each attempt passes the circuit breaker of the service (see
+    Client.circuit_breakers)"""
+    @wraps(func)
+    def wrapper(self, verb, route, *args, **kwargs):
+        policy = self._retry_policy
+        if policy is None:
+            with self._guard():
+                return func(self, verb, route, *args, **kwargs)
+        started = policy.clock()
+        failures = 0
+        while True:
+            wait = policy.wait(f"{self.scheme}://{self.host}", policy.clock() - started)
+            if wait:
+                policy.sleep(wait)
+            try:
+                with self._guard():
+                    return func(self, verb, route, *args, **kwargs)
+            except iam_lib.exceptions.IAMCircuitOpenError:
+                raise
+            except (iam_lib.exceptions.IAMRequestError, iam_lib.exceptions.IAMResponseError) as e:
+                error = e
+            failures += 1
+            delay = self._retry_delay(policy, verb, error, failures, policy.clock() - started)
+            if delay is None:
+                raise _retry_error(verb, route, failures, error)
+            logger.warning(f"{verb.upper()} {route} failed: {error}. Retrying in {delay:.2f} seconds...")
+            policy.sleep(delay)
+    return wrapper
 
 
 class Client:
@@ -56,6 +87,11 @@ class Client:
             token: str,
             truststore: str = None,
             timeout: int = 10,
+            session: "requests.Session" = None,
+            pool_size: int = 10,
+            keep_alive: bool = True,
+            response_cache: ResponseCache = None,
+            thread_safe: bool = False,
     ):
         """Initialize client instance
 
@@ -68,6 +104,12 @@ class Client:
             token (str): IAM EDI authentication token
             truststore (str): path to truststore (defaults to None)
             timeout (int): request timeout to IAM service (defaults to 10 seconds)
+            session (requests.Session): shared HTTP session (defaults to a new session owned by the client)
+            pool_size (int): connection pool size of an owned session (defaults to 10)
+            keep_alive (bool): reuse connections of an owned session (defaults to True)
+            response_cache (ResponseCache): cache of GET responses revalidated with conditional requests (optional)
+            thread_safe (bool): keep the last response per thread, so that one client instance can serve concurrent
+                threads (defaults to False)
 
         Raises:
             iam_lib.exceptions.IAMInvalidScheme
@@ -87,6 +129,47 @@ class Client:
         self._timeout = timeout
         self._cookies = None if self._token is None else {"edi-token": token}
         self._response = None
+        self._thread_safe = thread_safe
+        self._local = threading.local()  # Last response of each thread in thread-safe mode
+        self._owns_session = session is None
+        self._session = self._create_session(pool_size, keep_alive) if session is None else session
+        self._response_cache = response_cache
+        self._token_digest = (None, None)
+        self._token_manager = None  # Set by TokenManager.attach
+        self._coalescer = coalescer
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+
+    @classmethod
+    def _from_context(cls, context, thread_safe: bool = None):
+        """Create a client of the configuration, session, and caches of an IAMContext without validating them again
+
+        Args:
+            context (IAMContext): shared, validated configuration
+            thread_safe (bool): see __init__ (defaults to the context's)
+        """
+        client = cls.__new__(cls)
+        client._scheme = context.scheme
+        client._host = context.host
+        client._accept = context.accept
+        client._public_key_path = context.public_key_path
+        client._algorithm = context.algorithm
+        client._token = context.token
+        client._truststore = context.truststore
+        client._timeout = context.timeout
+        client._cookies = context.cookies
+        client._response = None
+        client._thread_safe = context.thread_safe if thread_safe is None else thread_safe
+        client._local = threading.local()
+        client._owns_session = False  # Closed by the context
+        client._session = context.session
+        client._response_cache = context.response_cache
+        client._token_digest = (None, None)
+        client._token_manager = None
+        client._coalescer = context.coalescer
+        client._retry_policy = context.retry_policy
+        client._circuit_breakers = context.circuit_breakers
+        return client
 
     @property
     def scheme(self) -> str:
@@ -135,6 +218,35 @@ class Client:
     @token.setter
     def token(self, token: str):
         self._token = _validate_token(token, self._public_key_path, self._algorithm)
+        self._cookies = None if self._token is None else {"edi-token": self._token}
+
+    def with_token(self, token: str | None) -> "Client":
+        """Return a view of this client that sends its requests with another token
+
+        The view shares the configuration, session, caches, and coalescer of this client, so that a server can send
+        the requests of each of its users over one connection pool: the token is sent as the "edi-token" cookie of the
+        view's requests only. The token is validated through the process-wide verified token cache, so validating a
+        recently seen token costs a hash and a cache lookup. The view keeps its own last response and is not managed
+        by a TokenManager attached to this client.
+
+        Args:
+            token (str): IAM EDI authentication token, or None to send no token
+
+        Returns:
+            A client of the same class
+
+        Raises:
+            iam_lib.exceptions.IAMInvalidToken
+        """
+        view = copy.copy(self)
+        view._token = _validate_token(token, self._public_key_path, self._algorithm)
+        view._cookies = None if token is None else {"edi-token": token}
+        view._response = None
+        view._local = threading.local()
+        view._owns_session = False  # Closed by this client
+        view._token_digest = (None, None)
+        view._token_manager = None
+        return view
 
     @property
     def truststore(self) -> str | bool:
@@ -145,11 +257,73 @@ class Client:
         self._truststore = _validate_truststore(truststore)
 
     @property
-    def response(self) -> requests.Response:
+    def response(self) -> "requests.Response":
+        """Response of the last request, or, in thread-safe mode, of the last request of the calling thread"""
+        if self._thread_safe:
+            return getattr(self._local, "response", None)
         return self._response
 
-    @retry_connection()
-    def post(self, route: str, form_params: dict = None) -> requests.Response:
+    @property
+    def thread_safe(self) -> bool:
+        return self._thread_safe
+
+    @property
+    def session(self) -> "requests.Session":
+        return self._session
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, response_cache: ResponseCache | None):
+        self._response_cache = response_cache
+
+    @property
+    def coalescer(self) -> RequestCoalescer | None:
+        """Coalescer of identical concurrent GET requests (defaults to the process-wide coalescer; None disables
+        coalescing)"""
+        return self._coalescer
+
+    @coalescer.setter
+    def coalescer(self, coalescer: RequestCoalescer | None):
+        self._coalescer = coalescer
+
+    @property
+    def retry_policy(self) -> RetryPolicy | None:
+        """Retry policy of requests failing to connect or answered with a transient error status, e.g., 429 Too Many
+        Requests (defaults to the process-wide policy; None disables retries)"""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, retry_policy: RetryPolicy | None):
+        self._retry_policy = retry_policy
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakers | None:
+        """Circuit breakers failing requests fast, with IAMCircuitOpenError, while the IAM service is down (defaults
+        to the process-wide breakers; None disables them)"""
+        return self._circuit_breakers
+
+    @circuit_breakers.setter
+    def circuit_breakers(self, circuit_breakers: CircuitBreakers | None):
+        self._circuit_breakers = circuit_breakers
+
+    def close(self):
+        """Close the client HTTP session if it is owned by this client instance
+
+        A session passed in by the caller is shared and left open for its owner to close.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def post(self, route: str, form_params: dict = None) -> "requests.Response":
         """Send a POST request to the IAM REST API
 
         Args:
@@ -163,26 +337,9 @@ class Client:
             iam_lib.exceptions.IAMRequestError: On HTTP request error
             iam_lib.exceptions.IAMResponseError: On non-200 response
          """
-        if form_params is None: form_params = {}
-        _validate_parameters(form_params, self._public_key_path, self._algorithm)
-        url = self.scheme + "://" + self.host + "/" + route
-        try:
-            self._response = requests.post(
-                url,
-                json=form_params,
-                cookies=self._cookies,
-                headers={"Accept-Type": f"{self._accept}"},
-                verify=self._truststore,
-                timeout=self._timeout,
-            )
-        except requests.exceptions.RequestException as e:
-            raise iam_lib.exceptions.IAMRequestError(e)
-        if self._response.status_code != 200:
-            raise iam_lib.exceptions.IAMResponseError(self._response)
-        return self._response
+        return self._request("post", route, form_params)
 
-    @retry_connection()
-    def put(self, route: str, form_params: dict = None) -> requests.Response:
+    def put(self, route: str, form_params: dict = None) -> "requests.Response":
         """Send a PUT request to the IAM REST API
 
         Args:
@@ -196,28 +353,13 @@ class Client:
             iam_lib.exceptions.IAMRequestError: On HTTP request error
             iam_lib.exceptions.IAMResponseError: On non-200 response
          """
-        if form_params is None: form_params = {}
-        _validate_parameters(form_params, self._public_key_path, self._algorithm)
-        url = self.scheme + "://" + self.host + "/" + route
-        try:
-            self._response = requests.put(
-                url,
-                json=form_params,
-                cookies=self._cookies,
-                headers={"Accept-Type": f"{self._accept}"},
-                verify=self._truststore,
-                timeout=self._timeout,
-            )
-        except requests.exceptions.RequestException as e:
-            raise iam_lib.exceptions.IAMRequestError(e)
-        if self._response.status_code != 200:
-            raise iam_lib.exceptions.IAMResponseError(self._response)
-        return self._response
+        return self._request("put", route, form_params)
 
-    @retry_connection()
-    def get(self, route: str, query_params: dict = None) -> requests.Response:
+    def get(self, route: str, query_params: dict = None) -> "requests.Response":
         """Send a GET request to the IAM REST API
 
+        Identical concurrent GET requests share one request and its response (see Client.coalescer).
+
         Args:
             query_params (dict): IAM GET query parameters (optional)
             route (str): IAM route
@@ -229,25 +371,9 @@ class Client:
             iam_lib.exceptions.IAMRequestError: On HTTP request error
             iam_lib.exceptions.IAMResponseError: On non-200 response
          """
-        if query_params is None: query_params = {}
-        url = self.scheme + "://" + self.host + "/" + route
-        try:
-            self._response = requests.get(
-                url,
-                params=query_params,
-                cookies=self._cookies,
-                headers={"Accept-Type": f"{self._accept}"},
-                verify=self._truststore,
-                timeout=self._timeout,
-            )
-        except requests.exceptions.RequestException as e:
-            raise iam_lib.exceptions.IAMRequestError(e)
-        if self._response.status_code != 200:
-            raise iam_lib.exceptions.IAMResponseError(self._response)
-        return self._response
+        return self._call("get", route, query_params, result=_response)
 
-    @retry_connection()
-    def delete(self, route: str) -> requests.Response:
+    def delete(self, route: str) -> "requests.Response":
         """Send a DELETE request to the IAM REST API
 
         Args:
@@ -260,39 +386,271 @@ class Client:
             iam_lib.exceptions.IAMRequestError: On HTTP request error
             iam_lib.exceptions.IAMResponseError: On non-200 response
          """
+        return self._request("delete", route)
+
+    def _call(
+            self,
+            verb: str,
+            route: str,
+            params: dict = None,
+            result: Callable = None,
+            on_response_error: Callable = None,
+            record: bool = True,
+    ):
+        """Send a request and convert its response into the data structure of the accept type
+
+        API client methods build their route and parameters and return through this method, so that the same method
+        bodies serve both the synchronous and the asyncio transports.
+
+        Identical concurrent GET requests, by route, parameters, accept type, token, and conversion, share one request
+        and its converted result (see Client.coalescer). Conversions bound to the client instance, which apply the
+        response to client state, are not shared.
+
+        Args:
+            verb (str): HTTP verb (post, put, get, or delete)
+            route (str): IAM route
+            params (dict): form parameters (POST, PUT) or query parameters (GET) (optional)
+            result (Callable): converts the response into the return value (defaults to the response data)
+            on_response_error (Callable): converts an IAMResponseError into the return value instead of raising
+            record (bool): keep the response as the client's last response (defaults to True)
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+        """
+        coalesce_key = self._coalesce_key(verb, route, params, result, on_response_error)
+        if coalesce_key is None:
+            try:
+                response = self._request(verb, route, params, record)
+            except iam_lib.exceptions.IAMResponseError as e:
+                if on_response_error is None:
+                    raise
+                return on_response_error(e)
+            return self._result(response, result)
+        try:
+            response, value = self._coalescer.run(
+                coalesce_key, lambda: self._fetch(verb, route, params, result, on_response_error), _share
+            )
+        except iam_lib.exceptions.IAMResponseError as e:
+            if record:
+                self._record(e.response)
+            raise
+        if record:
+            self._record(response)
+        return value
+
+    def _fetch(self, verb: str, route: str, params: dict, result: Callable, on_response_error: Callable) -> tuple:
+        # The response and return value of a coalesced request; each caller records the response itself
+        try:
+            response = self._request(verb, route, params, record=False)
+        except iam_lib.exceptions.IAMResponseError as e:
+            if on_response_error is None:
+                raise
+            return e.response, on_response_error(e)
+        return response, self._result(response, result)
+
+    def _result(self, response, result: Callable = None):
+        if result is None:
+            if self._response_cache is not None:
+                return self._response_cache.data(response, lambda: response_model.response_data(self, response))
+            return response_model.response_data(self, response)
+        return result(response)
+
+    def _record(self, response):
+        # Keep the response as the client's last response, per thread in thread-safe mode
+        if self._thread_safe:
+            self._local.response = response
+        else:
+            self._response = response
+
+    def _invalidate_cache(self, verb: str, route: str, params: dict):
+        # Write-through: remove the cached responses that a successful write changes
+        if self._response_cache is not None:
+            self._response_cache.invalidate_write(f"{self.scheme}://{self.host}", verb, route, params)
+
+    def _cache_lookup(self, verb: str, route: str, params: dict, stream: bool) -> tuple:
+        # Response cache key and entry of a cacheable (non-streamed GET) request, or (None, None)
+        if self._response_cache is None or verb != "get" or stream:
+            return None, None
+        key = self._request_key(route, params)
+        return key, self._response_cache.lookup(key)
+
+    def _coalesce_key(self, verb: str, route: str, params: dict, result: Callable, on_response_error: Callable):
+        # Coalescing key of a GET request, or None if it is not coalesced
+        if self._coalescer is None or verb != "get":
+            return None
+        if hasattr(result, "__self__") or hasattr(on_response_error, "__self__"):
+            return None  # Bound to this client instance
+        return self._request_key(route, params), result, on_response_error
+
+    def _request_key(self, route: str, params: dict) -> tuple:
+        # Identity of a GET request: origin, route, query (parameters of value None are not sent), accept type, and
+        # token, held as a digest
+        token = None if self._cookies is None else self._cookies.get("edi-token")
+        token_digest = self._token_digest
+        if token_digest[0] != token:
+            token_digest = (token, None if token is None else hashlib.sha256(token.encode("utf-8")).digest())
+            self._token_digest = token_digest
+        query = tuple(sorted((name, value) for name, value in (params or {}).items() if value is not None))
+        return f"{self.scheme}://{self.host}", route, query, self._accept, token_digest[1]
+
+    def _iter_items(self, route: str, params: dict = None, model: type = None) -> Iterator:
+        """Stream the items of a list response one at a time, with memory bounded by the largest item
+
+        The request is sent when iteration starts. The response is not kept as the client's last response. Items are
+        yielded as compact records of the model class (see iam_lib.models.records) if given.
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+            iam_lib.exceptions.IAMXMLDecodeError: On XML decode error
+        """
+        response = self._request("get", route, params, record=False, stream=True)
+        try:
+            items = response_model.iter_items(self._accept, response.iter_content(STREAM_CHUNK_SIZE))
+            yield from items if model is None else model.iter(items, compact=True)
+        finally:
+            response.close()
+
+    @retry_connection
+    def _request(
+            self,
+            verb: str,
+            route: str,
+            params: dict = None,
+            record: bool = True,
+            stream: bool = False,
+    ) -> "requests.Response":
+        if params is None: params = {}
+        if verb in ("post", "put"):
+            _validate_parameters(params, self._public_key_path, self._algorithm)
+            response = self._send(verb, route, record, data=get_codec().dumps(params), headers=JSON_CONTENT)
+        elif verb == "get":
+            return self._send(verb, route, record, params=params, stream=stream)
+        else:
+            response = self._send(verb, route, record)
+        self._invalidate_cache(verb, route, params)
+        return response
+
+    def _create_session(self, pool_size: int, keep_alive: bool) -> "requests.Session":
+        return create_session(pool_size, keep_alive)
+
+    def _guard(self):
+        # Context of one request attempt, recorded by the circuit breaker of the service
+        if self._circuit_breakers is None:
+            return contextlib.nullcontext()
+        return self._circuit_breakers.breaker(f"{self.scheme}://{self.host}").guard()
+
+    def _retry_delay(self, policy: RetryPolicy, verb: str, error: Exception, failures: int, elapsed: float):
+        # Delay before retrying a failed request, or None if it is not retried
+        if isinstance(error, iam_lib.exceptions.IAMResponseError):
+            response = error.response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            origin = f"{self.scheme}://{self.host}"
+            return policy.response_delay(origin, verb, response.status_code, retry_after, failures, elapsed)
+        return policy.delay(verb, failures, elapsed, self._connected(error))
+
+    @staticmethod
+    def _connected(error: iam_lib.exceptions.IAMRequestError) -> bool:
+        # Whether the connection of a failed request may have been established, i.e., the request may have been sent
+        import requests
+        import urllib3.exceptions
+        cause = error.__cause__
+        if isinstance(cause, requests.exceptions.ConnectTimeout):
+            return False
+        if isinstance(cause, requests.exceptions.ConnectionError) and cause.args:
+            # NewConnectionError, e.g., connection refused, is a ConnectTimeoutError
+            return not isinstance(getattr(cause.args[0], "reason", None), urllib3.exceptions.ConnectTimeoutError)
+        return True
+
+    def _send(self, verb: str, route: str, record: bool = True, **kwargs) -> "requests.Response":
+        if self._token_manager is not None:
+            self._token_manager.ensure_fresh()
+        import requests  # Loaded by the first session rather than on import; from then on a sys.modules lookup
         url = self.scheme + "://" + self.host + "/" + route
+        headers = {"Accept-Type": f"{self._accept}", **kwargs.pop("headers", {})}
+        cache_key, cached = self._cache_lookup(verb, route, kwargs.get("params"), kwargs.get("stream", False))
+        if cached is not None:
+            headers.update(cached.validators())
         try:
-            self._response = requests.delete(
+            response = getattr(self._session, verb)(
                 url,
                 cookies=self._cookies,
-                headers={"Accept-Type": f"{self._accept}"},
+                headers=headers,
                 verify=self._truststore,
                 timeout=self._timeout,
+                **kwargs,
             )
         except requests.exceptions.RequestException as e:
-            raise iam_lib.exceptions.IAMRequestError(e)
-        if self._response.status_code != 200:
-            raise iam_lib.exceptions.IAMResponseError(self._response)
-        return self._response
+            raise iam_lib.exceptions.IAMRequestError(e) from e
+        if cache_key is not None:
+            response = self._response_cache.update(cache_key, response, cached)
+        if record:
+            self._record(response)
+        if response.status_code != 200:
+            raise iam_lib.exceptions.IAMResponseError(response)
+        return response
+
+
+def create_session(pool_size: int = 10, keep_alive: bool = True) -> "requests.Session":
+    """Create a pooled HTTP session suitable for sharing between IAM clients
+
+    Args:
+        pool_size (int): maximum number of connections kept open per host pool (defaults to 10)
+        keep_alive (bool): reuse connections between requests (defaults to True)
+
+    Returns:
+        session (requests.Session): requests session object
+    """
+    import http.cookiejar
+    import requests
+    import requests.adapters
+
+    session = requests.Session()
+    # Each client sends its own token cookie per request; cookies set by a response must not leak into requests of
+    # other clients sharing this session
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def _response(response):
+    return response
+
+
+def _retry_error(verb: str, route: str, attempts: int, error: Exception) -> Exception:
+    # The error raised once a request is not retried: the error itself if the request was not retried or was
+    # answered, so that the caller sees the last response
+    if attempts == 1 or isinstance(error, iam_lib.exceptions.IAMResponseError):
+        return error
+    logger.error(f"Connection failed after {attempts} attempts")
+    msg = f"{verb.upper()} {route}: connection failed after {attempts} attempts: {error}"
+    retry_error = iam_lib.exceptions.IAMRetryError(msg, attempts, error)
+    retry_error.__cause__ = error
+    return retry_error
+
+
+def _share(outcome: tuple) -> tuple:
+    # A follower's copy of a coalesced (response, value): parsed data is copied, responses are shared read-only
+    response, value = outcome
+    return response, copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
 
 def _validate_token(token: str, public_key_path: str, algorithm: str) -> str:
     if token is not None:
-        public_key = Path(public_key_path).read_text().encode("utf-8")
-        try:
-            jwt.decode(token, public_key, algorithms=algorithm)
-        except jwt.InvalidTokenError as e:
-            raise iam_lib.exceptions.IAMInvalidToken(f"Invalid token: {e}")
+        iam_lib.token.validate_token(token, public_key_path, algorithm)
     return token
 
 
 def _validate_public_key_path(public_key_path: str) -> str:
-
-    if Path(public_key_path).exists() and Path(public_key_path).is_file():
-        return public_key_path
-    else:
-        msg = f"Public key file '{public_key_path}' does not exist"
-        raise iam_lib.exceptions.IAMInvalidPublicKey(msg)
+    iam_lib.token.public_keys.get(public_key_path)  # Raises IAMInvalidPublicKey if missing or malformed
+    return public_key_path
 
 
 def _validate_scheme(scheme: str) -> str:
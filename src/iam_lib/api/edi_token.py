@@ -14,10 +14,16 @@
 :Created:
     6/1/25
 """
+from typing import TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
-import iam_lib.models.response_model as response_model
+from iam_lib.cache import ResponseCache
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -35,8 +41,27 @@ class EdiTokenClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
 
     def create_token(
         self,
@@ -60,8 +85,7 @@ class EdiTokenClient(Client):
         form_params = {
             "key": key,
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
 
     def lock_token(
         self,
@@ -81,8 +105,7 @@ class EdiTokenClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/token/{profile_edi_identifier}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route)
 
     def refresh_token(self,
       edi_token: str,
@@ -105,8 +128,7 @@ class EdiTokenClient(Client):
             "pasta-token": auth_token,
             "edi-token": edi_token
         }
-        self.post(route=route,  form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
 
     def revoke_token(
         self,
@@ -126,6 +148,5 @@ class EdiTokenClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/token/{profile_edi_identifier}"
-        self.put(route=route)
-        return response_model.response_data(self)
+        return self._call("put", route)
 
@@ -14,10 +14,15 @@
 :Created:
     5/11/25
 """
+from typing import TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
-import iam_lib.models.response_model as response_model
+from iam_lib.cache import ResponseCache
+
+if TYPE_CHECKING:
+    import requests
 
 
 logger = daiquiri.getLogger(__name__)
@@ -36,8 +41,27 @@ class EMLClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
 
     def add_eml(
         self,
@@ -61,5 +85,4 @@ class EMLClient(Client):
         form_params = {
             "eml": eml,
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
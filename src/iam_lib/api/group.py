@@ -14,10 +14,16 @@
 :Created:
     8/15/25
 """
+from typing import TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
-import iam_lib.models.response_model as response_model
+from iam_lib.cache import ResponseCache
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -35,8 +41,27 @@ class GroupClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
 
     def create_group(
         self,
@@ -61,8 +86,7 @@ class GroupClient(Client):
             "group_name": group_name,
             "group_description": group_description,
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
 
     def read_group(
         self,
@@ -83,8 +107,7 @@ class GroupClient(Client):
         """
         route = f"auth/v1/group/{group_edi_identifier}"
         form_params = None
-        self.put(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("put", route, form_params)
 
     def update_group(
         self,
@@ -112,8 +135,7 @@ class GroupClient(Client):
             "group_name": group_name,
             "group_description": group_description,
         }
-        self.put(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("put", route, form_params)
 
     def delete_group(
         self,
@@ -133,8 +155,7 @@ class GroupClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/group/{group_edi_identifier}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route)
 
     def add_group_member(
         self,
@@ -156,8 +177,7 @@ class GroupClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/group/{group_edi_identifier}/{profile_edi_identifier}"
-        self.post(route=route)
-        return response_model.response_data(self)
+        return self._call("post", route)
 
     def remove_group_member(
         self,
@@ -179,5 +199,4 @@ class GroupClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/group/{group_edi_identifier}/{profile_edi_identifier}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route)
@@ -14,10 +14,15 @@
 :Created:
     5/22/25
 """
+from typing import TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
-import iam_lib.models.response_model as response_model
+from iam_lib.cache import ResponseCache
+
+if TYPE_CHECKING:
+    import requests
 
 
 logger = daiquiri.getLogger(__name__)
@@ -36,8 +41,27 @@ class ProfileClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
 
     def create_profile(
             self,
@@ -60,8 +84,7 @@ class ProfileClient(Client):
         form_params = {
             "idp_uid": idp_uid,
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
 
 
     def update_profile(
@@ -93,8 +116,7 @@ class ProfileClient(Client):
             "family_name": family_name,
             "email": email
         }
-        self.put(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("put", route, form_params)
 
     def delete_profile(
         self,
@@ -114,8 +136,7 @@ class ProfileClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/profile/{profile_edi_identifier}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route)
 
     def read_profile(
         self,
@@ -135,5 +156,4 @@ class ProfileClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/resource/{profile_edi_identifier}"
-        self.get(route=route)
-        return response_model.response_data(self)
+        return self._call("get", route)
@@ -14,10 +14,21 @@
 :Created:
     5/13/25
 """
+from functools import partial
+import threading
+from typing import Callable, Iterator, TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
+from iam_lib.cache import ResponseCache
+from iam_lib.models.records import Resource
 import iam_lib.models.response_model as response_model
+from iam_lib.models.resource_tree import ResourceTree
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -35,8 +46,54 @@ class ResourceClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        resource_tree: ResourceTree = None,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
+        self._resource_tree = resource_tree
+        self._tree_lock = threading.Lock()  # Serializes changes to the resource tree between threads
+
+    @classmethod
+    def _from_context(cls, context, thread_safe: bool = None, resource_tree: ResourceTree = None):
+        client = super()._from_context(context, thread_safe)
+        client._resource_tree = resource_tree
+        client._tree_lock = threading.Lock()
+        return client
+
+    def with_token(self, token: str | None) -> "ResourceClient":
+        """See Client.with_token. The view starts without a resource tree: the resources a tree holds depend on the
+        token that read them."""
+        view = super().with_token(token)
+        view._resource_tree = None
+        view._tree_lock = threading.Lock()
+        return view
+
+    @property
+    def resource_tree(self) -> ResourceTree | None:
+        """Resource tree kept up to date by this client's create, update, and delete resource calls"""
+        return self._resource_tree
+
+    @resource_tree.setter
+    def resource_tree(self, resource_tree: ResourceTree | None):
+        self._resource_tree = resource_tree
 
     def create_resource(
         self,
@@ -68,8 +125,8 @@ class ResourceClient(Client):
             "resource_type": resource_type,
             "parent_resource_key": parent_resource_key
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        track = partial(_track_create, resource_key, resource_label, resource_type, parent_resource_key)
+        return self._call("post", route, form_params, result=self._tracking(track))
 
     def update_resource(
         self,
@@ -100,8 +157,8 @@ class ResourceClient(Client):
             "resource_type": resource_type,
             "parent_resource_key": parent_resource_key
         }
-        self.put(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        track = partial(_track_update, resource_key, resource_label, resource_type, parent_resource_key)
+        return self._call("put", route, form_params, result=self._tracking(track))
 
     def delete_resource(
         self,
@@ -121,8 +178,7 @@ class ResourceClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/resource/{resource_key}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route, result=self._tracking(partial(_track_delete, resource_key)))
 
     def read_resource(
         self,
@@ -153,8 +209,7 @@ class ResourceClient(Client):
             if descendants: query_params["descendants"] = None
             if ancestors: query_params["ancestors"] = None
             if all: query_params["all"] = None
-        self.get(route=route, query_params=query_params)
-        return response_model.response_data(self)
+        return self._call("get", route, query_params)
 
     def read_resources(
         self,
@@ -173,5 +228,88 @@ class ResourceClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/resources"
-        self.get(route=route)
-        return response_model.response_data(self)
+        return self._call("get", route)
+
+    def iter_resources(
+        self,
+        models: bool = False,
+    ) -> Iterator[dict | Resource]:
+        """Stream resources of EDI Token subject one at a time, without holding the whole response in memory. The
+        asyncio client returns an asynchronous iterator.
+
+        Args:
+            models (bool): yield compact Resource records instead of dicts (defaults to False)
+
+         Returns:
+            resources (Iterator[dict | Resource])
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+            iam_lib.exceptions.IAMXMLDecodeError: On XML decode error
+        """
+        route = f"auth/v1/resources"
+        return self._iter_items(route, model=Resource if models else None)
+
+    def read_resource_tree(self, resource_key: str) -> ResourceTree:
+        """Read a resource with its ancestors and descendants into a ResourceTree.
+
+        The resources are loaded into this client's resource tree, which is created on first use, so that later
+        create, update, and delete resource calls keep the tree up to date without refetching.
+
+        Args:
+            resource_key (str): unique identifier for the resource
+
+         Returns:
+            resource_tree (ResourceTree)
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+            iam_lib.exceptions.IAMXMLDecodeError: On XML decode error
+        """
+        route = f"auth/v1/resource/{resource_key}"
+        query_params = {"descendants": None, "ancestors": None}
+        return self._call("get", route, query_params, result=self._load_tree)
+
+    def _load_tree(self, response) -> ResourceTree:
+        data = response_model.response_data(self, response, structured=True)
+        with self._tree_lock:
+            if self._resource_tree is None:
+                self._resource_tree = ResourceTree()
+            self._resource_tree.load(data)
+            return self._resource_tree
+
+    def _tracking(self, track: Callable) -> Callable | None:
+        # Apply a successful change to the attached resource tree; the response data is returned unchanged
+        if self._resource_tree is None:
+            return None
+
+        def result(response):
+            with self._tree_lock:
+                track(self._resource_tree)
+            return response_model.response_data(self, response)
+
+        return result
+
+
+def _track_create(resource_key: str, resource_label: str, resource_type: str, parent_resource_key: str, tree):
+    # Resources created under a parent outside the tree are not part of it
+    if parent_resource_key is None or parent_resource_key in tree:
+        tree.add(resource_key, resource_label, resource_type, parent_resource_key)
+
+
+def _track_update(resource_key: str, resource_label: str, resource_type: str, parent_resource_key: str, tree):
+    if resource_key not in tree:
+        return
+    if parent_resource_key is not None and parent_resource_key not in tree:
+        tree.remove(resource_key)  # Moved out of the tree
+    else:
+        tree.update(resource_key, resource_label, resource_type, parent_resource_key)
+
+
+def _track_delete(resource_key: str, tree):
+    if resource_key in tree:
+        tree.remove(resource_key)
@@ -14,11 +14,18 @@
 :Created:
     5/13/25
 """
+from typing import Iterator, TYPE_CHECKING
+
 import daiquiri
 
 from iam_lib.api.client import Client
+from iam_lib.cache import ResponseCache
 from iam_lib.models.permission import Permission, PERMISSION_MAP
-import iam_lib.models.response_model as response_model
+from iam_lib.models.records import Rule
+
+if TYPE_CHECKING:
+    import requests
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -36,8 +43,27 @@ class RuleClient(Client):
         token: str,
         truststore: str = None,
         timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        thread_safe: bool = False,
     ):
-        super().__init__(scheme, host, accept, public_key_path, algorithm, token, truststore, timeout)
+        super().__init__(
+            scheme,
+            host,
+            accept,
+            public_key_path,
+            algorithm,
+            token,
+            truststore,
+            timeout,
+            session,
+            pool_size,
+            keep_alive,
+            response_cache,
+            thread_safe,
+        )
 
     def create_rule(
         self,
@@ -65,8 +91,7 @@ class RuleClient(Client):
             "principal": principal,
             "permission": PERMISSION_MAP[permission.value]
         }
-        self.post(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("post", route, form_params)
 
     def update_rule(
         self,
@@ -93,8 +118,7 @@ class RuleClient(Client):
         form_params = {
             "permission": PERMISSION_MAP[permission.value]
         }
-        self.put(route=route, form_params=form_params)
-        return response_model.response_data(self)
+        return self._call("put", route, form_params)
 
     def delete_rule(
         self,
@@ -116,8 +140,7 @@ class RuleClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/rule/{resource_key}/{principal}"
-        self.delete(route=route)
-        return response_model.response_data(self)
+        return self._call("delete", route)
 
     def read_rule(
         self,
@@ -139,8 +162,7 @@ class RuleClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/rule/{resource_key}/{principal}"
-        self.get(route=route)
-        return response_model.response_data(self)
+        return self._call("get", route)
 
     def read_principal_rules(
         self
@@ -156,8 +178,7 @@ class RuleClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/rules/principal"
-        self.get(route=route)
-        return response_model.response_data(self)
+        return self._call("get", route)
 
     def read_resource_rules(
         self,
@@ -177,5 +198,50 @@ class RuleClient(Client):
             iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
         """
         route = f"auth/v1/rules/resource/{resource_key}"
-        self.get(route=route)
-        return response_model.response_data(self)
+        return self._call("get", route)
+
+    def iter_principal_rules(
+        self,
+        models: bool = False,
+    ) -> Iterator[dict | Rule]:
+        """Stream rules associated with principal(s) who has changePermission one at a time, without holding the whole
+        response in memory. The asyncio client returns an asynchronous iterator.
+
+        Args:
+            models (bool): yield compact Rule records instead of dicts (defaults to False)
+
+        Returns:
+            rules (Iterator[dict | Rule])
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+            iam_lib.exceptions.IAMXMLDecodeError: On XML decode error
+        """
+        route = f"auth/v1/rules/principal"
+        return self._iter_items(route, model=Rule if models else None)
+
+    def iter_resource_rules(
+        self,
+        resource_key: str,
+        models: bool = False,
+    ) -> Iterator[dict | Rule]:
+        """Stream rules associated with a resource one at a time, without holding the whole response in memory. The
+        asyncio client returns an asynchronous iterator.
+
+        Args:
+            resource_key (str): unique identifier for the resource
+            models (bool): yield compact Rule records instead of dicts (defaults to False)
+
+        Returns:
+            rules (Iterator[dict | Rule])
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMJSONDecodeError: On JSON decode error
+            iam_lib.exceptions.IAMXMLDecodeError: On XML decode error
+        """
+        route = f"auth/v1/rules/resource/{resource_key}"
+        return self._iter_items(route, model=Rule if models else None)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    breaker
+
+:Synopsis:
+    Circuit breakers failing IAM REST API requests fast while an IAM service is down
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from collections import namedtuple
+import contextlib
+import threading
+import time
+from typing import Callable, Iterator
+
+import daiquiri
+
+import iam_lib.exceptions
+
+
+logger = daiquiri.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CircuitBreakerInfo = namedtuple("CircuitBreakerInfo", ["state", "failures", "opened", "rejected"])
+
+FAILURE_STATUSES = frozenset((500, 502, 503, 504))
+
+
+class CircuitBreaker:
+    """Circuit breaker of the requests to one IAM service.
+
+    The circuit is closed while the service answers: requests are sent. After failure_threshold consecutive failed
+    requests, i.e., requests failing to connect or answered with a status in failure_statuses, the circuit opens:
+    requests fail at once with IAMCircuitOpenError, without being sent, for cool_down seconds. The circuit is then
+    half-open: up to half_open_calls requests at a time are sent as probes, and others fail at once. The circuit
+    closes when a probe is answered, and opens again for cool_down seconds when a probe fails. Any answer other than a
+    failure status, e.g., 404 Not Found, shows that the service is up.
+
+    Listeners are called with the origin, the old state, and the new state on every state change.
+
+    Args:
+        origin (str): service origin (scheme://host)
+        failure_threshold (int): consecutive failures opening the circuit (defaults to 5)
+        cool_down (float): seconds the circuit stays open before probing the service (defaults to 30)
+        half_open_calls (int): concurrent probes of a half-open circuit (defaults to 1)
+        failure_statuses (frozenset): response status codes counted as failures (defaults to 500, 502, 503, and 504)
+        listeners (list): state change callbacks (optional)
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(
+            self,
+            origin: str,
+            failure_threshold: int = 5,
+            cool_down: float = 30,
+            half_open_calls: int = 1,
+            failure_statuses: frozenset = FAILURE_STATUSES,
+            listeners: list = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.origin = origin
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.half_open_calls = half_open_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self._listeners = [] if listeners is None else listeners
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0  # Consecutive failures
+        self._opened_at = 0.0
+        self._probes = 0  # Probes in flight of a half-open circuit
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN, or HALF_OPEN; an open circuit whose cool-down has ended reads as HALF_OPEN"""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.cool_down:
+                return HALF_OPEN
+            return self._state
+
+    @contextlib.contextmanager
+    def guard(self) -> Iterator[None]:
+        """Context of one request to the service, recording its outcome
+
+        Raises:
+            iam_lib.exceptions.IAMCircuitOpenError: If the circuit is open, on entering the context
+        """
+        probe = self._acquire()
+        try:
+            yield
+        except BaseException as e:
+            self._release(probe, e)
+            raise
+        self._release(probe, None)
+
+    def breaker_info(self) -> CircuitBreakerInfo:
+        """Return counters for monitoring: state, consecutive failures, times opened, and requests failed fast"""
+        state = self.state
+        with self._lock:
+            return CircuitBreakerInfo(state, self._failures, self._opened, self._rejected)
+
+    def reset(self):
+        """Close the circuit"""
+        with self._lock:
+            transition = self._transition(CLOSED)
+            self._failures = 0
+        self._notify(transition)
+
+    def _acquire(self) -> bool:
+        # Admit a request, returning whether it is a probe of a half-open circuit
+        transition = None
+        with self._lock:
+            if self._state == OPEN:
+                wait = self.cool_down - (self._clock() - self._opened_at)
+                if wait > 0:
+                    self._rejected += 1
+                    msg = f"Circuit of IAM service {self.origin} is open: failing fast for {wait:.1f} more seconds"
+                    raise iam_lib.exceptions.IAMCircuitOpenError(msg, self.origin, wait)
+                transition = self._transition(HALF_OPEN)
+            probe = self._state == HALF_OPEN
+            if probe:
+                if self._probes >= self.half_open_calls:
+                    self._rejected += 1
+                    msg = f"Circuit of IAM service {self.origin} is half-open: a probe request is in flight"
+                    raise iam_lib.exceptions.IAMCircuitOpenError(msg, self.origin, 0.0)
+                self._probes += 1
+        self._notify(transition)
+        return probe
+
+    def _release(self, probe: bool, error: BaseException | None):
+        # Record the outcome of an admitted request
+        if isinstance(error, iam_lib.exceptions.IAMResponseError):
+            failed = error.response.status_code in self.failure_statuses
+        elif isinstance(error, iam_lib.exceptions.IAMRequestError):
+            failed = True
+        elif error is not None:
+            failed = None  # Not sent, e.g., invalid parameters, or cancelled: says nothing about the service
+        else:
+            failed = False
+        transition = None
+        with self._lock:
+            if probe:
+                self._probes -= 1
+            if failed:
+                self._failures += 1
+                if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                    transition = self._transition(OPEN)
+                    self._opened_at = self._clock()
+                    self._opened += 1
+            elif failed is False:
+                self._failures = 0
+                if self._state == HALF_OPEN:
+                    transition = self._transition(CLOSED)
+        self._notify(transition)
+
+    def _transition(self, state: str) -> tuple | None:
+        # Change the state under the lock, returning the change to notify once the lock is released
+        if state == self._state:
+            return None
+        old_state, self._state = self._state, state
+        return old_state, state
+
+    def _notify(self, transition: tuple | None):
+        if transition is None:
+            return
+        old_state, state = transition
+        log = logger.warning if state == OPEN else logger.info
+        log(f"Circuit of IAM service {self.origin}: {old_state} -> {state}")
+        for listener in list(self._listeners):
+            try:
+                listener(self.origin, old_state, state)
+            except Exception as e:
+                logger.error(f"Circuit breaker listener failed: {e}")
+
+
+class CircuitBreakers:
+    """Circuit breakers of the IAM services, by origin (scheme://host), created on first use with this configuration
+    (see CircuitBreaker).
+
+    Args:
+        failure_threshold (int): consecutive failures opening a circuit (defaults to 5)
+        cool_down (float): seconds a circuit stays open before probing the service (defaults to 30)
+        half_open_calls (int): concurrent probes of a half-open circuit (defaults to 1)
+        failure_statuses (frozenset): response status codes counted as failures (defaults to 500, 502, 503, and 504)
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            cool_down: float = 30,
+            half_open_calls: int = 1,
+            failure_statuses: frozenset = FAILURE_STATUSES,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.half_open_calls = half_open_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self._clock = clock
+        self._breakers = {}
+        self._listeners = []  # Shared by the breakers
+        self._lock = threading.Lock()
+
+    def breaker(self, origin: str) -> CircuitBreaker:
+        """Return the circuit breaker of the service origin"""
+        breaker = self._breakers.get(origin)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(origin)
+                if breaker is None:
+                    breaker = self._breakers[origin] = CircuitBreaker(
+                        origin,
+                        self.failure_threshold,
+                        self.cool_down,
+                        self.half_open_calls,
+                        self.failure_statuses,
+                        self._listeners,
+                        self._clock,
+                    )
+        return breaker
+
+    def add_listener(self, listener: Callable[[str, str, str], None]):
+        """Call listener(origin, old_state, new_state) on every state change of the circuit breakers"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, str, str], None]):
+        self._listeners.remove(listener)
+
+    def breakers_info(self) -> dict:
+        """Return the counters of each circuit breaker, by origin, for monitoring (see CircuitBreaker.breaker_info)"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.origin: breaker.breaker_info() for breaker in breakers}
+
+    def clear(self):
+        """Discard all circuit breakers, closing their circuits"""
+        with self._lock:
+            self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakers()
@@ -0,0 +1,701 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    cache
+
+:Synopsis:
+    Client-side caches for IAM REST API results
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from collections import namedtuple, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
+import hashlib
+import threading
+import time
+from typing import Awaitable, Callable, Iterable
+
+import daiquiri
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+DecisionCacheInfo = namedtuple(
+    "DecisionCacheInfo",
+    ["hits", "misses", "stale_hits", "refreshes", "evictions", "maxsize", "currsize"]
+)
+
+KeyTokenCacheInfo = namedtuple(
+    "KeyTokenCacheInfo",
+    ["hits", "misses", "shared", "maxsize", "currsize"]
+)
+
+ResponseCacheInfo = namedtuple(
+    "ResponseCacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize", "max_bytes", "currbytes"]
+)
+
+
+class _Decision:
+    __slots__ = ("value", "expires", "stale_until", "refreshing")
+
+    def __init__(self, value: bool, expires: float, stale_until: float):
+        self.value = value
+        self.expires = expires
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class DecisionCache:
+    """TTL cache of authorization decisions with LRU eviction and stale-while-revalidate refresh.
+
+    Decisions are keyed by (subject, principals, resource_key, permission). Positive and negative decisions expire
+    after separate TTLs. An expired decision is still served for up to stale_ttl seconds while a background refresh
+    replaces it; past that window the decision is reloaded by the caller.
+
+    Args:
+        maxsize (int): maximum number of decisions held (defaults to 4096)
+        positive_ttl (float): seconds an authorized decision is fresh (defaults to 300)
+        negative_ttl (float): seconds an unauthorized decision is fresh (defaults to 30)
+        stale_ttl (float): seconds an expired decision may be served while refreshing (defaults to 60)
+        max_refresh_workers (int): maximum concurrent background refreshes (defaults to 2)
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        positive_ttl: float = 300,
+        negative_ttl: float = 30,
+        stale_ttl: float = 60,
+        max_refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._max_refresh_workers = max_refresh_workers
+        self._executor = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._evictions = 0
+
+    def decide(self, key: tuple, loader: Callable[[], bool], refresher: Callable[[], bool] = None) -> bool:
+        """Return the cached decision for key, calling loader on a miss
+
+        Args:
+            key (tuple): (subject, principals, resource_key, permission)
+            loader (Callable): returns the authoritative decision
+            refresher (Callable): returns the authoritative decision from a background thread (defaults to loader)
+
+        Returns:
+            Boolean: the authorization decision
+        """
+        found, value, refresh = self.lookup(key)
+        if refresh:
+            self._refresh_executor().submit(self._refresh, key, refresher or loader)
+        if found:
+            return value
+        value = loader()
+        self.store(key, value)
+        return value
+
+    async def adecide(
+        self,
+        key: tuple,
+        loader: Callable[[], Awaitable[bool]],
+        refresher: Callable[[], Awaitable[bool]] = None,
+    ) -> bool:
+        """Return the cached decision for key, awaiting loader on a miss. The asyncio form of decide.
+
+        Args:
+            key (tuple): (subject, principals, resource_key, permission)
+            loader (Callable): coroutine function returning the authoritative decision
+            refresher (Callable): coroutine function run as a background task on a stale hit (defaults to loader)
+
+        Returns:
+            Boolean: the authorization decision
+        """
+        import asyncio  # Only asyncio callers load it
+        found, value, refresh = self.lookup(key)
+        if refresh:
+            asyncio.get_running_loop().create_task(self._arefresh(key, refresher or loader))
+        if found:
+            return value
+        value = await loader()
+        self.store(key, value)
+        return value
+
+    def lookup(self, key: tuple) -> tuple[bool, bool | None, bool]:
+        """Look up a decision
+
+        Args:
+            key (tuple): (subject, principals, resource_key, permission)
+
+        Returns:
+            (found, value, refresh): whether a servable decision exists, the decision, and whether the caller should
+            start a background refresh of a stale decision
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                if now < entry.expires:
+                    return True, entry.value, False
+                self._stale_hits += 1
+                refresh = not entry.refreshing
+                entry.refreshing = True
+                return True, entry.value, refresh
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return False, None, False
+
+    def store(self, key: tuple, value: bool):
+        """Store a decision with the TTL of its outcome"""
+        now = self._clock()
+        expires = now + (self.positive_ttl if value else self.negative_ttl)
+        with self._lock:
+            self._entries[key] = _Decision(value, expires, expires + self.stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, resource_key: str = None, subject: str = None) -> int:
+        """Remove decisions matching a resource key and/or token subject
+
+        Args:
+            resource_key (str): resource key of decisions to remove (optional)
+            subject (str): token subject of decisions to remove (optional)
+
+        Returns:
+            int: number of decisions removed
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (resource_key is None or key[2] == resource_key) and (subject is None or key[0] == subject)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> DecisionCacheInfo:
+        """Return cache statistics for monitoring"""
+        with self._lock:
+            return DecisionCacheInfo(
+                self._hits,
+                self._misses,
+                self._stale_hits,
+                self._refreshes,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    @property
+    def hit_ratio(self) -> float:
+        with self._lock:
+            total = self._hits + self._misses
+            return self._hits / total if total else 0.0
+
+    def close(self, wait: bool = True):
+        """Shut down the background refresh workers
+
+        Args:
+            wait (bool): wait for pending refreshes to finish (defaults to True)
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _refresh(self, key: tuple, loader: Callable[[], bool]):
+        try:
+            value = loader()
+        except Exception as e:
+            self._refresh_failed(key, e)
+            return
+        with self._lock:
+            self._refreshes += 1
+        self.store(key, value)
+
+    async def _arefresh(self, key: tuple, loader: Callable[[], Awaitable[bool]]):
+        try:
+            value = await loader()
+        except Exception as e:
+            self._refresh_failed(key, e)
+            return
+        with self._lock:
+            self._refreshes += 1
+        self.store(key, value)
+
+    def _refresh_failed(self, key: tuple, error: Exception):
+        logger.warning(f"Background refresh of authorization decision failed: {error}")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def _refresh_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_refresh_workers, thread_name_prefix="iam_lib_refresh"
+                )
+            return self._executor
+
+
+class _CachedResponse:
+    __slots__ = ("response", "etag", "last_modified", "size", "data", "parsed", "resource_keys")
+
+    def __init__(self, response, etag: str | None, last_modified: str | None, size: int, resource_keys: frozenset):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+        self.data = None
+        self.parsed = False
+        self.resource_keys = resource_keys  # Resources the response depends on, from its route and parsed data
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU cache of GET responses revalidated with conditional requests.
+
+    A 200 response carrying an ETag or Last-Modified validator is kept together with its parsed response data. The
+    next GET of the same request is sent with If-None-Match and/or If-Modified-Since; on 304 Not Modified the cached
+    response is used as the client's response and its parsed data is returned without transferring or parsing the
+    body again. Responses are keyed by (origin, route, query parameters, accept type, token digest), so clients of
+    different hosts or tokens can share one cache. Parsed data is returned as a copy, so callers may modify it.
+
+    Successful writes through a client using the cache invalidate the responses they affect (see invalidate_write):
+    those of the written route and of every resource the write changes, which includes the resource trees of its
+    ancestors and descendants, the resource and rule listings, and, on delete, the responses of the removed subtree.
+
+    Args:
+        maxsize (int): maximum number of responses held (defaults to 256)
+        max_bytes (int): maximum total size of the response bodies held (defaults to 16 MiB)
+
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._responses = {}  # id of a cached response to its key
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key: tuple) -> _CachedResponse | None:
+        """Return the cached response entry for key, whose validators() make the request conditional"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def update(self, key: tuple, response, entry: _CachedResponse = None):
+        """Apply the response of a request sent with the validators of entry
+
+        Returns:
+            the cached response on 304 Not Modified, otherwise the response itself, which is cached if it is a 200
+            response with validators
+        """
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self._hits += 1
+                # A 304 response may carry updated validators
+                entry.etag = response.headers.get("ETag", entry.etag)
+                entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+            return entry.response
+        if response.status_code != 200:
+            return response
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self._misses += 1
+            self._discard(key)
+            if etag is None and last_modified is None:
+                return response
+            size = len(response.content)
+            if size > self.max_bytes:
+                return response
+            self._entries[key] = _CachedResponse(response, etag, last_modified, size, _route_keys(key[1], key[2]))
+            self._responses[id(response)] = key
+            self._bytes += size
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+        return response
+
+    def data(self, response, parse: Callable):
+        """Return a copy of the parsed data of a cached response, parsing it on first use
+
+        Args:
+            response: response returned by update
+            parse (Callable): returns the response data of the response
+
+        Returns:
+            the parsed response data
+        """
+        with self._lock:
+            key = self._responses.get(id(response))
+            entry = self._entries.get(key) if key is not None else None
+        if entry is None or entry.response is not response:
+            return parse()
+        if not entry.parsed:
+            data = parse()
+            with self._lock:
+                entry.data = data
+                entry.parsed = True
+                if isinstance(data, (dict, list)):
+                    entry.resource_keys |= _payload_keys(data)
+        return copy.deepcopy(entry.data)
+
+    def invalidate(
+        self,
+        origin: str = None,
+        routes: Iterable[str] = (),
+        resource_keys: Iterable[str] = (),
+        descendants: bool = False,
+    ) -> int:
+        """Remove the responses of routes and those depending on resources
+
+        A response depends on a resource if its route names the resource (e.g., auth/v1/resource/{key} or
+        auth/v1/rules/resource/{key}) or its parsed data contains the resource key; the body of a response whose data
+        has not been parsed is searched for the key instead.
+
+        Args:
+            origin (str): scheme://host of the responses to remove (defaults to all origins)
+            routes (Iterable[str]): routes whose responses are removed
+            resource_keys (Iterable[str]): keys of the resources whose dependent responses are removed
+            descendants (bool): also remove the responses depending on the descendants of the resources, as found in
+                cached resource trees (defaults to False)
+
+        Returns:
+            int: number of responses removed
+        """
+        routes = set(routes)
+        resource_keys = set(resource_keys)
+        with self._lock:
+            if descendants and resource_keys:
+                resource_keys |= self._descendant_keys(resource_keys)
+            needles = [resource_key.encode("utf-8") for resource_key in resource_keys]
+            keys = [
+                key for key, entry in self._entries.items()
+                if (origin is None or key[0] == origin)
+                and (
+                    key[1] in routes
+                    or not entry.resource_keys.isdisjoint(resource_keys)
+                    or (not entry.parsed and any(needle in entry.response.content for needle in needles))
+                )
+            ]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def invalidate_write(self, origin: str, verb: str, route: str, params: dict = None) -> int:
+        """Remove the responses affected by a successful POST, PUT, or DELETE request
+
+        Args:
+            origin (str): scheme://host of the request
+            verb (str): HTTP verb of the request
+            route (str): IAM route of the request
+            params (dict): form parameters of the request (optional)
+
+        Returns:
+            int: number of responses removed
+        """
+        routes, resource_keys = _write_dependencies(verb, route, params or {})
+        removed = self.invalidate(origin, routes, resource_keys, descendants=verb == "delete")
+        if removed:
+            logger.debug(f"{verb.upper()} {route} invalidated {removed} cached responses")
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._responses.clear()
+            self._bytes = 0
+
+    def cache_info(self) -> ResponseCacheInfo:
+        """Return cache statistics for monitoring"""
+        with self._lock:
+            return ResponseCacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+                self.max_bytes,
+                self._bytes,
+            )
+
+    @property
+    def hit_ratio(self) -> float:
+        with self._lock:
+            total = self._hits + self._misses
+            return self._hits / total if total else 0.0
+
+    def _discard(self, key: tuple):
+        # Called with the lock held
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            del self._responses[id(entry.response)]
+            self._bytes -= entry.size
+
+    def _descendant_keys(self, resource_keys: set) -> set:
+        # Called with the lock held: keys of the subtrees rooted at the resources in the parsed resource trees
+        keys = set()
+        for entry in self._entries.values():
+            if entry.parsed and not entry.resource_keys.isdisjoint(resource_keys):
+                stack = [entry.data]
+                while stack:
+                    item = stack.pop()
+                    if isinstance(item, dict):
+                        if isinstance(item.get("key"), str) and item["key"] in resource_keys:
+                            keys |= _payload_keys(item)
+                        else:
+                            stack.extend(item.values())
+                    elif isinstance(item, list):
+                        stack.extend(item)
+        return keys
+
+
+# Members of response data whose values are resource keys
+RESOURCE_KEY_MEMBERS = ("key", "resource_key", "parent_resource_key", "parent_key", "parent")
+
+
+def _payload_keys(data) -> frozenset:
+    # Resource keys contained in parsed response data
+    keys = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            for member, value in item.items():
+                if isinstance(value, str):
+                    if member in RESOURCE_KEY_MEMBERS:
+                        keys.add(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(item, list):
+            stack.extend(value for value in item if isinstance(value, (dict, list)))
+    return frozenset(keys)
+
+
+def _route_keys(route: str, query: tuple) -> frozenset:
+    # Resource keys named by the route or query of a GET request
+    parts = route.split("/")
+    if parts[:3] == ["auth", "v1", "resource"] and len(parts) > 3:
+        return frozenset(("/".join(parts[3:]),))
+    if parts[:4] == ["auth", "v1", "rules", "resource"] and len(parts) > 4:
+        return frozenset(("/".join(parts[4:]),))
+    if parts[:3] == ["auth", "v1", "rule"] and len(parts) > 4:
+        return frozenset(("/".join(parts[3:-1]),))
+    return frozenset(value for name, value in query if name == "resource_key")
+
+
+def _write_dependencies(verb: str, route: str, params: dict) -> tuple[set, set]:
+    # Routes and resource keys whose cached responses a successful write changes
+    parts = route.split("/")
+    if route == "auth/v1/resource":  # Create resource; the new resource is listed and its owner gets a rule
+        routes = {"auth/v1/resources", "auth/v1/rules/principal"}
+        resource_keys = {params.get("resource_key"), params.get("parent_resource_key")}
+    elif route == "auth/v1/rule":  # Create rule
+        resource_key = params.get("resource_key")
+        routes = {
+            "auth/v1/rules/principal",
+            f"auth/v1/rules/resource/{resource_key}",
+            f"auth/v1/rule/{resource_key}/{params.get('principal')}",
+        }
+        resource_keys = {resource_key}
+    elif parts[:3] == ["auth", "v1", "resource"]:  # Update or delete resource
+        routes = {route, "auth/v1/resources"}
+        resource_keys = {"/".join(parts[3:]), params.get("parent_resource_key")}
+    elif parts[:3] == ["auth", "v1", "rule"]:  # Update or delete rule
+        routes = {route, "auth/v1/rules/principal"}
+        resource_keys = {"/".join(parts[3:-1])}
+    else:  # Profiles, groups, and tokens: the written route and its parent
+        routes = {route, route.rsplit("/", 1)[0]}
+        resource_keys = set()
+    resource_keys.discard(None)
+    return routes, resource_keys
+
+
+class KeyTokenCache:
+    """LRU cache of the tokens issued for API keys, with single-flight issuing.
+
+    A token is reused until it is within refresh_ahead seconds of its "exp" claim; responses whose token carries no
+    "exp" claim are not cached. Concurrent requests for the token of the same key, from threads or from tasks of one
+    event loop, share one in-flight request. API keys are held only as SHA-256 digests of the service origin and key.
+    Callers receive a copy of the cached response data.
+
+    Args:
+        maxsize (int): maximum number of tokens held (defaults to 256)
+        refresh_ahead (float): seconds before expiry at which a new token is requested (defaults to 60)
+        clock (Callable): wall-clock time source, as the "exp" claim (defaults to time.time)
+
+    """
+
+    def __init__(self, maxsize: int = 256, refresh_ahead: float = 60, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self.refresh_ahead = refresh_ahead
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._flights = {}  # In-flight requests of threads
+        self._tasks = {}  # In-flight requests of event loop tasks
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+
+    @staticmethod
+    def digest(origin: str, key: str) -> bytes:
+        """Return the cache key of an API key of an IAM service origin (scheme://host)"""
+        return hashlib.sha256(f"{origin}\0{key}".encode("utf-8")).digest()
+
+    def get(self, digest: bytes, loader: Callable):
+        """Return the cached token response for the key digest, calling loader if none is valid
+
+        Args:
+            digest (bytes): see digest()
+            loader (Callable): returns the response data of a new token
+
+        Returns:
+            the token response data
+        """
+        found, data = self._lookup(digest)
+        if found:
+            return data
+        with self._lock:
+            flight = self._flights.get(digest)
+            leader = flight is None
+            if leader:
+                flight = self._flights[digest] = Future()
+            else:
+                self._shared += 1
+        if not leader:
+            return copy.deepcopy(flight.result())
+        try:
+            data = loader()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            self._store(digest, data)
+            flight.set_result(data)
+            return copy.deepcopy(data)
+        finally:
+            with self._lock:
+                del self._flights[digest]
+
+    async def aget(self, digest: bytes, loader: Callable[[], Awaitable]):
+        """Return the cached token response for the key digest, awaiting loader if none is valid. The asyncio form of
+        get.
+
+        Args:
+            digest (bytes): see digest()
+            loader (Callable): coroutine function returning the response data of a new token
+
+        Returns:
+            the token response data
+        """
+        import asyncio
+        found, data = self._lookup(digest)
+        if found:
+            return data
+        flight = (digest, asyncio.get_running_loop())
+        task = self._tasks.get(flight)
+        if task is None:
+            task = self._tasks[flight] = asyncio.ensure_future(self._aload(flight, loader))
+        else:
+            with self._lock:
+                self._shared += 1
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(self, digest: bytes) -> bool:
+        """Remove the token of a key digest, e.g., after it has been revoked"""
+        with self._lock:
+            return self._entries.pop(digest, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> KeyTokenCacheInfo:
+        """Return cache statistics for monitoring"""
+        with self._lock:
+            return KeyTokenCacheInfo(self._hits, self._misses, self._shared, self.maxsize, len(self._entries))
+
+    async def _aload(self, flight: tuple, loader: Callable[[], Awaitable]):
+        try:
+            data = await loader()
+            self._store(flight[0], data)
+            return data
+        finally:
+            del self._tasks[flight]
+
+    def _lookup(self, digest: bytes) -> tuple[bool, object]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                data, expiry = entry
+                if expiry - self._clock() > self.refresh_ahead:
+                    self._entries.move_to_end(digest)
+                    self._hits += 1
+                    return True, copy.deepcopy(data)
+                del self._entries[digest]
+            self._misses += 1
+            return False, None
+
+    def _store(self, digest: bytes, data):
+        import jwt
+        from iam_lib.models.records import IssuedToken
+        try:
+            expiry = IssuedToken(data).expiry
+        except (jwt.InvalidTokenError, AttributeError, TypeError):
+            expiry = None  # Not a token response, e.g., of the XML accept type
+        if expiry is None or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = (copy.deepcopy(data), expiry)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+key_tokens = KeyTokenCache()
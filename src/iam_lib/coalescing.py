@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    coalescing
+
+:Synopsis:
+    Single-flight coalescing of identical concurrent IAM REST API requests
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from collections import namedtuple
+from concurrent.futures import Future
+import copy
+import threading
+from typing import Awaitable, Callable, Hashable
+
+import daiquiri
+
+
+logger = daiquiri.getLogger(__name__)
+
+CoalescingInfo = namedtuple("CoalescingInfo", ["requests", "coalesced", "in_flight"])
+
+
+class _Flight:
+    __slots__ = ("future", "followers")
+
+    def __init__(self, future=None):
+        self.future = future
+        self.followers = 0
+
+
+class RequestCoalescer:
+    """Shares one in-flight call between concurrent callers of the same request key.
+
+    The first caller of a key (the leader) runs the request; callers arriving with the same key while it is in flight
+    (followers) wait for it and receive its result, or its exception. Nothing is kept once the request completes, so
+    results are never staler than the request they waited for. The leader receives the result itself and followers
+    receive copies made by the share function, so that no caller sees changes another caller makes to its result.
+
+    Threads and the tasks of each event loop coalesce separately: a thread never waits on an event loop, nor a task on
+    a thread.
+    """
+
+    def __init__(self):
+        self._flights = {}  # In-flight requests of threads
+        self._tasks = {}  # In-flight requests of event loop tasks, by (key, loop)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._coalesced = 0
+
+    def run(self, key: Hashable, loader: Callable, share: Callable = copy.deepcopy):
+        """Return the result of loader, sharing the call with concurrent callers of the same key
+
+        Args:
+            key (Hashable): request key
+            loader (Callable): sends the request and returns its result
+            share (Callable): copies the result for a follower (defaults to copy.deepcopy)
+
+        Returns:
+            the result of loader
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(Future())
+                self._requests += 1
+            else:
+                flight.followers += 1
+                self._coalesced += 1
+        if not leader:
+            return share(flight.future.result())
+        try:
+            result = loader()
+        except BaseException as e:
+            self._land(self._flights, key)
+            flight.future.set_exception(e)
+            raise
+        # Followers copy a snapshot, not the leader's result, which the leader may change as soon as it is returned
+        followers = self._land(self._flights, key)
+        flight.future.set_result(share(result) if followers else None)
+        return result
+
+    async def arun(self, key: Hashable, loader: Callable[[], Awaitable], share: Callable = copy.deepcopy):
+        """Return the result of awaiting loader, sharing the call with concurrent tasks of the same key. The asyncio
+        form of run.
+
+        The request runs in a task of its own, so that a caller being cancelled does not cancel the request of the
+        other callers.
+
+        Args:
+            key (Hashable): request key
+            loader (Callable): coroutine function sending the request and returning its result
+            share (Callable): copies the result for a follower (defaults to copy.deepcopy)
+
+        Returns:
+            the result of loader
+        """
+        import asyncio  # Only asyncio callers load it
+        flight_key = (key, asyncio.get_running_loop())
+        with self._lock:
+            flight = self._tasks.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._tasks[flight_key] = _Flight()
+                flight.future = asyncio.ensure_future(self._aload(flight_key, loader, share))
+                self._requests += 1
+            else:
+                flight.followers += 1
+                self._coalesced += 1
+        result, snapshot = await asyncio.shield(flight.future)
+        return result if leader else share(snapshot)
+
+    def coalescing_info(self) -> CoalescingInfo:
+        """Return request counters for monitoring: requests sent, requests coalesced into them, requests in flight"""
+        with self._lock:
+            return CoalescingInfo(self._requests, self._coalesced, len(self._flights) + len(self._tasks))
+
+    def coalescing_ratio(self) -> float:
+        """Return the fraction of calls served by another caller's request"""
+        info = self.coalescing_info()
+        calls = info.requests + info.coalesced
+        return info.coalesced / calls if calls else 0.0
+
+    async def _aload(self, flight_key: tuple, loader: Callable[[], Awaitable], share: Callable) -> tuple:
+        try:
+            result = await loader()
+        finally:
+            followers = self._land(self._tasks, flight_key)
+        return result, share(result) if followers else None
+
+    def _land(self, flights: dict, key: Hashable) -> int:
+        # End a flight; callers arriving from now on start a new request. Returns the number of followers.
+        with self._lock:
+            return flights.pop(key).followers
+
+
+coalescer = RequestCoalescer()
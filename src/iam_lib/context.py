@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    context
+
+:Synopsis:
+    Shared IAM configuration, connection pool, and caches handing out lightweight API clients
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+import daiquiri
+
+from iam_lib.api.client import (
+    Client,
+    create_session,
+    _validate_accept,
+    _validate_public_key_path,
+    _validate_scheme,
+    _validate_token,
+    _validate_truststore,
+)
+from iam_lib.breaker import circuit_breakers, CircuitBreakers
+from iam_lib.cache import DecisionCache, key_tokens, KeyTokenCache, ResponseCache
+from iam_lib.coalescing import coalescer, RequestCoalescer
+from iam_lib.models.resource_tree import ResourceTree
+from iam_lib.retry import retry_policy, RetryPolicy
+
+if TYPE_CHECKING:
+    import requests
+
+    from iam_lib.api.access import AccessClient
+    from iam_lib.api.api_key import ApiKeyClient
+    from iam_lib.api.authorized import AuthorizedClient
+    from iam_lib.api.edi_token import EdiTokenClient
+    from iam_lib.api.eml import EMLClient
+    from iam_lib.api.group import GroupClient
+    from iam_lib.api.profile import ProfileClient
+    from iam_lib.api.resource import ResourceClient
+    from iam_lib.api.rule import RuleClient
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class ClientClass:
+    """Class attribute naming an API client class, which is imported on first use: a context imports only the client
+    modules it hands out clients of.
+
+    Args:
+        module (str): module of the client class
+        name (str): client class name
+
+    """
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self._client_class = None
+
+    def __get__(self, instance, owner) -> type:
+        if self._client_class is None:
+            self._client_class = getattr(importlib.import_module(self.module), self.name)
+        return self._client_class
+
+
+class IAMContext:
+    """Configuration, connection pool, and caches shared by the IAM API clients of one IAM service.
+
+    The configuration is validated once, when the context is created. API clients are then handed out by the context
+    without validating it again and without a session of their own, so that creating a client costs a few attribute
+    assignments: a server can create the clients it needs per request. All clients of a context send their requests
+    over its connection pool and share its caches and request coalescer; each client keeps its own last response.
+    Closing the context closes the session it created.
+
+    Args:
+        scheme (str): protocol scheme (http or https)
+        host (str): authentication host domain or address
+        accept (str): accept type (JSON or XML)
+        public_key_path (str): path to token signing public key
+        algorithm (str): token signing algorithm
+        token (str): IAM EDI authentication token (optional)
+        truststore (str): path to truststore (defaults to None)
+        timeout (int): request timeout to IAM service (defaults to 10 seconds)
+        session (requests.Session): shared HTTP session (defaults to a new session owned by the context)
+        pool_size (int): connection pool size of an owned session (defaults to 10)
+        keep_alive (bool): reuse connections of an owned session (defaults to True)
+        response_cache (ResponseCache): cache of GET responses revalidated with conditional requests (optional)
+        decision_cache (DecisionCache): cache of AuthorizedClient decisions (optional)
+        token_cache (KeyTokenCache): cache of tokens issued for API keys (defaults to the process-wide cache)
+        coalescer (RequestCoalescer): coalescer of identical concurrent GET requests (defaults to the process-wide
+            coalescer)
+        thread_safe (bool): default thread-safe mode of the clients (see Client) (defaults to False)
+        retry_policy (RetryPolicy): retry policy of the clients' requests (defaults to the process-wide policy; None
+            disables retries)
+        circuit_breakers (CircuitBreakers): circuit breakers of the clients' requests (defaults to the process-wide
+            breakers; None disables them)
+
+    Raises:
+        iam_lib.exceptions.IAMInvalidScheme
+        iam_lib.exceptions.IAMInvalidAccept
+        iam_lib.exceptions.IAMInvalidPublicKey
+        iam_lib.exceptions.IAMInvalidToken
+        iam_lib.exceptions.IAMInvalidParameter: If the truststore does not exist
+
+    """
+
+    access_class = ClientClass("iam_lib.api.access", "AccessClient")
+    api_key_class = ClientClass("iam_lib.api.api_key", "ApiKeyClient")
+    authorized_class = ClientClass("iam_lib.api.authorized", "AuthorizedClient")
+    edi_token_class = ClientClass("iam_lib.api.edi_token", "EdiTokenClient")
+    eml_class = ClientClass("iam_lib.api.eml", "EMLClient")
+    group_class = ClientClass("iam_lib.api.group", "GroupClient")
+    profile_class = ClientClass("iam_lib.api.profile", "ProfileClient")
+    resource_class = ClientClass("iam_lib.api.resource", "ResourceClient")
+    rule_class = ClientClass("iam_lib.api.rule", "RuleClient")
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        accept: str,
+        public_key_path: str,
+        algorithm: str,
+        token: str = None,
+        truststore: str = None,
+        timeout: int = 10,
+        session: "requests.Session" = None,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        response_cache: ResponseCache = None,
+        decision_cache: DecisionCache = None,
+        token_cache: KeyTokenCache | None = key_tokens,
+        coalescer: RequestCoalescer | None = coalescer,
+        thread_safe: bool = False,
+        retry_policy: RetryPolicy | None = retry_policy,
+        circuit_breakers: CircuitBreakers | None = circuit_breakers,
+    ):
+        self._scheme = _validate_scheme(scheme)
+        self._host = host
+        self._accept = _validate_accept(accept)
+        self._public_key_path = _validate_public_key_path(public_key_path)
+        self._algorithm = algorithm
+        self._truststore = _validate_truststore(truststore)
+        self._timeout = timeout
+        self.token = token
+        self._owns_session = session is None
+        self._session = self._create_session(pool_size, keep_alive) if session is None else session
+        self.response_cache = response_cache
+        self.decision_cache = decision_cache
+        self.token_cache = token_cache
+        self.coalescer = coalescer
+        self.thread_safe = thread_safe
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+
+    @property
+    def scheme(self) -> str:
+        return self._scheme
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def accept(self) -> str:
+        return self._accept
+
+    @property
+    def public_key_path(self) -> str:
+        return self._public_key_path
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    @property
+    def token(self) -> str:
+        """Token of the clients handed out from now on; clients already handed out keep theirs"""
+        return self._token
+
+    @token.setter
+    def token(self, token: str):
+        self._token = _validate_token(token, self._public_key_path, self._algorithm)
+        self._cookies = None if self._token is None else {"edi-token": self._token}
+
+    @property
+    def cookies(self) -> dict | None:
+        """Token cookie of the clients; replaced, never changed in place, when the token changes"""
+        return self._cookies
+
+    @property
+    def truststore(self) -> str | bool:
+        return self._truststore
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout
+
+    @property
+    def session(self) -> "requests.Session":
+        return self._session
+
+    def client(self, client_class: type, **options) -> Client:
+        """Return a client of the class, e.g., a subclass of an API client, sharing this context
+
+        Args:
+            client_class (type): Client class
+            options: client options other than those of the context, e.g., resource_tree of a ResourceClient, or
+                thread_safe
+        """
+        return client_class._from_context(self, **options)
+
+    def access(self, thread_safe: bool = None) -> "AccessClient":
+        return self.access_class._from_context(self, thread_safe)
+
+    def api_key(self, thread_safe: bool = None) -> "ApiKeyClient":
+        return self.api_key_class._from_context(self, thread_safe)
+
+    def authorized(self, thread_safe: bool = None) -> "AuthorizedClient":
+        return self.authorized_class._from_context(self, thread_safe)
+
+    def edi_token(self, thread_safe: bool = None) -> "EdiTokenClient":
+        return self.edi_token_class._from_context(self, thread_safe)
+
+    def eml(self, thread_safe: bool = None) -> "EMLClient":
+        return self.eml_class._from_context(self, thread_safe)
+
+    def group(self, thread_safe: bool = None) -> "GroupClient":
+        return self.group_class._from_context(self, thread_safe)
+
+    def profile(self, thread_safe: bool = None) -> "ProfileClient":
+        return self.profile_class._from_context(self, thread_safe)
+
+    def resource(self, thread_safe: bool = None, resource_tree: ResourceTree = None) -> "ResourceClient":
+        return self.resource_class._from_context(self, thread_safe, resource_tree)
+
+    def rule(self, thread_safe: bool = None) -> "RuleClient":
+        return self.rule_class._from_context(self, thread_safe)
+
+    def metrics(self) -> dict:
+        """Return the statistics of the shared caches, request coalescer, retry budget, back-off windows, and circuit
+        breakers, by name, for monitoring"""
+        metrics = {}
+        if self.coalescer is not None:
+            metrics["coalescing"] = self.coalescer.coalescing_info()
+        if self.response_cache is not None:
+            metrics["response_cache"] = self.response_cache.cache_info()
+        if self.decision_cache is not None:
+            metrics["decision_cache"] = self.decision_cache.cache_info()
+        if self.token_cache is not None:
+            metrics["key_tokens"] = self.token_cache.cache_info()
+        if self.retry_policy is not None and self.retry_policy.budget is not None:
+            metrics["retry_budget"] = self.retry_policy.budget.budget_info()
+        if self.retry_policy is not None and self.retry_policy.throttle is not None:
+            metrics["throttle"] = self.retry_policy.throttle.throttle_info()
+        if self.circuit_breakers is not None:
+            metrics["circuit_breakers"] = self.circuit_breakers.breakers_info()
+        return metrics
+
+    def close(self):
+        """Close the HTTP session if it is owned by this context
+
+        A session passed in by the caller is shared and left open for its owner to close.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_session(self, pool_size: int, keep_alive: bool) -> "requests.Session":
+        return create_session(pool_size, keep_alive)
@@ -61,11 +61,36 @@ class IAMRequestError(IAMLibException):
     pass
 
 
+class IAMRetryError(IAMRequestError):
+    def __init__(self, message: str, attempts: int, last_error: IAMRequestError):
+        super().__init__(message)
+        self.attempts = attempts
+        self.last_error = last_error
+
+
+class IAMCircuitOpenError(IAMRequestError):
+    def __init__(self, message: str, origin: str, retry_after: float):
+        super().__init__(message)
+        self.origin = origin
+        self.retry_after = retry_after
+
+
+class IAMThrottledError(IAMRequestError):
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class IAMJSONDecodeError(IAMLibException):
     pass
 
 
+class IAMXMLDecodeError(IAMLibException):
+    pass
+
+
 class IAMResponseError(IAMLibException):
     def __init__(self, response):
-        super().__init__(f"IAM REST API returned: '{response.status_code} {response.reason} -- Reason: {response.content}'")
+        reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")  # requests or httpx
+        super().__init__(f"IAM REST API returned: '{response.status_code} {reason} -- Reason: {response.content}'")
         self.response = response
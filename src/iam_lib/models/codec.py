@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    codec
+
+:Synopsis:
+    Pluggable JSON codec used to decode IAM REST API responses and encode request bodies
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+from typing import Callable
+
+import daiquiri
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class JSONCodec:
+    """JSON encoder and decoder working on UTF-8 bytes.
+
+    Args:
+        name (str): name of the codec backend
+        loads (Callable): decodes bytes (or str) to Python objects
+        dumps (Callable): encodes Python objects to UTF-8 bytes
+        errors (tuple): exception types raised by loads on invalid JSON
+
+    """
+
+    __slots__ = ("name", "loads", "dumps", "errors")
+
+    def __init__(self, name: str, loads: Callable, dumps: Callable, errors: tuple[type[Exception], ...]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.errors = errors
+
+    def __repr__(self) -> str:
+        return f"JSONCodec(name={self.name!r})"
+
+
+def _stdlib_codec() -> JSONCodec:
+    # Compact, UTF-8 output, matching that of orjson and msgspec
+    encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    return JSONCodec(
+        "json",
+        json.loads,
+        lambda obj: encoder.encode(obj).encode("utf-8"),
+        (json.JSONDecodeError, UnicodeDecodeError),
+    )
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+    return JSONCodec("orjson", orjson.loads, orjson.dumps, (orjson.JSONDecodeError,))
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JSONCodec("msgspec", decoder.decode, encoder.encode, (msgspec.DecodeError,))
+
+
+# Backends in order of preference; the first importable one is the default
+BACKENDS = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+_codec = None
+
+
+def available_codecs() -> list[str]:
+    """Return the names of the installed codec backends, in order of preference"""
+    names = []
+    for name, factory in BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec() -> JSONCodec:
+    """Return the codec in use, selecting the preferred installed backend on first call"""
+    global _codec
+    if _codec is None:
+        for name, factory in BACKENDS.items():
+            try:
+                _codec = factory()
+                break
+            except ImportError:
+                continue
+        logger.debug(f"Using the {_codec.name} JSON codec")
+    return _codec
+
+
+def set_codec(codec: str | JSONCodec | None) -> JSONCodec:
+    """Select the codec used by all clients
+
+    Args:
+        codec (str | JSONCodec | None): backend name ("orjson", "msgspec", or "json"), a custom codec, or None to
+            restore the preferred installed backend
+
+    Returns:
+        JSONCodec: the codec in use
+
+    Raises:
+        ValueError: On an unknown backend name
+        ImportError: If the backend is not installed
+    """
+    global _codec
+    if codec is None or isinstance(codec, JSONCodec):
+        _codec = codec
+        return get_codec()
+    try:
+        factory = BACKENDS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec '{codec}': must be one of {', '.join(BACKENDS)}")
+    _codec = factory()
+    return _codec
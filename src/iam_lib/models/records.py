@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    records
+
+:Synopsis:
+    Compact, lazily decoded models of IAM REST API response records
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import sys
+from typing import Callable, Iterable, Iterator
+
+import daiquiri
+
+from iam_lib.token import Token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+def intern(value):
+    """Intern a string so that equal values repeated across records share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Base of the response record models.
+
+    A record wraps the decoded payload of one response record. Each field is decoded from the payload on first access
+    and kept in a slot; compact() decodes all fields and releases the payload, leaving only the slots. Records are
+    read-only.
+
+    Subclasses declare their fields in _fields as attribute name to (payload member names, converter), where the
+    first member present in the payload is used and the converter (e.g., intern) may be None.
+
+    Args:
+        raw (dict): decoded record payload
+
+    """
+
+    __slots__ = ("_raw",)
+    _fields: dict[str, tuple[tuple[str, ...], Callable | None]] = {}
+    _decoders: dict = {}
+
+    def __init__(self, raw: dict):
+        _RAW.__set__(self, raw)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Slot descriptor, payload member names, and converter of each field, in declaration order
+        cls._decoders = {
+            name: (getattr(cls, name), members, convert) for name, (members, convert) in cls._fields.items()
+        }
+
+    def __getattr__(self, name: str):
+        # Called only when the slot of the field has not been filled yet
+        decoder = type(self)._decoders.get(name)
+        if decoder is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        slot, members, convert = decoder
+        value = _decode(self._raw or {}, members, convert)
+        slot.__set__(self, value)
+        return value
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(tuple(self.to_dict().items()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def from_list(cls, raw: Iterable[dict], compact: bool = False) -> list:
+        """Return a record for each payload of a list response
+
+        Args:
+            raw (Iterable[dict]): decoded record payloads
+            compact (bool): decode all fields and release the payloads (defaults to False)
+        """
+        return list(cls.iter(raw, compact))
+
+    @classmethod
+    def iter(cls, raw: Iterable[dict], compact: bool = False) -> Iterator:
+        """Yield a record for each payload, e.g., of a streamed list response"""
+        for item in raw:
+            record = cls(item)
+            yield record.compact() if compact else record
+
+    def compact(self):
+        """Decode all fields and release the payload
+
+        Returns:
+            self
+        """
+        raw = self._raw
+        if raw is not None:
+            for slot, members, convert in self._decoders.values():
+                slot.__set__(self, _decode(raw, members, convert))
+            _RAW.__set__(self, None)
+        return self
+
+    def to_dict(self) -> dict:
+        """Return the fields as a dictionary"""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+_RAW = Record._raw
+
+
+def _decode(raw: dict, members: tuple[str, ...], convert: Callable | None):
+    for member in members:
+        if member in raw:
+            value = raw[member]
+            return value if convert is None or value is None else convert(value)
+    return None
+
+
+class Resource(Record):
+    """IAM resource"""
+
+    __slots__ = ("key", "label", "type", "parent")
+    _fields = {
+        "key": (("resource_key", "key"), None),
+        "label": (("resource_label", "label"), None),
+        "type": (("resource_type", "type"), intern),
+        "parent": (("parent_resource_key", "parent_key", "parent"), None),
+    }
+
+
+class Rule(Record):
+    """IAM access control rule (ACR): a principal's permission on a resource"""
+
+    __slots__ = ("resource_key", "principal", "permission")
+    _fields = {
+        "resource_key": (("resource_key", "key"), None),
+        "principal": (("principal", "edi_id"), intern),
+        "permission": (("permission",), intern),
+    }
+
+
+class Profile(Record):
+    """IAM user profile"""
+
+    __slots__ = ("edi_id", "idp_uid", "given_name", "family_name", "common_name", "email")
+    _fields = {
+        "edi_id": (("edi_id", "sub"), None),
+        "idp_uid": (("idp_uid",), None),
+        "given_name": (("given_name",), None),
+        "family_name": (("family_name",), None),
+        "common_name": (("common_name", "cn"), None),
+        "email": (("email",), None),
+    }
+
+
+class Group(Record):
+    """IAM group"""
+
+    __slots__ = ("edi_id", "name", "description", "members")
+    _fields = {
+        "edi_id": (("group_edi_id", "edi_id"), None),
+        "name": (("group_name", "name"), None),
+        "description": (("group_description", "description"), None),
+        "members": (("members",), lambda members: tuple(intern(member) for member in members)),
+    }
+
+
+class IssuedToken(Record):
+    """EDI token issued by the IAM token API. Token claims are decoded, without verification, on first access."""
+
+    __slots__ = ("token", "_claims")
+    _fields = {
+        "token": (("edi-token", "token"), None),
+    }
+
+    def __init__(self, raw: dict | str):
+        super().__init__({"token": raw} if isinstance(raw, str) else raw)
+
+    @property
+    def claims(self) -> Token:
+        try:
+            return self._claims
+        except AttributeError:
+            claims = Token(self.token)
+            object.__setattr__(self, "_claims", claims)
+            return claims
+
+    @property
+    def subject(self) -> str:
+        return self.claims.subject
+
+    @property
+    def principals(self) -> list:
+        return self.claims.principals
+
+    @property
+    def expiry(self) -> int:
+        return self.claims.expiry
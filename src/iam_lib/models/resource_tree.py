@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    resource_tree
+
+:Synopsis:
+    Indexed, incrementally updatable IAM resource tree
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from typing import Iterator
+
+import daiquiri
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class ResourceNode:
+    """A resource of a ResourceTree. Attributes are maintained by the tree and must not be changed directly."""
+
+    __slots__ = ("key", "label", "type", "parent", "children", "principals", "path", "size")
+
+    def __init__(self, key: str, label: str, resource_type: str, parent: str = None, principals: list = None):
+        self.key = key
+        self.label = label
+        self.type = resource_type
+        self.parent = parent
+        self.children = []
+        self.principals = principals if principals is not None else []
+        self.path = ()  # Keys of the ancestors, from the root down to the parent
+        self.size = 1  # Number of resources in the subtree rooted at this resource
+
+    def __repr__(self) -> str:
+        return f"ResourceNode(key={self.key!r}, label={self.label!r}, type={self.type!r}, parent={self.parent!r})"
+
+
+class ResourceTree:
+    """Index of one or more IAM resource trees.
+
+    Built from the JSON of ResourceClient.read_resource with descendants and/or ancestors, the index answers parent,
+    ancestor path, subtree size, and resource type lookups in constant time and iterates descendants without further
+    requests. A tree attached to a ResourceClient is updated in place by that client's create_resource,
+    update_resource, and delete_resource calls.
+
+    Args:
+        data (dict | list): resource tree or list of resource trees, as decoded from the IAM JSON response (optional)
+
+    """
+
+    def __init__(self, data: dict | list = None):
+        self._nodes = {}
+        self._roots = []
+        self._types = {}
+        if data is not None:
+            self.load(data)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, resource_key: str) -> bool:
+        return resource_key in self._nodes
+
+    def __getitem__(self, resource_key: str) -> ResourceNode:
+        return self._nodes[resource_key]
+
+    def __iter__(self) -> Iterator[ResourceNode]:
+        for root in tuple(self._roots):
+            yield from self.descendants(root, include_self=True)
+
+    @property
+    def roots(self) -> tuple[str, ...]:
+        return tuple(self._roots)
+
+    def load(self, data: dict | list):
+        """Add the resources of a resource tree, or list of resource trees, replacing those already present
+
+        Args:
+            data (dict | list): resource tree(s) with "key", "label", "type", "children", and "principals" members
+        """
+        stack = [(node, None) for node in reversed(data if isinstance(data, list) else [data])]
+        while stack:
+            item, parent = stack.pop()
+            key = item["key"]
+            if parent is None and key in self._nodes:
+                parent = self._nodes[key].parent  # Keep the place of a reloaded subtree
+            if key in self._nodes:
+                self.update(key, item.get("label"), item.get("type"), parent)
+                if "principals" in item:
+                    self._nodes[key].principals = item["principals"]
+            else:
+                self.add(key, item.get("label"), item.get("type"), parent, item.get("principals"))
+            stack.extend((child, key) for child in reversed(item.get("children") or ()))
+
+    def parent(self, resource_key: str) -> str | None:
+        """Return the key of the parent resource, or None for a root"""
+        return self._nodes[resource_key].parent
+
+    def ancestors(self, resource_key: str) -> tuple[str, ...]:
+        """Return the keys of the ancestors of a resource, from the root down to its parent"""
+        return self._nodes[resource_key].path
+
+    def descendants(self, resource_key: str, include_self: bool = False) -> Iterator[ResourceNode]:
+        """Iterate over the descendants of a resource in depth-first, pre-order
+
+        Args:
+            resource_key (str): unique identifier for the resource
+            include_self (bool): yield the resource itself first (defaults to False)
+        """
+        node = self._nodes[resource_key]
+        stack = [node] if include_self else [self._nodes[key] for key in reversed(node.children)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(self._nodes[key] for key in reversed(node.children))
+
+    def subtree_size(self, resource_key: str) -> int:
+        """Return the number of resources in the subtree rooted at the resource, including the resource"""
+        return self._nodes[resource_key].size
+
+    def by_type(self, resource_type: str) -> frozenset[str]:
+        """Return the keys of the resources of a resource type"""
+        return frozenset(self._types.get(resource_type, ()))
+
+    def add(
+        self,
+        resource_key: str,
+        resource_label: str,
+        resource_type: str,
+        parent_resource_key: str = None,
+        principals: list = None,
+    ) -> ResourceNode:
+        """Add a resource as a leaf of its parent, or as a new root
+
+        Raises:
+            KeyError: If the resource already exists or the parent does not
+        """
+        if resource_key in self._nodes:
+            raise KeyError(f"Resource '{resource_key}' already exists")
+        node = ResourceNode(resource_key, resource_label, resource_type, parent_resource_key, principals)
+        if parent_resource_key is None:
+            self._roots.append(resource_key)
+        else:
+            parent = self._nodes[parent_resource_key]
+            parent.children.append(resource_key)
+            node.path = parent.path + (parent_resource_key,)
+            for key in node.path:
+                self._nodes[key].size += 1
+        self._nodes[resource_key] = node
+        self._types.setdefault(resource_type, set()).add(resource_key)
+        return node
+
+    def update(
+        self,
+        resource_key: str,
+        resource_label: str,
+        resource_type: str,
+        parent_resource_key: str = None,
+    ) -> ResourceNode:
+        """Update a resource, moving its subtree if its parent changes
+
+        Raises:
+            KeyError: If the resource or the new parent does not exist
+            ValueError: If the new parent is the resource or one of its descendants
+        """
+        node = self._nodes[resource_key]
+        if node.type != resource_type:
+            self._discard_type(node)
+            self._types.setdefault(resource_type, set()).add(resource_key)
+        node.label = resource_label
+        node.type = resource_type
+        if node.parent != parent_resource_key:
+            self._move(node, parent_resource_key)
+        return node
+
+    def remove(self, resource_key: str) -> int:
+        """Remove a resource together with its descendants
+
+        Returns:
+            int: number of resources removed
+        """
+        node = self._nodes[resource_key]
+        self._detach(node)
+        removed = list(self.descendants(resource_key, include_self=True))
+        for descendant in removed:
+            self._discard_type(descendant)
+            del self._nodes[descendant.key]
+        return len(removed)
+
+    def _move(self, node: ResourceNode, parent_resource_key: str | None):
+        if parent_resource_key is not None:
+            parent = self._nodes[parent_resource_key]
+            if parent_resource_key == node.key or node.key in parent.path:
+                raise ValueError(f"Resource '{node.key}' cannot become a descendant of itself")
+        self._detach(node)
+        node.parent = parent_resource_key
+        if parent_resource_key is None:
+            self._roots.append(node.key)
+            node.path = ()
+        else:
+            parent.children.append(node.key)
+            node.path = parent.path + (parent_resource_key,)
+            for key in node.path:
+                self._nodes[key].size += node.size
+        for descendant in self.descendants(node.key):
+            descendant.path = self._nodes[descendant.parent].path + (descendant.parent,)
+
+    def _detach(self, node: ResourceNode):
+        if node.parent is None:
+            self._roots.remove(node.key)
+            return
+        self._nodes[node.parent].children.remove(node.key)
+        for key in node.path:
+            self._nodes[key].size -= node.size
+
+    def _discard_type(self, node: ResourceNode):
+        keys = self._types.get(node.type)
+        if keys is not None:
+            keys.discard(node.key)
+            if not keys:
+                del self._types[node.type]
@@ -14,35 +14,318 @@
 :Created:
     5/13/25
 """
+import codecs
 import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, TYPE_CHECKING
+from xml.etree import ElementTree
 
 import daiquiri
 
-import iam_lib
-from iam_lib.api.client import Client
 import iam_lib.exceptions
+from iam_lib.models.codec import get_codec
+
+if TYPE_CHECKING:
+    import requests
+
+    from iam_lib.api.client import Client
 
 
 logger = daiquiri.getLogger(__name__)
 
 
-def response_data(client: Client) -> str | dict:
+def response_data(client: "Client", response: "requests.Response" = None, structured: bool = False) -> str | dict:
     """Returns the data structure in a format determined by the accept type
 
     Args:
         client (iam_lib.client.Client): IAM REST API client
+        response (requests.Response): response to convert (defaults to the client's last response)
+        structured (bool): parse an XML response into the data structure of the JSON response (see xml_data)
+            instead of returning the XML str (defaults to False)
 
     Returns:
         response_data_structure (str | dict): the data structure
 
     Raises:
         iam_lib.errors.IAMJSONDecodeError: On invalid JSON
+        iam_lib.errors.IAMXMLDecodeError: On invalid XML
 
     """
+    if response is None: response = client.response
     if client.accept == "application/json":
+        codec = get_codec()
         try:
-            return json.loads(client.response.text)
-        except json.decoder.JSONDecodeError as e:
+            return codec.loads(response.content)  # Decoded from bytes, without an intermediate str
+        except codec.errors as e:
             raise iam_lib.exceptions.IAMJSONDecodeError(e)
+    elif structured:
+        return xml_data(response.content)
     else:
-        return client.response.text  # As XML str
\ No newline at end of file
+        return response.text  # As XML str
+
+
+def iter_items(accept: str, chunks: Iterable[bytes]) -> Iterator:
+    """Yield the items of a list response read incrementally from chunks of bytes, as iter_json_items for the JSON
+    accept type and as iter_xml_items otherwise"""
+    if accept == "application/json":
+        return iter_json_items(chunks)
+    return iter_xml_items(chunks)
+
+
+def aiter_items(accept: str, chunks: AsyncIterable[bytes]) -> AsyncIterator:
+    """Asynchronous form of iter_items"""
+    if accept == "application/json":
+        return aiter_json_items(chunks)
+    return aiter_xml_items(chunks)
+
+
+def iter_json_items(chunks: Iterable[bytes]) -> Iterator:
+    """Yield the items of a JSON array document read incrementally from chunks of bytes
+
+    Only the current chunk and the item being decoded are held in memory, so memory use is bounded by the largest item
+    rather than by the document. A document that is not an array is decoded whole and yielded as a single item.
+
+    Args:
+        chunks (Iterable[bytes]): the response body, e.g., requests.Response.iter_content()
+
+    Yields:
+        item: each decoded array item
+
+    Raises:
+        iam_lib.errors.IAMJSONDecodeError: On invalid JSON
+    """
+    parser = _JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_items(chunks: AsyncIterable[bytes]) -> AsyncIterator:
+    """Asynchronous form of iter_json_items, e.g., for httpx.Response.aiter_bytes()"""
+    parser = _JSONArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+class _JSONArrayParser:
+    # Push parser splitting a JSON array into its items with json.JSONDecoder.raw_decode
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"  # start, first, item, separator, end, or document (not an array)
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        self._buffer += self._text.decode(chunk, final=final)
+        items = []
+        buffer = self._buffer
+        position = 0
+        try:
+            while True:
+                position = _skip_whitespace(buffer, position)
+                if position == len(buffer) or self._state == "document":
+                    break
+                if self._state == "start":
+                    if buffer[position] != "[":
+                        self._state = "document"
+                        break
+                    position += 1
+                    self._state = "first"
+                elif self._state in ("first", "item"):
+                    if self._state == "first" and buffer[position] == "]":
+                        position += 1
+                        self._state = "end"
+                        continue
+                    try:
+                        item, end = self._decoder.raw_decode(buffer, position)
+                    except json.decoder.JSONDecodeError:
+                        if final:
+                            raise
+                        break  # Incomplete item: wait for more data
+                    if not final and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                        break  # A number, e.g., "-1." of "-1.5e3", may continue in the next chunk
+                    items.append(item)
+                    position = end
+                    self._state = "separator"
+                elif self._state == "separator":
+                    if buffer[position] == ",":
+                        self._state = "item"
+                    elif buffer[position] == "]":
+                        self._state = "end"
+                    else:
+                        raise json.decoder.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+                    position += 1
+                else:
+                    raise json.decoder.JSONDecodeError("Extra data", buffer, position)
+        except json.decoder.JSONDecodeError as e:
+            raise iam_lib.exceptions.IAMJSONDecodeError(e)
+        self._buffer = buffer[position:]
+        return items
+
+    def close(self) -> list:
+        items = self.feed(b"", final=True)
+        if self._state == "document":
+            codec = get_codec()
+            try:
+                items.append(codec.loads(self._buffer))
+            except codec.errors as e:
+                raise iam_lib.exceptions.IAMJSONDecodeError(e)
+        elif self._state != "end":
+            raise iam_lib.exceptions.IAMJSONDecodeError("Unterminated JSON array")
+        self._buffer = ""
+        return items
+
+
+_DELIMITERS = frozenset(" \t\n\r,]")
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position] in " \t\n\r":
+        position += 1
+    return position
+
+
+# XML elements whose children are the items of a list, even when there are fewer than two of them
+LIST_ELEMENTS = frozenset({
+    "ancestors",
+    "children",
+    "descendants",
+    "groups",
+    "members",
+    "principals",
+    "profiles",
+    "resources",
+    "rules",
+})
+
+
+def xml_data(content: bytes | str):
+    """Parse an XML document into the data structure of the equivalent JSON document
+
+    Elements are converted as follows: an element with child elements becomes a dict of its attributes and children
+    (a repeated child becomes a list), unless it is a list, i.e., it is named in LIST_ELEMENTS or has two or more
+    children of the same name, in which case it becomes the list of its converted children; an element without
+    child elements becomes its stripped text, or None if empty, or a dict of its attributes and "text". Namespaces
+    are dropped from element names and values are kept as strings.
+
+    Args:
+        content (bytes | str): XML document
+
+    Returns:
+        data (dict | list | str | None): the data structure
+
+    Raises:
+        iam_lib.errors.IAMXMLDecodeError: On invalid XML
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
+    root = None
+    try:
+        parser.feed(content)
+        parser.close()
+        for _, element in parser.read_events():
+            root = element  # The root element ends last
+    except ElementTree.ParseError as e:
+        raise iam_lib.exceptions.IAMXMLDecodeError(e)
+    return _element_data(root)
+
+
+def iter_xml_items(chunks: Iterable[bytes]) -> Iterator:
+    """Yield the items of an XML list document read incrementally from chunks of bytes
+
+    Each child element of the root element is an item and is converted as by xml_data once its end tag has been read.
+    Converted elements are released, so memory use is bounded by the largest item rather than by the document.
+
+    Args:
+        chunks (Iterable[bytes]): the response body, e.g., requests.Response.iter_content()
+
+    Yields:
+        item: each converted item
+
+    Raises:
+        iam_lib.errors.IAMXMLDecodeError: On invalid XML
+    """
+    parser = _XMLListParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_xml_items(chunks: AsyncIterable[bytes]) -> AsyncIterator:
+    """Asynchronous form of iter_xml_items, e.g., for httpx.Response.aiter_bytes()"""
+    parser = _XMLListParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+class _XMLListParser:
+    # Push parser converting the child elements of the root element into items as they complete
+
+    def __init__(self):
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._root = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes) -> list:
+        try:
+            self._parser.feed(chunk)
+        except ElementTree.ParseError as e:
+            raise iam_lib.exceptions.IAMXMLDecodeError(e)
+        return self._items()
+
+    def close(self) -> list:
+        try:
+            self._parser.close()
+        except ElementTree.ParseError as e:
+            raise iam_lib.exceptions.IAMXMLDecodeError(e)
+        return self._items()
+
+    def _items(self) -> list:
+        items = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                self._depth += 1
+                continue
+            self._depth -= 1
+            if self._depth == 1:
+                items.append(_element_data(element))
+                self._root.remove(element)
+        return items
+
+
+def _element_data(element: ElementTree.Element):
+    children = list(element)
+    name = _local_name(element.tag)
+    if not children:
+        if name in LIST_ELEMENTS:
+            return []
+        text = element.text.strip() if element.text else ""
+        if element.attrib:
+            return {**element.attrib, "text": text} if text else dict(element.attrib)
+        return text or None
+    names = [_local_name(child.tag) for child in children]
+    if name in LIST_ELEMENTS or (len(children) > 1 and len(set(names)) == 1):
+        return [_element_data(child) for child in children]
+    data = dict(element.attrib)
+    repeated = set()
+    for child_name, child in zip(names, children):
+        value = _element_data(child)
+        if child_name in repeated:
+            data[child_name].append(value)
+        elif child_name in data:
+            data[child_name] = [data[child_name], value]
+            repeated.add(child_name)
+        else:
+            data[child_name] = value
+    return data
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
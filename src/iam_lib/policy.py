@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    policy
+
+:Synopsis:
+    In-process evaluation of IAM access control rules
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import threading
+import time
+from typing import Callable, Iterable
+
+import daiquiri
+
+from iam_lib.models.permission import Permission
+from iam_lib.token import Token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+# Rule permissions as granted sets: each permission implies the permissions below it
+GRANTS = {
+    "none": Permission.NONE,
+    "read": Permission.READ,
+    "write": Permission.READ | Permission.WRITE,
+    "change": Permission.READ | Permission.WRITE | Permission.CHANGE_PERMISSION,
+    "changepermission": Permission.READ | Permission.WRITE | Permission.CHANGE_PERMISSION,
+}
+
+
+def grant(permission: str | Permission) -> Permission:
+    """Return the set of permissions granted by a rule permission
+
+    Args:
+        permission (str | Permission): rule permission, e.g., "read", "WRITE", "changePermission", or a Permission
+
+    Returns:
+        Permission: the permission together with every permission it implies
+
+    Raises:
+        ValueError: On an unknown permission
+    """
+    if isinstance(permission, Permission):
+        permission = {
+            Permission.NONE: "none",
+            Permission.READ: "read",
+            Permission.WRITE: "write",
+            Permission.CHANGE_PERMISSION: "changePermission",
+        }[permission]
+    try:
+        return GRANTS[permission.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown permission '{permission}'")
+
+
+def token_principals(token: str) -> tuple[str, ...]:
+    """Return the principals a token acts as: its subject followed by its group principals"""
+    decoded = Token(token)
+    return (decoded.subject, *(decoded.principals or ()))
+
+
+class PolicyIndex:
+    """Immutable index of access control rules: resource key to principal to granted permissions.
+
+    Args:
+        rules (Iterable[tuple[str, str, str | Permission]]): (resource_key, principal, permission) rules
+        parents (dict): resource key to parent resource key (optional)
+
+    """
+
+    __slots__ = ("_acl", "_parents")
+
+    def __init__(self, rules: Iterable[tuple[str, str, str | Permission]] = (), parents: dict = None):
+        acl = {}
+        for resource_key, principal, permission in rules:
+            principals = acl.setdefault(resource_key, {})
+            principals[principal] = principals.get(principal, Permission.NONE) | grant(permission)
+        self._acl = acl
+        self._parents = dict(parents or {})
+
+    def __len__(self) -> int:
+        return len(self._acl)
+
+    def __contains__(self, resource_key: str) -> bool:
+        return resource_key in self._acl
+
+    @property
+    def parents(self) -> dict:
+        """Resource key to parent resource key of the loaded resource trees"""
+        return dict(self._parents)
+
+    def permissions(self, principals: Iterable[str], resource_key: str) -> Permission:
+        """Return the union of permissions granted to the principals on the resource"""
+        acl = self._acl.get(resource_key)
+        granted = Permission.NONE
+        if acl:
+            for principal in principals:
+                granted |= acl.get(principal, Permission.NONE)
+        return granted
+
+    def rules(self, resource_key: str) -> dict[str, Permission]:
+        """Return the principals and their granted permissions on the resource"""
+        return dict(self._acl.get(resource_key, {}))
+
+
+class PolicyEngine:
+    """Local authorization decisions from IAM access control rules (ACRs).
+
+    Rules are loaded once from the IAM service and then evaluated in-process, giving the same decision as
+    AuthorizedClient.is_authorized for the loaded resources: a request is authorized if at least one of the principals
+    holds a rule on the resource whose permission is, or implies, the requested permission (changePermission implies
+    write implies read). Principals are matched exactly as given; use token_principals() for those of a token.
+
+    Rules are read from the resource trees of the given root resources (ResourceClient.read_resource with descendants),
+    from RuleClient.read_resource_rules for tree resources that carry no rules, and optionally from
+    RuleClient.read_principal_rules. Rules are reloaded in the background once refresh_interval has passed; decisions
+    are answered from the previous rules until the reload completes.
+
+    Args:
+        resource_client (ResourceClient): client used to read resource trees
+        rule_client (RuleClient): client used to read rules
+        resource_keys (Iterable[str]): keys of the root resources whose trees are loaded
+        principal_rules (bool): also load the rules of RuleClient.read_principal_rules (defaults to False)
+        refresh_interval (float): seconds between rule reloads (defaults to 60); None disables reloading
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(
+        self,
+        resource_client,
+        rule_client,
+        resource_keys: Iterable[str] = (),
+        principal_rules: bool = False,
+        refresh_interval: float | None = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._resource_client = resource_client
+        self._rule_client = rule_client
+        self._resource_keys = tuple(resource_keys)
+        self._principal_rules = principal_rules
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._index = PolicyIndex()
+        self._loaded = None
+        self._refreshing = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> PolicyIndex:
+        return self._index
+
+    def load(self) -> PolicyIndex:
+        """Load the rules from the IAM service and replace the index
+
+        Returns:
+            PolicyIndex: the new index
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+        """
+        rules = []
+        parents = {}
+        for resource_key in self._resource_keys:
+            tree = self._resource_client.read_resource(resource_key, descendants=True)
+            for node, parent in _walk(tree):
+                key = node["key"]
+                parents[key] = parent
+                if "principals" in node:
+                    rules.extend((key, rule["edi_id"], rule["permission"]) for rule in node["principals"])
+                else:
+                    rules.extend(_rules(self._rule_client.read_resource_rules(key)))
+        if self._principal_rules:
+            rules.extend(_rules(self._rule_client.read_principal_rules()))
+        index = PolicyIndex(rules, parents)
+        self._index = index  # Atomic swap; readers see either the old or the new index
+        self._loaded = self._clock()
+        logger.debug(f"Loaded access control rules of {len(index)} resources")
+        return index
+
+    def is_authorized(self, principals: Iterable[str], resource_key: str, permission: str | Permission) -> bool:
+        """Test if at least one principal is authorized to access the resource at the given permission
+
+        Args:
+            principals (Iterable[str]): principals of the request (see token_principals)
+            resource_key (str): unique identifier for the resource
+            permission (str | Permission): IAM permission (read, write, or changePermission)
+
+        Returns:
+            Boolean: True if at least one principal is authorized to access the resource
+        """
+        self._refresh_if_due()
+        required = grant(permission)
+        return required != Permission.NONE and required in self._index.permissions(principals, resource_key)
+
+    def effective_permission(self, principals: Iterable[str], resource_key: str) -> Permission:
+        """Return the highest permission the principals hold on the resource
+
+        Args:
+            principals (Iterable[str]): principals of the request (see token_principals)
+            resource_key (str): unique identifier for the resource
+
+        Returns:
+            Permission: READ, WRITE, CHANGE_PERMISSION, or NONE
+        """
+        self._refresh_if_due()
+        granted = self._index.permissions(principals, resource_key)
+        for permission in (Permission.CHANGE_PERMISSION, Permission.WRITE, Permission.READ):
+            if permission in granted:
+                return permission
+        return Permission.NONE
+
+    def close(self):
+        """Wait for a running background reload to finish"""
+        with self._lock:
+            refreshing = self._refreshing
+        if refreshing is not None:
+            refreshing.join()
+
+    def _refresh_if_due(self):
+        if self._loaded is None:
+            with self._lock:
+                if self._loaded is None:
+                    self.load()
+            return
+        if self.refresh_interval is None or self._clock() - self._loaded < self.refresh_interval:
+            return
+        with self._lock:
+            if self._refreshing is not None:
+                return
+            self._refreshing = threading.Thread(target=self._refresh, name="iam_lib_policy_refresh", daemon=True)
+            self._refreshing.start()
+
+    def _refresh(self):
+        try:
+            self.load()
+        except Exception as e:
+            logger.warning(f"Reload of access control rules failed: {e}")
+            self._loaded = self._clock()  # Keep serving the previous rules until the next interval
+        finally:
+            with self._lock:
+                self._refreshing = None
+
+
+def _walk(tree, parent: str = None):
+    # Yield (node, parent_key) for every node of a resource tree or list of trees
+    stack = [(node, parent) for node in reversed(tree if isinstance(tree, list) else [tree])]
+    while stack:
+        node, parent = stack.pop()
+        yield node, parent
+        stack.extend((child, node["key"]) for child in reversed(node.get("children") or ()))
+
+
+def _rules(rules) -> list[tuple[str, str, str]]:
+    # Normalize rules read from the rule API into (resource_key, principal, permission)
+    if isinstance(rules, dict):
+        rules = rules.get("rules", [rules])
+    return [
+        (rule["resource_key"], rule.get("principal", rule.get("edi_id")), rule["permission"])
+        for rule in rules or ()
+    ]
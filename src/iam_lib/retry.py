@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    retry
+
+:Synopsis:
+    Retry policy of IAM REST API requests failing to connect or throttled: exponential backoff with full jitter, an
+    overall deadline, a process-wide retry budget, and Retry-After back-off windows shared by all clients
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from collections import namedtuple
+import email.utils
+import random
+import threading
+import time
+from typing import Callable
+
+import daiquiri
+
+import iam_lib.exceptions
+
+logger = daiquiri.getLogger(__name__)
+
+RetryBudgetInfo = namedtuple("RetryBudgetInfo", ["retries", "denied", "tokens", "capacity"])
+ThrottleInfo = namedtuple("ThrottleInfo", ["deferrals", "waits", "throttled"])
+
+IDEMPOTENT_VERBS = frozenset(("get", "put", "delete"))
+RETRY_STATUSES = frozenset((429, 502, 503, 504))
+UNPROCESSED_STATUSES = frozenset((429, 503))  # The service declined the request without processing it
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """Return the seconds to wait of a Retry-After header value, delay-seconds or an HTTP date, or None if absent or
+    malformed
+
+    Args:
+        value (str): Retry-After header value
+        now (Callable): wall-clock time source, as HTTP dates (defaults to time.time)
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring malformed Retry-After: {value}")
+        return None
+    if date.tzinfo is None:
+        return None  # Not an HTTP date, which is always GMT
+    return max(0.0, date.timestamp() - now())
+
+
+class RetryBudget:
+    """Token bucket limiting the retries of all clients of a process.
+
+    Each retry takes one token; tokens are added back at refill_rate per second, up to capacity. When the IAM service
+    is down, the clients of a process together retry at most capacity times at once and refill_rate times per second
+    from then on, rather than multiplying the load on the service by the number of attempts per request. First
+    attempts are never limited.
+
+    Args:
+        capacity (float): maximum number of tokens, i.e., of retries in a burst (defaults to 10)
+        refill_rate (float): tokens added per second (defaults to 1)
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(self, capacity: float = 10, refill_rate: float = 1, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._denied = 0
+
+    def acquire(self) -> bool:
+        """Take a token for one retry; return False, and take none, if the budget is spent"""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self._denied += 1
+                return False
+            self._tokens -= 1
+            self._retries += 1
+            return True
+
+    def budget_info(self) -> RetryBudgetInfo:
+        """Return counters for monitoring: retries allowed, retries denied, tokens left, and capacity"""
+        with self._lock:
+            self._refill()
+            return RetryBudgetInfo(self._retries, self._denied, self._tokens, self.capacity)
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+
+retry_budget = RetryBudget()
+
+
+class Throttle:
+    """Back-off windows of IAM services, by origin (scheme://host), shared by all clients of a process.
+
+    A client throttled by a service (429 Too Many Requests, or a Retry-After header) opens or extends the window of
+    the service; until it closes, every request of every client to that service waits for it before being sent, so
+    that the clients of a process slow down together instead of each learning of the throttling from a response of
+    its own.
+
+    Args:
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._windows = {}  # End of the back-off window, by origin
+        self._lock = threading.Lock()
+        self._deferrals = 0
+        self._waits = 0
+
+    def defer(self, origin: str, seconds: float):
+        """Extend the back-off window of the origin to at least seconds from now"""
+        with self._lock:
+            until = self._clock() + seconds
+            if until > self._windows.get(origin, 0.0):
+                self._windows[origin] = until
+            self._deferrals += 1
+
+    def remaining(self, origin: str) -> float:
+        """Return the seconds left of the back-off window of the origin, 0 if none is open"""
+        with self._lock:
+            until = self._windows.get(origin)
+            if until is None:
+                return 0.0
+            remaining = until - self._clock()
+            if remaining <= 0:
+                del self._windows[origin]
+                return 0.0
+            self._waits += 1
+            return remaining
+
+    def throttle_info(self) -> ThrottleInfo:
+        """Return counters for monitoring: windows opened or extended, requests delayed, origins throttled now"""
+        with self._lock:
+            now = self._clock()
+            return ThrottleInfo(self._deferrals, self._waits, sum(until > now for until in self._windows.values()))
+
+
+throttle = Throttle()
+
+
+class RetryPolicy:
+    """When and how long to wait before sending a request again after it failed to connect (IAMRequestError), or the
+    service answered with a transient error status (429, 502, 503, or 504).
+
+    The n-th retry waits a random delay of up to base_delay * 2 ** (n - 1) seconds, capped at max_delay ("full
+    jitter"), so that clients failing together do not retry together. Retries stop after attempts attempts in all,
+    when the next retry would start after deadline seconds from the first attempt, or when the retry budget is spent.
+
+    Requests of the verbs in retry_verbs, which are idempotent, are retried after any request error or transient
+    status. Other requests, i.e., POST, are retried only if the connection was never established or the service
+    declined the request (429 or 503), so that a request the service may have processed is not sent twice.
+
+    A Retry-After header of a transient response sets the delay before the retry instead of the backoff. Throttling
+    (a 429 response, or any Retry-After header) also opens the back-off window of the service in throttle, which the
+    requests of all clients sharing it wait out before being sent; a request whose deadline ends first fails without
+    being sent.
+
+    Args:
+        attempts (int): maximum number of attempts, including the first (defaults to 3)
+        base_delay (float): maximum delay in seconds before the first retry (defaults to 0.5)
+        max_delay (float): cap of the maximum delay in seconds (defaults to 10)
+        deadline (float): seconds from the first attempt after which no retry starts, or None (defaults to 30)
+        retry_verbs (frozenset): verbs retried after any request error (defaults to GET, PUT, and DELETE)
+        budget (RetryBudget): retry budget (defaults to the process-wide budget; None for no budget)
+        throttle (Throttle): shared back-off windows (defaults to the process-wide windows; None to share none)
+        retry_statuses (frozenset): response status codes retried (defaults to 429, 502, 503, and 504)
+        clock (Callable): monotonic time source (defaults to time.monotonic)
+        sleep (Callable): waits a number of seconds (defaults to time.sleep, or asyncio.sleep in asyncio clients)
+        jitter (Callable): returns a random number in [0, 1) (defaults to random.random)
+
+    """
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            base_delay: float = 0.5,
+            max_delay: float = 10,
+            deadline: float | None = 30,
+            retry_verbs: frozenset = IDEMPOTENT_VERBS,
+            budget: RetryBudget | None = retry_budget,
+            throttle: Throttle | None = throttle,
+            retry_statuses: frozenset = RETRY_STATUSES,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = None,
+            jitter: Callable[[], float] = random.random,
+    ):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_verbs = frozenset(retry_verbs)
+        self.budget = budget
+        self.throttle = throttle
+        self.retry_statuses = frozenset(retry_statuses)
+        self.clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+
+    def backoff(self, retry: int) -> float:
+        """Return a random delay before the retry-th retry (from 1)"""
+        return self._jitter() * min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+
+    def delay(
+            self,
+            verb: str,
+            failures: int,
+            elapsed: float,
+            connected: bool = True,
+            retry_after: float = None,
+    ) -> float | None:
+        """Return the delay before retrying a failed request, or None if it is not retried
+
+        Args:
+            verb (str): HTTP verb of the request
+            failures (int): number of failed attempts so far
+            elapsed (float): seconds since the first attempt
+            connected (bool): whether the service may have received the last attempt (defaults to True)
+            retry_after (float): delay requested by the service (optional)
+        """
+        if failures >= self.attempts:
+            return None
+        if connected and verb not in self.retry_verbs:
+            return None
+        delay = self.backoff(failures) if retry_after is None else retry_after
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+        if self.budget is not None and not self.budget.acquire():
+            logger.warning("Retry budget spent: not retrying")
+            return None
+        return delay
+
+    def response_delay(
+            self,
+            origin: str,
+            verb: str,
+            status: int,
+            retry_after: float | None,
+            failures: int,
+            elapsed: float,
+    ) -> float | None:
+        """Return the delay before retrying a request answered with an error status, or None if it is not retried,
+        opening the back-off window of the service if it throttles requests
+
+        Args:
+            origin (str): service origin (scheme://host)
+            verb (str): HTTP verb of the request
+            status (int): response status code
+            retry_after (float): seconds of the response's Retry-After header (optional)
+            failures (int): number of failed attempts so far
+            elapsed (float): seconds since the first attempt
+        """
+        if status not in self.retry_statuses:
+            return None
+        delay = self.delay(verb, failures, elapsed, status not in UNPROCESSED_STATUSES, retry_after)
+        if self.throttle is not None and (retry_after is not None or status == 429):
+            self.throttle.defer(origin, retry_after if retry_after is not None else delay or self.backoff(failures))
+        return delay
+
+    def wait(self, origin: str, elapsed: float) -> float:
+        """Return the seconds a request to the service waits out its back-off window before being sent
+
+        Args:
+            origin (str): service origin (scheme://host)
+            elapsed (float): seconds since the first attempt
+
+        Raises:
+            iam_lib.exceptions.IAMThrottledError: If the back-off window ends after the deadline
+        """
+        if self.throttle is None:
+            return 0.0
+        wait = self.throttle.remaining(origin)
+        if wait and self.deadline is not None and elapsed + wait >= self.deadline:
+            msg = f"IAM service {origin} throttled for {wait:.1f} more seconds, past the retry deadline"
+            raise iam_lib.exceptions.IAMThrottledError(msg, wait)
+        return wait
+
+    def sleep(self, delay: float):
+        if self._sleep is None:
+            time.sleep(delay)
+        else:
+            self._sleep(delay)
+
+    async def asleep(self, delay: float):
+        if self._sleep is None:
+            import asyncio  # Only asyncio clients load it
+            await asyncio.sleep(delay)
+        else:
+            self._sleep(delay)
+
+
+retry_policy = RetryPolicy()
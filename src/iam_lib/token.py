@@ -14,16 +14,219 @@
 :Created:
     5/10/25
 """
+from collections import namedtuple, OrderedDict
+import copy
+import hashlib
+import os
 from pathlib import Path
+import stat
+import threading
+import time
 
 import daiquiri
-import jwt
 
 import iam_lib.exceptions
 
 logger = daiquiri.getLogger(__name__)
 
 
+class _PublicKeyEntry:
+    __slots__ = ("key", "fingerprint", "inode", "mtime_ns", "checked")
+
+    def __init__(self, key, fingerprint: str, inode: int, mtime_ns: int, checked: float):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.inode = inode
+        self.mtime_ns = mtime_ns
+        self.checked = checked
+
+
+class PublicKeyCache:
+    """Process-wide cache of parsed token signing public keys.
+
+    Each PEM file is read and parsed once into a cryptography key object. The file is re-examined at most once per
+    check interval and reloaded only if its inode or modification time has changed, so a rotated key is picked up up
+    to check_interval seconds late; use a check interval of 0 to stat the file on every call.
+
+    Args:
+        check_interval (float): seconds between checks of a key file for changes (defaults to 5 seconds)
+
+    """
+
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, public_key_path: str):
+        """Return the parsed public key for the given path
+
+        Args:
+            public_key_path (str): path to token signing public key
+
+        Returns:
+            public_key: cryptography public key object
+
+        Raises:
+            iam_lib.exceptions.IAMInvalidPublicKey: If the file does not exist or is not a PEM public key
+        """
+        return self.get_entry(public_key_path).key
+
+    def fingerprint(self, public_key_path: str) -> str:
+        """Return the SHA-256 fingerprint of the public key for the given path"""
+        return self.get_entry(public_key_path).fingerprint
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_entry(self, public_key_path: str) -> _PublicKeyEntry:
+        """Return the cache entry for the given path, whose key and fingerprint always belong together
+
+        Args:
+            public_key_path (str): path to token signing public key
+
+        Returns:
+            entry: cache entry with "key" and "fingerprint" attributes
+
+        Raises:
+            iam_lib.exceptions.IAMInvalidPublicKey: If the file does not exist or is not a PEM public key
+        """
+        entry = self._entries.get(public_key_path)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked < self.check_interval:
+            return entry
+        with self._lock:
+            try:
+                st = os.stat(public_key_path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
+                self._entries.pop(public_key_path, None)
+                msg = f"Public key file '{public_key_path}' does not exist"
+                raise iam_lib.exceptions.IAMInvalidPublicKey(msg)
+            entry = self._entries.get(public_key_path)
+            if entry is not None and (entry.inode, entry.mtime_ns) == (st.st_ino, st.st_mtime_ns):
+                entry.checked = now
+                return entry
+            try:
+                pem = Path(public_key_path).read_bytes()
+            except OSError as e:
+                msg = f"Public key file '{public_key_path}' cannot be read: {e}"
+                raise iam_lib.exceptions.IAMInvalidPublicKey(msg)
+            from cryptography.exceptions import UnsupportedAlgorithm  # Loaded with the first key rather than on import
+            from cryptography.hazmat.primitives import serialization
+            try:
+                key = serialization.load_pem_public_key(pem)
+            except (ValueError, UnsupportedAlgorithm) as e:
+                msg = f"Public key file '{public_key_path}' is not a valid PEM public key: {e}"
+                raise iam_lib.exceptions.IAMInvalidPublicKey(msg)
+            der = key.public_bytes(serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+            entry = _PublicKeyEntry(key, hashlib.sha256(der).hexdigest(), st.st_ino, st.st_mtime_ns, now)
+            self._entries[public_key_path] = entry
+            logger.debug(f"Loaded public key '{public_key_path}'")
+            return entry
+
+
+public_keys = PublicKeyCache()
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of signature-verified tokens.
+
+    Entries are keyed by the SHA-256 digest of the token together with the fingerprint of the verifying public key and
+    the signing algorithm, and expire at the token's "exp" claim. Tokens without an "exp" claim are verified on every
+    call and never cached. Callers receive a copy of the cached payload, so they cannot alter it for later callers.
+
+    Args:
+        maxsize (int): maximum number of verified tokens held (defaults to 1024)
+
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def validate(self, token: str, public_key_path: str, algorithm: str) -> dict:
+        """Verify the token signature and claims, or return the payload of a previously verified token
+
+        Args:
+            token (str): EDI IAM JWT token
+            public_key_path (str): path to token signing public key
+            algorithm (str): digital signing-algorithm
+
+        Returns:
+            payload (dict): verified token payload
+
+        Raises:
+            iam_lib.exceptions.IAMInvalidToken: On invalid token
+            iam_lib.exceptions.IAMInvalidPublicKey: On missing or malformed public key
+        """
+        entry = public_keys.get_entry(public_key_path)  # Verify and cache under the same key
+        public_key = entry.key
+        cache_key = (hashlib.sha256(token.encode("utf-8")).digest(), entry.fingerprint, algorithm)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                payload, expiry = entry
+                if time.time() < expiry:
+                    self._entries.move_to_end(cache_key)
+                    self._hits += 1
+                    return copy.deepcopy(payload)
+                del self._entries[cache_key]
+            self._misses += 1
+        import jwt
+        try:
+            payload = jwt.decode(token, public_key, algorithms=[algorithm])
+        except jwt.InvalidTokenError as e:
+            raise iam_lib.exceptions.IAMInvalidToken(f"Invalid token: {e}")
+        expiry = payload.get("exp")
+        if expiry is not None and self.maxsize > 0:
+            with self._lock:
+                self._entries[cache_key] = (copy.deepcopy(payload), expiry)
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return payload
+
+    def cache_info(self) -> CacheInfo:
+        """Return cache hit and miss statistics"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+verified_tokens = VerifiedTokenCache()
+
+
+def validate_token(token: str, public_key_path: str, algorithm: str) -> dict:
+    """Validate an EDI token through the process-wide verified token cache
+
+    Args:
+        token (str): EDI IAM JWT token
+        public_key_path (str): path to token signing public key
+        algorithm (str): digital signing-algorithm
+
+    Returns:
+        payload (dict): verified token payload
+
+    Raises:
+        iam_lib.exceptions.IAMInvalidToken: On invalid token
+    """
+    return verified_tokens.validate(token, public_key_path, algorithm)
+
+
 class Token:
     """EDI IAM JWT token decoder.
 
@@ -35,6 +238,7 @@ class Token:
     """
 
     def __init__(self, token: str):
+        import jwt  # Loaded with the first token rather than on import
         self.token = token
         self.header = jwt.get_unverified_header(token)
         self.payload = jwt.decode(token,  options={"verify_signature": False})
@@ -106,13 +310,7 @@ class Token:
     def validate(self, public_key_path: str, algorithm: str):
         """Validate EDI token
 
-            public_key (str): Public key
+            public_key_path (str): Path to public key
             algorithm (str): Digital signing-algorithm
         """
-        with open(Path(public_key_path), "r") as f:
-            public_key_text = f.read()
-            public_key = public_key_text.encode("utf-8")
-        try:
-            jwt.decode(self.token, public_key, algorithms=[algorithm])
-        except jwt.InvalidTokenError as e:
-            raise iam_lib.exceptions.IAMInvalidToken(f"Invalid token: {e}")
+        validate_token(self.token, public_key_path, algorithm)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    token_manager
+
+:Synopsis:
+    Ahead-of-expiry EDI token refresh shared by IAM clients
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import threading
+import time
+from typing import Callable
+
+import daiquiri
+
+import iam_lib.exceptions
+from iam_lib.models.records import IssuedToken
+from iam_lib.token import Token, validate_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class TokenManager:
+    """Keeps the EDI token of a group of clients valid by refreshing it ahead of its expiry.
+
+    The token is refreshed through EdiTokenClient.refresh_token by a background thread once the token is within
+    refresh_ahead seconds of its "exp" claim. Attached clients check the token before each request and, should the
+    background refresh not have completed by the time the token is within min_remaining seconds of expiry, refresh
+    it in the caller; so a request is never sent with a token that expires before the request can complete. Only one
+    refresh runs at a time: concurrent callers wait for it and share its result. The new token is verified and then
+    swapped into every attached client at once; requests already sent keep the previous token, which is still valid.
+
+    Asyncio clients may be attached as well; a refresh in the caller then briefly blocks the event loop, which the
+    background thread makes the exception.
+
+    Args:
+        token_client (EdiTokenClient): client, of the JSON accept type, used to refresh the token; it must not be
+            attached to the manager
+        token (str): current EDI token
+        refresh_ahead (float): seconds before expiry at which the token is refreshed (defaults to 300)
+        min_remaining (float): seconds of validity a request requires, at least the request timeout (defaults to 30)
+        retry_interval (float): seconds between background attempts after a failed refresh (defaults to 10)
+        clock (Callable): wall-clock time source, as the "exp" claim (defaults to time.time)
+
+    Raises:
+        iam_lib.exceptions.IAMInvalidAccept: If the token client does not use the JSON accept type
+        iam_lib.exceptions.IAMInvalidToken: If the token has no "exp" claim
+
+    """
+
+    def __init__(
+        self,
+        token_client,
+        token: str,
+        refresh_ahead: float = 300,
+        min_remaining: float = 30,
+        retry_interval: float = 10,
+        clock: Callable[[], float] = time.time,
+    ):
+        if token_client.accept != "application/json":
+            msg = "The token client of a TokenManager requires the JSON accept type"
+            raise iam_lib.exceptions.IAMInvalidAccept(msg)
+        self._token_client = token_client
+        self.refresh_ahead = refresh_ahead
+        self.min_remaining = min_remaining
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._clients = []
+        self._lock = threading.Lock()  # Guards the token and the attached clients
+        self._refresh_lock = threading.Lock()  # Single-flight refresh
+        self._closed = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._refreshes = 0
+        self._set_token(token)
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @property
+    def expiry(self) -> float:
+        return self._expiry
+
+    @property
+    def refreshes(self) -> int:
+        """Number of successful refreshes"""
+        return self._refreshes
+
+    def attach(self, *clients):
+        """Use the managed token in the clients and keep it current in them
+
+        Args:
+            clients (Client): IAM clients
+        """
+        with self._lock:
+            for client in clients:
+                if client is self._token_client:
+                    raise ValueError("The token client of a TokenManager cannot be attached to it")
+                client.token = self._token
+                client._token_manager = self
+                if client not in self._clients:
+                    self._clients.append(client)
+
+    def detach(self, client):
+        """Stop managing the token of a client, which keeps the current token"""
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+            client._token_manager = None
+
+    def start(self) -> "TokenManager":
+        """Start the background refresh thread
+
+        Returns:
+            self
+        """
+        with self._lock:
+            if self._thread is None:
+                self._closed.clear()
+                self._thread = threading.Thread(target=self._run, name="iam_lib_token_refresh", daemon=True)
+                self._thread.start()
+        return self
+
+    def close(self):
+        """Stop the background refresh thread and wait for it to finish"""
+        self._closed.set()
+        self._wakeup.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def ensure_fresh(self):
+        """Refresh the token in the caller if it has fewer than min_remaining seconds of validity left
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMInvalidToken: If the refreshed token is invalid
+        """
+        if self._expiry - self._clock() < self.min_remaining:
+            self.refresh(self.min_remaining)
+
+    def refresh(self, ahead: float = None) -> str:
+        """Refresh the token unless it has at least ahead seconds of validity left
+
+        Only one refresh runs at a time; a caller arriving during a refresh waits for it and returns its token.
+
+        Args:
+            ahead (float): seconds of validity below which the token is refreshed (defaults to refresh_ahead)
+
+        Returns:
+            str: the current token
+
+        Raises:
+            iam_lib.exceptions.IAMRequestError: On HTTP request error
+            iam_lib.exceptions.IAMResponseError: On non-200 response
+            iam_lib.exceptions.IAMInvalidToken: If the refreshed token is invalid
+        """
+        ahead = self.refresh_ahead if ahead is None else ahead
+        with self._refresh_lock:
+            token = self._token
+            if self._expiry - self._clock() >= ahead:
+                return token  # Refreshed by the caller we waited for
+            issued = IssuedToken(self._token_client.refresh_token(edi_token=token))
+            if issued.token is None:
+                raise iam_lib.exceptions.IAMInvalidToken("Token refresh response carries no token")
+            validate_token(issued.token, self._token_client.public_key_path, self._token_client.algorithm)
+            self._set_token(issued.token)
+            self._refreshes += 1
+            logger.debug(f"Refreshed token of {issued.subject}, expiring at {issued.expiry}")
+            return issued.token
+
+    def _set_token(self, token: str):
+        expiry = Token(token).expiry
+        if expiry is None:
+            raise iam_lib.exceptions.IAMInvalidToken("A managed token requires an \"exp\" claim")
+        with self._lock:
+            for client in self._clients:
+                client.token = token  # Swaps the token cookie with a single assignment
+            self._token = token
+            self._expiry = expiry
+        self._wakeup.set()
+
+    def _run(self):
+        delay = 0.0
+        while not self._closed.is_set():
+            self._wakeup.clear()
+            if delay <= 0:
+                delay = self._expiry - self.refresh_ahead - self._clock()
+            if delay > 0:
+                self._wakeup.wait(delay)
+                delay = 0.0
+                continue
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+                delay = self.retry_interval
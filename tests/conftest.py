@@ -19,6 +19,7 @@ from requests.cookies import RequestsCookieJar  # For mocking
 from requests.structures import CaseInsensitiveDict  # For mocking
 
 from iam_lib.api.client import Client
+from iam_lib.breaker import circuit_breakers
 from iam_lib.api.access import AccessClient
 from iam_lib.api.authorized import AuthorizedClient
 from iam_lib.api.edi_token import EdiTokenClient
@@ -33,6 +34,13 @@ from tests.utilities import make_token
 TOKEN = make_token("EDI-221c782cc3c84fcba888fadd7cbe708a")
 
 
+@pytest.fixture(autouse=True)
+def closed_circuits():
+    # Failures mocked by one test must not open the process-wide circuit of the IAM host for the next
+    yield
+    circuit_breakers.clear()
+
+
 @pytest.fixture(scope="function")
 def client():
     return Client(
@@ -29,9 +29,10 @@ def test_add_access(access_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"ADD_ACCESS\": \"OK\"}"
+        text="{\"ADD_ACCESS\": \"OK\"}",
+        content=b"{\"ADD_ACCESS\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     access_client.add_access(
         access="<access></access>",
         resource_key="api_service_xyz",
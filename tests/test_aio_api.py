@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_aio_api
+
+:Synopsis:
+    Pytest for the asyncio client API
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import asyncio
+import json
+
+import daiquiri
+import pytest
+
+httpx = pytest.importorskip("httpx")  # Requires the "aio" extra
+
+from iam_lib.aio.api_key import AsyncApiKeyClient
+from iam_lib.aio.client import AsyncClient
+from iam_lib.aio.context import AsyncIAMContext
+from iam_lib.aio.authorized import AsyncAuthorizedClient
+from iam_lib.aio.resource import AsyncResourceClient
+from iam_lib.aio.rule import AsyncRuleClient
+from iam_lib.cache import DecisionCache, KeyTokenCache, ResponseCache
+from iam_lib.coalescing import RequestCoalescer
+import iam_lib.exceptions
+from iam_lib.models.permission import Permission
+from iam_lib.retry import RetryBudget, RetryPolicy, Throttle
+from tests.config import Config
+from tests.conftest import TOKEN
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+def make_client(client_class, handler):
+    return client_class(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=TOKEN,
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_get():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text="{\"GET\": \"OK\"}")
+
+    async def main():
+        async with make_client(AsyncClient, handler) as client:
+            return await client.get(route="auth/v1/ping", query_params={"descendants": None})
+
+    response = asyncio.run(main())
+    assert response.status_code == 200
+    assert response.text == "{\"GET\": \"OK\"}"
+    assert requests[0].url.query == b""
+    assert requests[0].headers["Cookie"] == f"edi-token={TOKEN}"
+
+
+def test_async_client_rejects_with():
+    client = make_client(AsyncClient, lambda request: httpx.Response(200))
+    with pytest.raises(TypeError, match="async with"):
+        with client:
+            pass
+
+
+def test_async_iter_resource_rules():
+    rules = [{"resource_key": "resource_xyz", "principal": f"EDI-{i}", "permission": "read"} for i in range(100)]
+
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(rules).encode("utf-8"))
+
+    async def main():
+        async with make_client(AsyncRuleClient, handler) as client:
+            return [rule async for rule in client.iter_resource_rules("resource_xyz")]
+
+    assert asyncio.run(main()) == rules
+
+
+def test_async_is_authorized():
+    def handler(request):
+        authorized = request.url.params["resource_key"] == "resource_xyz"
+        return httpx.Response(200 if authorized else 403, text="{\"IS_AUTHORIZED\": \"OK\"}")
+
+    async def main():
+        client = make_client(AsyncAuthorizedClient, handler)
+        return await asyncio.gather(
+            client.is_authorized(resource_key="resource_xyz", permission="write"),
+            client.is_authorized(resource_key="resource_abc", permission="write"),
+        )
+
+    assert asyncio.run(main()) == [True, False]
+
+
+def test_async_is_authorized_pairs():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        authorized = request.url.params["permission"] == "read"
+        return httpx.Response(200 if authorized else 403, text="{\"IS_AUTHORIZED\": \"OK\"}")
+
+    async def main():
+        client = make_client(AsyncAuthorizedClient, handler)
+        return await client.is_authorized_pairs(
+            [("resource_xyz", "read"), ("resource_xyz", "write"), ("resource_xyz", "read")], max_workers=2
+        )
+
+    assert asyncio.run(main()) == {("resource_xyz", "read"): True, ("resource_xyz", "write"): False}
+    assert len(requests) == 2
+
+
+def test_async_effective_permission():
+    def handler(request):
+        authorized = request.url.params["permission"] in ("read", "write")
+        return httpx.Response(200 if authorized else 403, text="{\"IS_AUTHORIZED\": \"OK\"}")
+
+    async def main():
+        client = make_client(AsyncAuthorizedClient, handler)
+        return (
+            await client.effective_permission("resource_xyz"),
+            await client.effective_permissions(["resource_xyz", "resource_abc"]),
+        )
+
+    permission, permissions = asyncio.run(main())
+    assert permission is Permission.WRITE
+    assert permissions == {"resource_xyz": Permission.WRITE, "resource_abc": Permission.WRITE}
+
+
+def test_async_is_authorized_decision_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text="{\"IS_AUTHORIZED\": \"OK\"}")
+
+    async def main():
+        client = make_client(AsyncAuthorizedClient, handler)
+        client.decision_cache = DecisionCache()
+        return [await client.is_authorized(resource_key="resource_xyz", permission="write") for _ in range(3)]
+
+    assert asyncio.run(main()) == [True, True, True]
+    assert len(requests) == 1
+
+
+def test_async_create_rule():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, text="{\"CREATE_RULE\": \"OK\"}")
+
+    async def main():
+        client = make_client(AsyncRuleClient, handler)
+        return await client.create_rule(
+            resource_key="resource_xyz",
+            principal="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
+            permission=Permission.WRITE
+        )
+
+    assert asyncio.run(main()) == {"CREATE_RULE": "OK"}
+    assert bodies[0]["permission"] == "write"
+
+
+def test_async_read_resource_concurrent():
+    async def handler(request):
+        await asyncio.sleep(0)
+        resource_key = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, text=f"{{\"key\": \"{resource_key}\"}}")
+
+    async def main():
+        client = make_client(AsyncResourceClient, handler)
+        keys = [f"resource_{i}" for i in range(50)]
+        resources = await asyncio.gather(*(client.read_resource(resource_key=key) for key in keys))
+        return keys, resources
+
+    keys, resources = asyncio.run(main())
+    assert [resource["key"] for resource in resources] == keys
+
+
+def test_async_response_cache():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"key": "resource_xyz"})
+
+    async def main():
+        async with make_client(AsyncResourceClient, handler) as client:
+            client.response_cache = ResponseCache()
+            first = await client.read_resource("resource_xyz")
+            second = await client.read_resource("resource_xyz")
+            return first, second, client.response
+
+    first, second, response = asyncio.run(main())
+    assert first == second == {"key": "resource_xyz"}
+    assert response.status_code == 200
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_async_key_to_token_single_flight():
+    requests = []
+    token = make_token("a")
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"edi-token": token})
+
+    async def main():
+        async with make_client(AsyncApiKeyClient, handler) as client:
+            client.token_cache = KeyTokenCache()
+            results = await asyncio.gather(*(client.key_to_token("secret") for _ in range(8)))
+            results.append(await client.key_to_token("secret"))
+            return results, client.token_cache.cache_info()
+
+    results, info = asyncio.run(main())
+    assert len(requests) == 1
+    assert results == [{"edi-token": token}] * 9
+    assert info.shared == 7 and info.hits == 1
+
+
+def test_async_get_coalescing():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"key": "resource_xyz"})
+
+    async def main():
+        async with make_client(AsyncResourceClient, handler) as client:
+            client.coalescer = RequestCoalescer()
+            reads = [client.read_resource("resource_xyz") for _ in range(8)]
+            results = await asyncio.gather(*reads, client.read_resource("resource_abc"))
+            return results, client.coalescer.coalescing_info()
+
+    results, info = asyncio.run(main())
+    assert len(requests) == 2
+    assert results == [{"key": "resource_xyz"}] * 9
+    assert len({id(result) for result in results}) == 9
+    assert info == (2, 7, 0)
+
+
+def test_async_context():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"key": "resource_xyz"})
+
+    async def main():
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncIAMContext(
+            scheme=Config.SCHEME,
+            host=Config.AUTH_HOST,
+            accept=Config.ACCEPT,
+            public_key_path=Config.PUBLIC_KEY_PATH,
+            algorithm=Config.JWT_ALGORITHM,
+            token=TOKEN,
+            session=session,
+        ) as context:
+            resource_client = context.resource()
+            assert isinstance(resource_client, AsyncResourceClient)
+            assert isinstance(context.authorized(), AsyncAuthorizedClient)
+            result = await resource_client.read_resource("resource_xyz")
+        await session.aclose()
+        return result
+
+    assert asyncio.run(main()) == {"key": "resource_xyz"}
+    assert requests[0].headers["Cookie"] == f"edi-token={TOKEN}"
+
+
+def test_async_retry_policy():
+    sleeps = []
+    attempts = {"get": 0, "post": 0}
+
+    def handler(request):
+        verb = request.method.lower()
+        attempts[verb] += 1
+        if verb == "post" and attempts[verb] == 1:
+            raise httpx.ConnectError("Connection refused", request=request)  # Not sent: retried
+        if verb == "get":
+            raise httpx.ReadError("Connection reset by peer", request=request)
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with make_client(AsyncClient, handler) as client:
+            client.retry_policy = RetryPolicy(budget=RetryBudget(), sleep=sleeps.append, jitter=lambda: 1.0)
+            with pytest.raises(iam_lib.exceptions.IAMRetryError) as e:
+                await client.get("auth/v1/ping")
+            response = await client.post("auth/v1/rule")
+        return e.value, response
+
+    error, response = asyncio.run(main())
+    assert attempts == {"get": 3, "post": 2}
+    assert sleeps == [0.5, 1.0, 0.5]
+    assert isinstance(error.last_error.__cause__, httpx.ReadError)
+    assert response.status_code == 200
+
+
+def test_async_retry_after():
+    sleeps = []
+    responses = [httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200, json={})]
+
+    async def main():
+        async with make_client(AsyncClient, lambda request: responses.pop(0)) as client:
+            throttle = Throttle()
+            client.retry_policy = RetryPolicy(budget=RetryBudget(), throttle=throttle, sleep=sleeps.append)
+            response = await client.post("auth/v1/rule")  # Declined by the service: retried
+        return response, throttle.throttle_info()
+
+    response, info = asyncio.run(main())
+    assert response.status_code == 200
+    assert sleeps[0] == 3.0
+    assert info.deferrals == 1
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_api_key_api
+
+:Synopsis:
+    Pytest for the API key client API
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.api.api_key import ApiKeyClient
+from iam_lib.cache import key_tokens, KeyTokenCache
+from iam_lib.token import Token
+from tests.config import Config
+from tests.conftest import TOKEN
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+KEY = "3f2b6c1e-api-key-secret"
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_client(**kwargs) -> ApiKeyClient:
+    return ApiKeyClient(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=TOKEN,
+        **kwargs,
+    )
+
+
+def token_response(cookies, headers, token: str) -> MagicMock:
+    content = json.dumps({"edi-token": token}).encode("utf-8")
+    return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=content)
+
+
+def test_key_to_token(cookies, headers, mocker):
+    client = make_client(token_cache=None)
+    response = token_response(cookies, headers, TOKEN)
+    mock_post = mocker.patch.object(requests.Session, "post", return_value=response)
+    assert client.key_to_token(KEY) == {"edi-token": TOKEN}
+    assert client.key_to_token(KEY) == {"edi-token": TOKEN}
+    assert mock_post.call_count == 2
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {"key": KEY}
+
+
+def test_key_to_token_cached_until_expiry(cookies, headers, mocker):
+    clock = FakeClock(time.time())
+    cache = KeyTokenCache(refresh_ahead=60, clock=clock)
+    client = make_client(token_cache=cache)
+    mock_post = mocker.patch.object(
+        requests.Session, "post", side_effect=lambda *args, **kwargs: token_response(cookies, headers, make_token("a"))
+    )
+    first = client.key_to_token(KEY)
+    first["edi-token"] = "changed"  # Callers get a copy
+    second = client.key_to_token(KEY)
+    assert mock_post.call_count == 1
+    assert client.key_to_token("another key") != second
+    assert mock_post.call_count == 2
+
+    clock.now = Token(second["edi-token"]).expiry - 30  # Within refresh_ahead
+    assert client.key_to_token(KEY) != second
+    assert mock_post.call_count == 3
+    assert cache.cache_info()[:2] == (1, 3)
+    assert make_client().token_cache is key_tokens
+
+
+def test_key_to_token_stores_digests_only(cookies, headers, mocker):
+    cache = KeyTokenCache()
+    mocker.patch.object(requests.Session, "post", return_value=token_response(cookies, headers, TOKEN))
+    make_client(token_cache=cache).key_to_token(KEY)
+    assert len(cache._entries) == 1
+    for digest, entry in cache._entries.items():
+        assert isinstance(digest, bytes) and KEY.encode("utf-8") not in digest
+        assert KEY not in repr(entry)
+
+
+def test_key_to_token_single_flight(cookies, headers, mocker):
+    release = threading.Event()
+    token = make_token("a", timedelta(hours=2))
+
+    def post(*args, **kwargs):
+        release.wait(5)
+        return token_response(cookies, headers, token)
+
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=post)
+    client = make_client(token_cache=KeyTokenCache())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(client.key_to_token, KEY) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+    assert mock_post.call_count == 1
+    assert results == [{"edi-token": token}] * 8
+    assert client.token_cache.cache_info().shared == 7
+
+
+def test_key_to_token_failure_not_cached(cookies, headers, mocker):
+    failure = MagicMock(status_code=401, reason="Unauthorized", headers=headers, cookies=cookies, content=b"")
+    mocker.patch.object(requests.Session, "post", return_value=failure)
+    client = make_client(token_cache=KeyTokenCache())
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.key_to_token(KEY)
+    assert client.token_cache.cache_info().currsize == 0
@@ -14,11 +14,21 @@
 :Created:
     5/15/25
 """
+import threading
+import time
 from unittest.mock import MagicMock
 
 import daiquiri
+import pytest
 import requests
 
+from iam_lib.api.authorized import AuthorizedClient
+from iam_lib.cache import DecisionCache
+import iam_lib.exceptions
+from iam_lib.models.permission import Permission
+from tests.config import Config
+from tests.conftest import TOKEN
+
 
 logger = daiquiri.getLogger(__name__)
 
@@ -29,9 +39,10 @@ def test_is_authorized(authorized_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"IS_AUTHORIZED\": \"OK\"}"
+        text="{\"IS_AUTHORIZED\": \"OK\"}",
+        content=b"{\"IS_AUTHORIZED\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     is_authorized = authorized_client.is_authorized(
         resource_key="resource_xyz",
         permission="write"
@@ -39,3 +50,122 @@ def test_is_authorized(authorized_client, cookies, headers, mocker):
     assert is_authorized is True
     assert authorized_client.response.status_code == 200
     assert authorized_client.response.text == "{\"IS_AUTHORIZED\": \"OK\"}"
+
+
+def test_is_authorized_decision_cache(authorized_client, cookies, headers, mocker):
+    mock_requests_response = MagicMock(
+        status_code=200,
+        reason="OK",
+        headers=headers,
+        cookies=cookies,
+        text="{\"IS_AUTHORIZED\": \"OK\"}",
+        content=b"{\"IS_AUTHORIZED\": \"OK\"}"
+    )
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
+    authorized_client = AuthorizedClient(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=TOKEN,
+        decision_cache=DecisionCache(),
+    )
+    for _ in range(3):
+        assert authorized_client.is_authorized(resource_key="resource_xyz", permission="write") is True
+    assert mock_get.call_count == 1
+    assert authorized_client.decision_cache.cache_info().hits == 2
+    assert authorized_client.invalidate_decisions("resource_xyz") == 1
+    assert authorized_client.is_authorized(resource_key="resource_xyz", permission="write") is True
+    assert mock_get.call_count == 2
+
+
+def test_is_authorized_refresh_keeps_response(authorized_client, cookies, headers, mocker):
+    clock = MagicMock(return_value=0.0)
+    authorized_client.decision_cache = DecisionCache(positive_ttl=10, stale_ttl=10, max_refresh_workers=1, clock=clock)
+    ok = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text="{\"IS_AUTHORIZED\": \"OK\"}", content=b"{\"IS_AUTHORIZED\": \"OK\"}")
+    mocker.patch.object(requests.Session, "get", return_value=ok)
+    assert authorized_client.is_authorized(resource_key="resource_xyz", permission="write") is True
+    clock.return_value = 15.0
+    refreshed = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text="{}", content=b"{}")
+    mocker.patch.object(requests.Session, "get", return_value=refreshed)
+    assert authorized_client.is_authorized(resource_key="resource_xyz", permission="write") is True
+    authorized_client.decision_cache.close()
+    assert authorized_client.decision_cache.cache_info().refreshes == 1
+    assert authorized_client.response is ok
+
+
+def test_is_authorized_many(authorized_client, cookies, headers, mocker):
+    lock = threading.Lock()
+    in_flight = []
+    concurrency = []
+
+    def get(url, params=None, **kwargs):
+        with lock:
+            in_flight.append(params["resource_key"])
+            concurrency.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(params["resource_key"])
+        if params["resource_key"] == "resource_abc":
+            return MagicMock(status_code=403, reason="Forbidden", headers=headers, cookies=cookies, text="", content=b"")
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text="{}", content=b"{}")
+
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=get)
+    resource_keys = ["resource_xyz", "resource_abc", "resource_xyz"] + [f"resource_{i}" for i in range(8)]
+    authorized = authorized_client.is_authorized_many(resource_keys, permission="read")
+    assert list(authorized) == list(dict.fromkeys(resource_keys))
+    assert authorized["resource_xyz"] is True
+    assert authorized["resource_abc"] is False
+    assert mock_get.call_count == 10  # Duplicates are tested once
+    assert max(concurrency) > 1
+    assert authorized_client.response is None
+
+
+def test_is_authorized_pairs_request_error(authorized_client, mocker):
+    mocker.patch("iam_lib.api.client.time.sleep")
+    mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("refused"))
+    pairs = [("resource_xyz", "read"), ("resource_xyz", "write")]
+    with pytest.raises(iam_lib.exceptions.IAMRequestError):
+        authorized_client.is_authorized_pairs(pairs)
+
+
+def grants(headers, cookies, granted: dict, release: threading.Event = None):
+    def get(url, params=None, **kwargs):
+        if params["permission"] in granted.get(params["resource_key"], ()):
+            return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text="{}", content=b"{}")
+        if release is not None:
+            release.wait(5)
+        return MagicMock(status_code=403, reason="Forbidden", headers=headers, cookies=cookies, text="", content=b"")
+    return get
+
+
+def test_effective_permission(authorized_client, cookies, headers, mocker):
+    granted = {"resource_xyz": ("read", "write")}
+    mocker.patch.object(requests.Session, "get", side_effect=grants(headers, cookies, granted))
+    assert authorized_client.effective_permission("resource_xyz") is Permission.WRITE
+    assert authorized_client.effective_permission("resource_abc") is Permission.NONE
+
+
+def test_effective_permission_short_circuits(authorized_client, cookies, headers, mocker):
+    release = threading.Event()
+    granted = {"resource_xyz": ("changePermission",)}
+    mocker.patch.object(requests.Session, "get", side_effect=grants(headers, cookies, granted, release))
+    start = time.perf_counter()
+    assert authorized_client.effective_permission("resource_xyz") is Permission.CHANGE_PERMISSION
+    assert time.perf_counter() - start < 2  # Returned without waiting for the blocked read and write tests
+    release.set()
+    while authorized_client.coalescer.coalescing_info().in_flight:  # Later tests must not join the blocked tests
+        time.sleep(0.01)
+
+
+def test_effective_permissions(authorized_client, cookies, headers, mocker):
+    granted = {"resource_xyz": ("read",), "resource_abc": ("read", "write", "changePermission")}
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=grants(headers, cookies, granted))
+    permissions = authorized_client.effective_permissions(["resource_xyz", "resource_abc", "resource_123"])
+    assert permissions == {
+        "resource_xyz": Permission.READ,
+        "resource_abc": Permission.CHANGE_PERMISSION,
+        "resource_123": Permission.NONE,
+    }
+    assert mock_get.call_count == 9
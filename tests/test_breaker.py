@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_breaker
+
+:Synopsis:
+    Pytest for the circuit breakers of the IAM services, on a fake clock
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.breaker import CircuitBreakers, CLOSED, HALF_OPEN, OPEN
+from iam_lib.retry import RetryBudget, RetryPolicy, Throttle
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float):
+        self.now += delay
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breakers(client, clock):
+    breakers = CircuitBreakers(failure_threshold=3, cool_down=10, clock=clock)
+    client.circuit_breakers = breakers
+    client.retry_policy = None
+    return breakers
+
+
+def status(code: int, headers, cookies) -> MagicMock:
+    return MagicMock(status_code=code, reason="Error", headers=headers, cookies=cookies, content=b"{}")
+
+
+def origin_of(client) -> str:
+    return f"{client.scheme}://{client.host}"
+
+
+def test_circuit_opens(client, breakers, mocker):
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("refused"))
+    for _ in range(3):
+        with pytest.raises(iam_lib.exceptions.IAMRequestError):
+            client.get("auth/v1/ping")
+    breaker = breakers.breaker(origin_of(client))
+    assert breaker.state == OPEN
+    with pytest.raises(iam_lib.exceptions.IAMCircuitOpenError) as e:
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 3  # Failed fast, without a request
+    assert e.value.origin == origin_of(client) and e.value.retry_after == 10
+    assert breaker.breaker_info() == (OPEN, 3, 1, 1)
+
+
+def test_half_open_probe(client, breakers, clock, cookies, headers, mocker):
+    transitions = []
+    breakers.add_listener(lambda origin, old, new: transitions.append((old, new)))
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=status(503, headers, cookies))
+    for _ in range(3):
+        with pytest.raises(iam_lib.exceptions.IAMResponseError):
+            client.get("auth/v1/ping")
+    breaker = breakers.breaker(origin_of(client))
+
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.get("auth/v1/ping")  # The probe fails: open again for the cool-down
+    assert breaker.state == OPEN and mock_get.call_count == 4
+
+    clock.now += 10
+    mock_get.return_value = status(404, headers, cookies)  # Answered: the service is up
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.get("auth/v1/ping")
+    assert breaker.state == CLOSED
+    assert breaker.breaker_info() == (CLOSED, 0, 2, 0)
+    assert transitions == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+
+def test_one_probe_at_a_time(clock):
+    breakers = CircuitBreakers(failure_threshold=1, cool_down=5, clock=clock)
+    breaker = breakers.breaker("https://auth.example.org")
+    with pytest.raises(iam_lib.exceptions.IAMRequestError):
+        with breaker.guard():
+            raise iam_lib.exceptions.IAMRequestError("refused")
+    clock.now += 5
+    with breaker.guard():
+        with pytest.raises(iam_lib.exceptions.IAMCircuitOpenError):
+            with breaker.guard():
+                pass
+    assert breaker.state == CLOSED
+    assert breakers.breaker("https://other.example.org").state == CLOSED  # One circuit per service
+    assert set(breakers.breakers_info()) == {"https://auth.example.org", "https://other.example.org"}
+
+
+def test_probe_not_sent(clock):
+    # A probe failing before it is sent leaves the circuit half-open for the next probe
+    breaker = CircuitBreakers(failure_threshold=1, cool_down=5, clock=clock).breaker("https://auth.example.org")
+    with pytest.raises(iam_lib.exceptions.IAMRequestError):
+        with breaker.guard():
+            raise iam_lib.exceptions.IAMRequestError("refused")
+    clock.now += 5
+    with pytest.raises(iam_lib.exceptions.IAMInvalidParameter):
+        with breaker.guard():
+            raise iam_lib.exceptions.IAMInvalidParameter("key")
+    assert breaker.state == HALF_OPEN
+    with breaker.guard():
+        pass
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_stops_retries(client, breakers, clock, mocker):
+    client.retry_policy = RetryPolicy(
+        attempts=10, budget=RetryBudget(clock=clock), throttle=Throttle(clock=clock), clock=clock, sleep=clock.sleep
+    )
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("reset"))
+    with pytest.raises(iam_lib.exceptions.IAMCircuitOpenError):
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 3
+
+
+def test_listener_errors_ignored(client, breakers, mocker):
+    breakers.add_listener(MagicMock(side_effect=RuntimeError("listener")))
+    mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("refused"))
+    for _ in range(3):
+        with pytest.raises(iam_lib.exceptions.IAMRequestError):
+            client.get("auth/v1/ping")
+    assert breakers.breaker(origin_of(client)).state == OPEN
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_cache
+
+:Synopsis:
+    Pytest for client-side caches
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from iam_lib.api.resource import ResourceClient
+from iam_lib.cache import DecisionCache, ResponseCache
+import iam_lib.exceptions
+from iam_lib.models.permission import Permission
+import iam_lib.models.response_model as response_model
+from tests.config import Config
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_decision_cache_ttls():
+    clock = FakeClock()
+    cache = DecisionCache(positive_ttl=10, negative_ttl=1, stale_ttl=0, clock=clock)
+    calls = []
+
+    def loader(value):
+        def load():
+            calls.append(value)
+            return value
+        return load
+
+    assert cache.decide(("sub", (), "r1", "read"), loader(True)) is True
+    assert cache.decide(("sub", (), "r2", "read"), loader(False)) is False
+    clock.now = 5
+    assert cache.decide(("sub", (), "r1", "read"), loader(True)) is True
+    assert cache.decide(("sub", (), "r2", "read"), loader(False)) is False
+    assert calls == [True, False, False]
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+    assert cache.hit_ratio == 0.25
+
+
+def test_decision_cache_stale_while_revalidate():
+    clock = FakeClock()
+    cache = DecisionCache(positive_ttl=10, stale_ttl=10, max_refresh_workers=1, clock=clock)
+    key = ("sub", (), "r1", "read")
+    assert cache.decide(key, lambda: True) is True
+    clock.now = 15
+    assert cache.decide(key, lambda: False) is True  # Stale value served, refresh submitted
+    cache.close()  # Wait for the refresh
+    assert cache.decide(key, lambda: True) is False
+    info = cache.cache_info()
+    assert (info.stale_hits, info.refreshes) == (1, 1)
+
+
+def test_decision_cache_eviction_and_invalidation():
+    cache = DecisionCache(maxsize=2)
+    cache.decide(("a", (), "r1", "read"), lambda: True)
+    cache.decide(("a", (), "r2", "read"), lambda: True)
+    cache.decide(("b", (), "r1", "read"), lambda: True)
+    assert cache.cache_info().evictions == 1
+    assert cache.invalidate(resource_key="r1") == 1
+    assert cache.invalidate(subject="a") == 1
+    assert cache.cache_info().currsize == 0
+
+
+def test_decision_cache_failed_refresh_is_retried():
+    clock = FakeClock()
+    cache = DecisionCache(positive_ttl=10, stale_ttl=10, max_refresh_workers=1, clock=clock)
+    key = ("sub", (), "r1", "read")
+    cache.decide(key, lambda: True)
+    clock.now = 15
+
+    def fail():
+        raise RuntimeError("IAM unavailable")
+
+    assert cache.decide(key, lambda: True, fail) is True
+    cache.close()
+    assert cache.decide(key, lambda: True, lambda: False) is True
+    cache.close()
+    assert cache.decide(key, lambda: True) is False
+    assert cache.cache_info().refreshes == 1
+
+
+def test_decision_cache_adecide():
+    clock = FakeClock()
+    cache = DecisionCache(positive_ttl=10, stale_ttl=10, clock=clock)
+    key = ("sub", (), "r1", "read")
+
+    async def decision(value):
+        return value
+
+    async def run():
+        assert await cache.adecide(key, lambda: decision(True)) is True
+        clock.now = 15
+        assert await cache.adecide(key, lambda: decision(False)) is True
+        await asyncio.sleep(0)  # Let the refresh task run
+        return await cache.adecide(key, lambda: decision(True))
+
+    assert asyncio.run(run()) is False
+    assert cache.cache_info().refreshes == 1
+
+
+class ETagServer:
+    # Stand-in for Session.get serving a body versioned by ETag, answering 304 to a matching If-None-Match
+    def __init__(self, headers, cookies, body: dict, last_modified: bool = False):
+        self.headers = headers
+        self.cookies = cookies
+        self.version = 1
+        self.body = body
+        self.last_modified = last_modified
+        self.requests = []
+
+    def __call__(self, url, params=None, headers=None, **kwargs):
+        self.requests.append(dict(headers))
+        validators = CaseInsensitiveDict(self.headers)
+        if self.last_modified:
+            validators["Last-Modified"] = f"Tue, 0{self.version} Sep 2026 00:00:00 GMT"
+            fresh = headers.get("If-Modified-Since") == validators["Last-Modified"]
+        else:
+            validators["ETag"] = f'"v{self.version}"'
+            fresh = headers.get("If-None-Match") == validators["ETag"]
+        if fresh:
+            return MagicMock(status_code=304, reason="Not Modified", headers=validators, content=b"")
+        content = json.dumps(self.body).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=validators, cookies=self.cookies, content=content)
+
+
+def test_response_cache_conditional_get(resource_client, cookies, headers, mocker):
+    server = ETagServer(headers, cookies, {"key": "resource_xyz", "label": "xyz"})
+    mocker.patch.object(requests.Session, "get", side_effect=server)
+    parse = mocker.spy(response_model, "response_data")
+    resource_client.response_cache = ResponseCache()
+
+    data = resource_client.read_resource("resource_xyz")
+    response = resource_client.response
+    data["label"] = "changed"  # Callers get a copy
+    assert resource_client.read_resource("resource_xyz") == {"key": "resource_xyz", "label": "xyz"}
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert resource_client.response is response
+    assert parse.call_count == 1  # Served from the cached parsed data
+
+    server.version = 2
+    server.body["label"] = "new"
+    assert resource_client.read_resource("resource_xyz")["label"] == "new"
+    assert resource_client.response_cache.cache_info()[:2] == (1, 2)  # hits, misses
+
+
+def test_response_cache_last_modified(resource_client, cookies, headers, mocker):
+    server = ETagServer(headers, cookies, {"key": "resource_xyz"}, last_modified=True)
+    mocker.patch.object(requests.Session, "get", side_effect=server)
+    resource_client.response_cache = ResponseCache()
+    resource_client.read_resource("resource_xyz")
+    assert resource_client.read_resource("resource_xyz") == {"key": "resource_xyz"}
+    assert server.requests[1]["If-Modified-Since"] == "Tue, 01 Sep 2026 00:00:00 GMT"
+    assert resource_client.response_cache.hit_ratio == 0.5
+
+
+def test_response_cache_keys(resource_client, cookies, headers, mocker):
+    server = ETagServer(headers, cookies, {"key": "resource_xyz"})
+    mocker.patch.object(requests.Session, "get", side_effect=server)
+    cache = ResponseCache()
+    resource_client.response_cache = cache
+    other = ResourceClient(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=make_token("EDI-d5e0d2f0b2f84a3e8e9b8a2f0f7c3a11"),
+        response_cache=cache,
+    )
+    resource_client.read_resource("resource_xyz")
+    other.read_resource("resource_xyz")  # Another token
+    resource_client.read_resource("resource_abc")  # Another route
+    assert all("If-None-Match" not in request for request in server.requests)
+    assert cache.cache_info().currsize == 3
+
+
+def test_response_cache_bounds(client, cookies, headers, mocker):
+    server = ETagServer(headers, cookies, {"label": "x" * 100})
+    mocker.patch.object(requests.Session, "get", side_effect=server)
+    client.response_cache = ResponseCache(maxsize=2, max_bytes=300)
+    for route in ("a", "b", "c"):
+        client.get(route)
+    info = client.response_cache.cache_info()
+    assert (info.currsize, info.evictions) == (2, 1)
+    client.get("a")  # Evicted as least recently used
+    assert "If-None-Match" not in server.requests[-1]
+    client.get("c")
+    assert server.requests[-1]["If-None-Match"] == '"v1"'
+
+    client.response_cache = ResponseCache(max_bytes=200)
+    client.get("a")
+    client.get("b")
+    info = client.response_cache.cache_info()
+    assert (info.currsize, info.currbytes) == (1, 113)
+
+
+def test_response_cache_skips_uncacheable(client, cookies, headers, mocker):
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=response)
+    client.response_cache = ResponseCache()
+    client.get("a")  # No validators
+    client._request("get", "a", stream=True)
+    assert client.response_cache.cache_info().currsize == 0
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+
+TREE = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())
+PACKAGE = TREE[0]["key"]  # Children DATA and OTHER; DATA has child LEAF
+DATA = TREE[0]["children"][0]["key"]
+LEAF = TREE[0]["children"][0]["children"][0]["key"]
+OTHER = TREE[0]["children"][1]["key"]
+UNRELATED = TREE[1]["key"]
+
+
+@pytest.fixture
+def cached_reads(resource_client, rule_client, cookies, headers, mocker):
+    bodies = {
+        f"auth/v1/resource/{PACKAGE}": TREE[0],
+        f"auth/v1/resource/{LEAF}": {"key": LEAF, "label": "leaf", "type": "data"},
+        f"auth/v1/resource/{OTHER}": TREE[0]["children"][1],
+        f"auth/v1/resource/{UNRELATED}": TREE[1],
+        f"auth/v1/resource/{UNRELATED}/copy": TREE[1],
+        "auth/v1/resources": [{"resource_key": key} for key in (PACKAGE, DATA, LEAF, OTHER)],
+        f"auth/v1/rules/resource/{LEAF}": [{"resource_key": LEAF, "principal": "EDI-a", "permission": "read"}],
+        "auth/v1/rules/principal": [{"resource_key": UNRELATED, "principal": "EDI-a", "permission": "read"}],
+    }
+    validators = CaseInsensitiveDict(headers)
+    validators["ETag"] = '"v1"'
+
+    def get(url, params=None, headers=None, **kwargs):
+        content = json.dumps(bodies[url.split("/", 3)[3]]).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=validators, cookies=cookies, content=content)
+
+    ok = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+    mocker.patch.object(requests.Session, "get", side_effect=get)
+    for verb in ("post", "put", "delete"):
+        mocker.patch.object(requests.Session, verb, return_value=ok)
+    cache = ResponseCache()
+    resource_client.response_cache = cache
+    rule_client.response_cache = cache
+    for key in (PACKAGE, LEAF, OTHER, UNRELATED):
+        resource_client.read_resource(key, descendants=True)
+    resource_client.read_resources()
+    rule_client.read_resource_rules(LEAF)
+    rule_client.read_principal_rules()
+    return cache
+
+
+def cached_routes(cache: ResponseCache) -> set:
+    return {key[1].removeprefix("auth/v1/") for key in cache._entries}
+
+
+def test_invalidate_update_resource(resource_client, cached_reads):
+    resource_client.update_resource(LEAF, "renamed", "data", DATA)
+    assert cached_routes(cached_reads) == {
+        f"resource/{OTHER}", f"resource/{UNRELATED}", "rules/principal"
+    }
+
+
+def test_invalidate_delete_resource_subtree(resource_client, cached_reads):
+    resource_client.delete_resource(DATA)  # Removes LEAF too
+    assert cached_routes(cached_reads) == {
+        f"resource/{OTHER}", f"resource/{UNRELATED}", "rules/principal"
+    }
+
+
+def test_invalidate_create_resource(resource_client, cached_reads):
+    resource_client.create_resource("new_csv", "new.csv", "data", OTHER)
+    assert cached_routes(cached_reads) == {
+        f"resource/{LEAF}", f"resource/{UNRELATED}", f"rules/resource/{LEAF}"
+    }
+
+
+def test_invalidate_rule_writes(rule_client, cached_reads):
+    rule_client.update_rule(LEAF, "EDI-a", Permission.WRITE)
+    assert cached_routes(cached_reads) == {f"resource/{OTHER}", f"resource/{UNRELATED}"}
+    rule_client.create_rule(UNRELATED, "EDI-b", Permission.READ)
+    assert cached_routes(cached_reads) == {f"resource/{OTHER}"}
+
+
+def test_invalidate_unparsed_and_failed_writes(client, resource_client, cookies, headers, cached_reads, mocker):
+    client.response_cache = cached_reads
+    client.get(f"auth/v1/resource/{UNRELATED}/copy")  # Raw GET: the body is never parsed
+    mocker.patch.object(
+        requests.Session, "delete", return_value=MagicMock(status_code=403, reason="Forbidden", content=b"")
+    )
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        resource_client.delete_resource(UNRELATED)
+    assert f"resource/{UNRELATED}/copy" in cached_routes(cached_reads)
+    cached_reads.invalidate(resource_keys=[TREE[1]["children"][0]["key"]])
+    assert f"resource/{UNRELATED}" not in cached_routes(cached_reads)
+    assert f"resource/{UNRELATED}/copy" not in cached_routes(cached_reads)  # Found in the body
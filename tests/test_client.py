@@ -11,14 +11,23 @@
     2025-05-05
 
 """
+from concurrent.futures import ThreadPoolExecutor
+import email.message
 from pathlib import Path
+import urllib.request
 from unittest.mock import MagicMock
 
 import daiquiri
 import jwt
+import pytest
 import requests
 
+from iam_lib.api.client import Client, create_session
+import iam_lib.exceptions
+import iam_lib.token
+from iam_lib.models.resource_tree import ResourceTree
 from tests.config import Config
+from tests.utilities import make_token
 
 
 logger = daiquiri.getLogger(__name__)
@@ -42,9 +51,10 @@ def test_get(client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"GET\": \"OK\"}"
+        text="{\"GET\": \"OK\"}",
+        content=b"{\"GET\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     response = client.get(route="auth/v1/ping")
     assert response.status_code == 200
     assert response.text == "{\"GET\": \"OK\"}"
@@ -56,9 +66,10 @@ def test_post(client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"POST\": \"OK\"}"
+        text="{\"POST\": \"OK\"}",
+        content=b"{\"POST\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     parameters = {
         "principal": "EDI-3fa734a7cd6e40998a5c2b5486b6eced",
         "eml": "<eml></eml>"
@@ -74,9 +85,10 @@ def test_put(client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"PUT\": \"OK\"}"
+        text="{\"PUT\": \"OK\"}",
+        content=b"{\"PUT\": \"OK\"}"
     )
-    mocker.patch.object(requests, "put", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "put", return_value=mock_requests_response)
     parameters = {
         "principal": "EDI-3fa734a7cd6e40998a5c2b5486b6eced",
         "eml": "<eml></eml>"
@@ -92,9 +104,99 @@ def test_delete(client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"DELETE\": \"OK\"}"
+        text="{\"DELETE\": \"OK\"}",
+        content=b"{\"DELETE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "delete", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "delete", return_value=mock_requests_response)
     response = client.delete(route="auth/v1/ping")
     assert response.status_code == 200
     assert response.text == "{\"DELETE\": \"OK\"}"
+
+
+def test_client_owns_pooled_session(client, mocker):
+    adapter = client.session.get_adapter("https://" + Config.AUTH_HOST)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 10
+    mock_close = mocker.patch.object(requests.Session, "close")
+    with client:
+        pass
+    mock_close.assert_called_once()
+
+
+def test_session_rejects_response_cookies():
+    session = create_session()
+    message = email.message.Message()
+    message["Set-Cookie"] = "edi-token=other; Path=/"
+    response = MagicMock()
+    response.info.return_value = message
+    session.cookies.extract_cookies(response, urllib.request.Request("https://" + Config.AUTH_HOST + "/auth/v1/ping"))
+    assert len(session.cookies) == 0
+
+
+def test_client_shared_session(client, mocker):
+    session = create_session(pool_size=4, keep_alive=False)
+    shared_client = Client(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=client.token,
+        session=session,
+    )
+    assert shared_client.session is session
+    assert session.headers["Connection"] == "close"
+    mock_close = mocker.patch.object(requests.Session, "close")
+    shared_client.close()
+    mock_close.assert_not_called()
+
+
+def test_client_malformed_public_key(tmp_path):
+    public_key_path = tmp_path / "public.pem"
+    public_key_path.write_text("-----BEGIN PUBLIC KEY-----\nnot a key\n-----END PUBLIC KEY-----\n")
+    with pytest.raises(iam_lib.exceptions.IAMInvalidPublicKey):
+        Client(
+            scheme=Config.SCHEME,
+            host=Config.AUTH_HOST,
+            accept=Config.ACCEPT,
+            public_key_path=public_key_path.as_posix(),
+            algorithm=Config.JWT_ALGORITHM,
+            token=None,
+        )
+
+
+def test_client_with_token(client, cookies, headers, mocker):
+    def get(url, cookies=None, **kwargs):
+        content = ("{\"token\": \"%s\"}" % cookies["edi-token"]).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=headers, content=content)
+
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=get)
+    tokens = [make_token(f"EDI-{i:032x}") for i in range(20)]
+
+    def read(token: str) -> str:
+        view = client.with_token(token)
+        assert view.session is client.session
+        response = view.get("auth/v1/ping")
+        assert view.response is response
+        return response.content.decode("utf-8")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(read, tokens)) == [f"{{\"token\": \"{token}\"}}" for token in tokens]
+    assert mock_get.call_count == len(tokens)
+    assert client.response is None
+    client.get("auth/v1/ping")
+    assert mock_get.call_args.kwargs["cookies"] == {"edi-token": client.token}
+
+    hits = iam_lib.token.verified_tokens.cache_info().hits
+    assert client.with_token(tokens[0]).token == tokens[0]
+    assert iam_lib.token.verified_tokens.cache_info().hits == hits + 1  # Validated through the cache
+    assert client.with_token(None).token is None
+    with pytest.raises(iam_lib.exceptions.IAMInvalidToken):
+        client.with_token("not a token")
+
+
+def test_resource_client_with_token(resource_client):
+    resource_client.resource_tree = ResourceTree()
+    view = resource_client.with_token(make_token("EDI-0000000000000000000000000000000a"))
+    assert type(view) is type(resource_client)
+    assert view.resource_tree is None  # Another token's resources are not shared
+    assert resource_client.resource_tree is not None
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_coalescing
+
+:Synopsis:
+    Pytest for the coalescing of identical concurrent GET requests
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.coalescing import coalescer, RequestCoalescer
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+CALLERS = 8
+
+
+@pytest.fixture
+def blocked_get(cookies, headers, mocker):
+    # Stand-in for a slow IAM service: requests complete once released
+    release = threading.Event()
+    status = {"code": 200}
+
+    def get(url, params=None, **kwargs):
+        release.wait(5)
+        if status["code"] != 200:
+            return MagicMock(status_code=status["code"], reason="Not Found", headers=headers, cookies=cookies,
+                             content=b"")
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies,
+                         content=b"{\"key\": \"resource_xyz\", \"children\": []}")
+
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=get)
+    mock_get.release = release
+    mock_get.status = status
+    return mock_get
+
+
+def released(mock_get, futures) -> list:
+    mock_get.release.set()
+    return [future.result() for future in futures]
+
+
+def test_identical_gets_share_one_request(resource_client, blocked_get):
+    resource_client.coalescer = RequestCoalescer()
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(resource_client.read_resource, "resource_xyz") for _ in range(CALLERS)]
+        time.sleep(0.05)
+        results = released(blocked_get, futures)
+    assert blocked_get.call_count == 1
+    assert results == [{"key": "resource_xyz", "children": []}] * CALLERS
+    assert len({id(result) for result in results}) == CALLERS  # Each caller has its own copy
+    assert resource_client.coalescer.coalescing_info() == (1, CALLERS - 1, 0)
+    assert resource_client.coalescer.coalescing_ratio() == (CALLERS - 1) / CALLERS
+
+
+def test_coalescing_across_clients(authorized_client, client, blocked_get):
+    shared = RequestCoalescer()
+    authorized_client.coalescer = client.coalescer = shared
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(authorized_client.is_authorized, "resource_xyz", "read") for _ in range(CALLERS)]
+        futures.append(executor.submit(client.get, "auth/v1/authorized",
+                                       {"resource_key": "resource_xyz", "permission": "read"}))
+        time.sleep(0.05)
+        results = released(blocked_get, futures)
+    assert results[:CALLERS] == [True] * CALLERS
+    assert results[-1].status_code == 200
+    assert client.response is results[-1]
+    assert authorized_client.response.status_code == 200
+    assert blocked_get.call_count == 2  # Responses and decisions are coalesced separately
+    assert shared.coalescing_info().coalesced == CALLERS - 1
+
+
+def test_distinct_gets_not_coalesced(resource_client, blocked_get):
+    resource_client.coalescer = RequestCoalescer()
+    blocked_get.release.set()
+    resource_client.read_resource("resource_xyz")
+    resource_client.read_resource("resource_xyz")  # Sequential requests do not share
+    resource_client.read_resource("resource_abc")
+    resource_client.token = make_token("EDI-0000000000000000000000000000000a")
+    resource_client.read_resource("resource_xyz")
+    assert blocked_get.call_count == 4
+    assert resource_client.coalescer.coalescing_info() == (4, 0, 0)
+
+
+def test_coalesced_error_raised_to_all(resource_client, blocked_get):
+    resource_client.coalescer = RequestCoalescer()
+    blocked_get.status["code"] = 404
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(resource_client.read_resource, "resource_xyz") for _ in range(CALLERS)]
+        time.sleep(0.05)
+        blocked_get.release.set()
+        for future in futures:
+            with pytest.raises(iam_lib.exceptions.IAMResponseError):
+                future.result()
+    assert blocked_get.call_count == 1
+    assert resource_client.response.status_code == 404
+
+
+def test_coalescing_disabled(resource_client, blocked_get):
+    assert resource_client.coalescer is coalescer
+    resource_client.coalescer = None
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(resource_client.read_resource, "resource_xyz") for _ in range(CALLERS)]
+        time.sleep(0.05)
+        released(blocked_get, futures)
+    assert blocked_get.call_count == CALLERS
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_codec
+
+:Synopsis:
+    Pytest for the pluggable JSON codec
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.models import codec
+from iam_lib.models.response_model import response_data
+
+
+logger = daiquiri.getLogger(__name__)
+
+DOCUMENT = {"key": "resource_xyz", "label": "Ünïcode ✓", "children": [], "size": 12345, "ratio": -1.5, "ok": None}
+
+
+@pytest.fixture(params=codec.available_codecs())
+def json_codec(request):
+    yield codec.set_codec(request.param)
+    codec.set_codec(None)
+
+
+def test_default_codec_is_preferred_backend():
+    assert codec.get_codec().name == codec.available_codecs()[0]
+    assert "json" in codec.available_codecs()
+
+
+def test_set_codec_unknown():
+    with pytest.raises(ValueError):
+        codec.set_codec("yaml")
+
+
+def test_codec_round_trip(json_codec):
+    encoded = json_codec.dumps(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == DOCUMENT
+    assert json_codec.loads(encoded) == DOCUMENT
+    assert json_codec.loads(json.dumps(DOCUMENT).encode("utf-8")) == DOCUMENT
+
+
+def test_codecs_encode_alike():
+    encoded = set()
+    for name in codec.available_codecs():
+        encoded.add(codec.set_codec(name).dumps(DOCUMENT))
+    codec.set_codec(None)
+    assert len(encoded) == 1
+
+
+def test_response_data_decodes_bytes(client, json_codec):
+    response = MagicMock(content=json.dumps(DOCUMENT).encode("utf-8"))
+    assert response_data(client, response) == DOCUMENT
+    response = MagicMock(content=b"{\"key\": ")
+    with pytest.raises(iam_lib.exceptions.IAMJSONDecodeError):
+        response_data(client, response)
+
+
+def test_request_body_encoded_by_codec(resource_client, cookies, headers, json_codec, mocker):
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+    mock_post = mocker.patch.object(requests.Session, "post", return_value=response)
+    resource_client.create_resource(resource_key="resource_xyz", resource_label="Ünïcode ✓", resource_type="resource")
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert json.loads(kwargs["data"]) == {
+        "resource_key": "resource_xyz",
+        "resource_label": "Ünïcode ✓",
+        "resource_type": "resource",
+        "parent_resource_key": None,
+    }
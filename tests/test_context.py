@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_context
+
+:Synopsis:
+    Pytest for the shared IAM context and its lightweight clients
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import time
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+import iam_lib.token
+from iam_lib.api.access import AccessClient
+from iam_lib.api.api_key import ApiKeyClient
+from iam_lib.api.authorized import AuthorizedClient
+from iam_lib.api.edi_token import EdiTokenClient
+from iam_lib.api.eml import EMLClient
+from iam_lib.api.group import GroupClient
+from iam_lib.api.profile import ProfileClient
+from iam_lib.api.resource import ResourceClient
+from iam_lib.api.rule import RuleClient
+from iam_lib.cache import DecisionCache, ResponseCache
+from iam_lib.context import IAMContext
+from iam_lib.models.resource_tree import ResourceTree
+from tests.config import Config
+from tests.conftest import TOKEN
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+CLIENTS = {
+    "access": AccessClient,
+    "api_key": ApiKeyClient,
+    "authorized": AuthorizedClient,
+    "edi_token": EdiTokenClient,
+    "eml": EMLClient,
+    "group": GroupClient,
+    "profile": ProfileClient,
+    "resource": ResourceClient,
+    "rule": RuleClient,
+}
+
+
+@pytest.fixture
+def context():
+    with IAMContext(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=TOKEN,
+        response_cache=ResponseCache(),
+        decision_cache=DecisionCache(),
+    ) as context:
+        yield context
+
+
+def test_context_clients(context):
+    for name, client_class in CLIENTS.items():
+        client = getattr(context, name)()
+        assert type(client) is client_class
+        assert client.session is context.session
+        assert client.response_cache is context.response_cache
+        assert client.coalescer is context.coalescer
+        assert (client.scheme, client.host, client.accept) == ("https", Config.AUTH_HOST, "application/json")
+        assert client.token == TOKEN and client.response is None and not client.thread_safe
+    assert context.authorized().decision_cache is context.decision_cache
+    assert context.api_key().token_cache is context.token_cache
+    tree = ResourceTree()
+    assert context.resource(resource_tree=tree).resource_tree is tree
+    assert context.resource(thread_safe=True).thread_safe
+
+
+def test_context_clients_not_validated(context, mocker):
+    validate = mocker.spy(iam_lib.token, "validate_token")
+    start = time.perf_counter()
+    for _ in range(1000):
+        for name in CLIENTS:
+            getattr(context, name)()
+    elapsed = time.perf_counter() - start
+    assert validate.call_count == 0
+    assert elapsed < 1  # Typically a few microseconds per client
+
+
+def test_context_requests(context, cookies, headers, mocker):
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{\"key\": \"a\"}")
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=response)
+    resource_client = context.resource()
+    rule_client = context.rule()
+    assert resource_client.read_resource("resource_xyz") == {"key": "a"}
+    assert mock_get.call_args.kwargs["cookies"] == {"edi-token": TOKEN}
+    assert resource_client.response is response and rule_client.response is None
+
+    token = make_token("EDI-0000000000000000000000000000000a")
+    context.token = token
+    context.resource().read_resource("resource_abc")
+    assert mock_get.call_args.kwargs["cookies"] == {"edi-token": token}
+    assert resource_client.token == TOKEN  # Clients already handed out keep their token
+    assert set(context.metrics()) == {
+        "coalescing", "response_cache", "decision_cache", "key_tokens", "retry_budget", "throttle", "circuit_breakers"
+    }
+
+
+def test_context_validation():
+    with pytest.raises(iam_lib.exceptions.IAMInvalidScheme):
+        IAMContext("ftp", Config.AUTH_HOST, Config.ACCEPT, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    with pytest.raises(iam_lib.exceptions.IAMInvalidToken):
+        IAMContext(
+            Config.SCHEME, Config.AUTH_HOST, Config.ACCEPT, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM, "not a token"
+        )
+
+
+def test_context_session_ownership():
+    session = requests.Session()
+    session.close = MagicMock()
+    with IAMContext(
+        Config.SCHEME, Config.AUTH_HOST, Config.ACCEPT, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM, session=session
+    ) as shared:
+        with shared.resource() as client:
+            assert client.session is session
+    session.close.assert_not_called()
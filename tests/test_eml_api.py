@@ -29,9 +29,10 @@ def test_add_eml(eml_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"ADD_EML\": \"OK\"}"
+        text="{\"ADD_EML\": \"OK\"}",
+        content=b"{\"ADD_EML\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     eml_client.add_eml(
         eml="<eml></eml>"
     )
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_imports
+
+:Synopsis:
+    Pytest of iam_lib import cost: lazily loaded dependencies and no circular imports, measured with -X importtime
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import importlib.util
+import os
+from pathlib import Path
+import pkgutil
+import subprocess
+import sys
+
+import daiquiri
+import pytest
+
+import iam_lib
+import iam_lib.api
+
+
+logger = daiquiri.getLogger(__name__)
+
+SRC = Path(iam_lib.__file__).parents[1]
+HEAVY = ("requests", "jwt", "cryptography", "asyncio", "httpx")  # Loaded on first use, never on import
+MODULES = sorted(
+    module.name
+    for module in pkgutil.walk_packages(iam_lib.__path__, "iam_lib.")
+    if not module.name.startswith("iam_lib.aio") or importlib.util.find_spec("httpx") is not None
+)
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Run the import statement in a new interpreter with -X importtime
+
+    Returns:
+        dict: module name to (self, cumulative) import time in microseconds, for every module imported
+    """
+    env = {**os.environ, "PYTHONPATH": SRC.as_posix()}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def modules_after(statement: str) -> set:
+    # Modules imported by the statement in a new interpreter, including those imported through importlib, which
+    # -X importtime does not report
+    env = {**os.environ, "PYTHONPATH": SRC.as_posix()}
+    statement = f"{statement}; import sys; print(*sys.modules)"
+    result = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True, env=env, check=True)
+    return set(result.stdout.split())
+
+
+def loaded(modules, package: str) -> list:
+    return [name for name in modules if name == package or name.startswith(f"{package}.")]
+
+
+def test_package_import_is_empty():
+    times = import_times("import iam_lib")
+    assert loaded(times, "iam_lib") == ["iam_lib"]
+
+
+@pytest.mark.parametrize("module", ["iam_lib.api.resource", "iam_lib.api.authorized", "iam_lib.context"])
+def test_client_import_defers_dependencies(module):
+    modules = modules_after(f"import {module}")
+    for package in HEAVY:
+        assert loaded(modules, package) == [], f"{module} imports {package}"
+    times = import_times(f"import {module}")
+    logger.info(f"import {module}: {times[module][1]} us")
+
+
+def test_lazy_exports():
+    modules = modules_after("from iam_lib import RuleClient; import iam_lib.api; iam_lib.api.ResourceClient")
+    assert "iam_lib.api.rule" in modules and "iam_lib.api.resource" in modules
+    assert "iam_lib.api.group" not in modules and "iam_lib.context" not in modules
+    assert "ResourceClient" in dir(iam_lib.api)
+    with pytest.raises(AttributeError):
+        iam_lib.NoSuchClient
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_module_imports_alone(module):
+    # Each module imported first in a new interpreter: a circular import fails for at least one of them
+    import_times(f"import {module}")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_policy
+
+:Synopsis:
+    Pytest for the local access control rule evaluation engine
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+from iam_lib.models.permission import Permission
+from iam_lib.policy import grant, PolicyEngine
+
+
+logger = daiquiri.getLogger(__name__)
+
+TREE = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())
+RANK = {"READ": 1, "WRITE": 2, "CHANGE": 3}
+REQUIRED = {"read": 1, "write": 2, "changePermission": 3}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def nodes(trees):
+    for node in trees:
+        yield node
+        yield from nodes(node["children"])
+
+
+def server_decision(principals, node, permission) -> bool:
+    # Reference decision: some principal holds a rule at or above the requested permission
+    return any(
+        p["edi_id"] in principals and RANK[p["permission"]] >= REQUIRED[permission] for p in node["principals"]
+    )
+
+
+@pytest.fixture
+def engine(resource_client, rule_client, cookies, headers, mocker):
+    def get(url, params=None, **kwargs):
+        key = url.rsplit("/", 1)[-1]
+        tree = [node for node in TREE if node["key"] == key]
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text=json.dumps(tree), content=json.dumps(tree).encode("utf-8"))
+
+    mocker.patch.object(requests.Session, "get", side_effect=get)
+    return PolicyEngine(resource_client, rule_client, [node["key"] for node in TREE])
+
+
+def test_grant():
+    assert grant("READ") == Permission.READ
+    assert grant("write") == Permission.READ | Permission.WRITE
+    assert Permission.CHANGE_PERMISSION in grant("changePermission")
+    assert grant(Permission.WRITE) == grant("WRITE")
+    with pytest.raises(ValueError):
+        grant("owner")
+
+
+def test_policy_engine_matches_server(engine):
+    principals = {p["edi_id"] for node in nodes(TREE) for p in node["principals"]}
+    for node in nodes(TREE):
+        for principal in principals:
+            for permission in REQUIRED:
+                expected = server_decision({principal}, node, permission)
+                assert engine.is_authorized([principal], node["key"], permission) is expected
+    assert engine.is_authorized(["EDI-unknown"], "unknown_resource", "read") is False
+
+
+def test_policy_engine_principal_union(engine):
+    data = TREE[0]["children"][0]  # Nancy Lewis WRITE, Richard's group CHANGE
+    assert engine.effective_permission(["EDI-9df7ff7a61e148be97a7527b467e71de"], data["key"]) is Permission.WRITE
+    principals = ["EDI-9df7ff7a61e148be97a7527b467e71de", "EDI-17a7b5077c2948578f667b42ffb34526"]
+    assert engine.effective_permission(principals, data["key"]) is Permission.CHANGE_PERMISSION
+    assert engine.is_authorized(principals, data["key"], Permission.CHANGE_PERMISSION) is True
+    assert engine.index.parents[data["key"]] == TREE[0]["key"]
+
+
+def test_policy_engine_refresh(resource_client, rule_client, cookies, headers, mocker):
+    clock = FakeClock()
+    tree = {"key": "resource_xyz", "children": [], "principals": [{"edi_id": "EDI-a", "permission": "READ"}]}
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text=json.dumps(tree), content=json.dumps(tree).encode("utf-8"))
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=response)
+    engine = PolicyEngine(resource_client, rule_client, ["resource_xyz"], refresh_interval=60, clock=clock)
+    assert engine.is_authorized(["EDI-a"], "resource_xyz", "read") is True
+    assert engine.is_authorized(["EDI-a"], "resource_xyz", "read") is True
+    assert mock_get.call_count == 1
+
+    tree["principals"] = []
+    response.text = json.dumps(tree)
+    response.content = response.text.encode("utf-8")
+    clock.now = 61
+    engine.is_authorized(["EDI-a"], "resource_xyz", "read")  # Answered from the previous rules
+    engine.close()  # Wait for the background reload
+    assert mock_get.call_count == 2
+    assert engine.is_authorized(["EDI-a"], "resource_xyz", "read") is False
+
+
+def test_policy_engine_resource_rules(resource_client, rule_client, cookies, headers, mocker):
+    tree = {"key": "resource_xyz", "children": []}
+    rules = [{"resource_key": "resource_xyz", "principal": "EDI-a", "permission": "write"}]
+
+    def get(url, params=None, **kwargs):
+        text = json.dumps(rules if "/rules/resource/" in url else tree)
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text=text, content=text.encode("utf-8"))
+
+    mocker.patch.object(requests.Session, "get", side_effect=get)
+    engine = PolicyEngine(resource_client, rule_client, ["resource_xyz"])
+    assert engine.effective_permission(["EDI-a"], "resource_xyz") is Permission.WRITE
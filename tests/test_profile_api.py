@@ -29,9 +29,10 @@ def test_create_profile(profile_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"CREATE_PROFILE\": \"OK\"}"
+        text="{\"CREATE_PROFILE\": \"OK\"}",
+        content=b"{\"CREATE_PROFILE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     profile_client.create_profile(
         idp_uid="uid=jack,o=EDI,dc=edirepository,dc=org",
     )
@@ -45,9 +46,10 @@ def test_update_profile(profile_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"UPDATE_PROFILE\": \"OK\"}"
+        text="{\"UPDATE_PROFILE\": \"OK\"}",
+        content=b"{\"UPDATE_PROFILE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "put", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "put", return_value=mock_requests_response)
     profile_client.update_profile(
         profile_edi_identifier="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
         given_name="Jack",
@@ -64,9 +66,10 @@ def test_delete_profile(profile_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"DELETE_PROFILE\": \"OK\"}"
+        text="{\"DELETE_PROFILE\": \"OK\"}",
+        content=b"{\"DELETE_PROFILE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "delete", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "delete", return_value=mock_requests_response)
     profile_client.delete_profile(
         profile_edi_identifier="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
     )
@@ -80,9 +83,10 @@ def test_read_profile(profile_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_PROFILE\": \"OK\"}"
+        text="{\"READ_PROFILE\": \"OK\"}",
+        content=b"{\"READ_PROFILE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     profile_client.read_profile(
         profile_edi_identifier="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
     )
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_records
+
+:Synopsis:
+    Pytest for the response record models
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+from iam_lib.models.records import Group, IssuedToken, Profile, Resource, Rule
+from tests.conftest import TOKEN
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class CountingDict(dict):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = []
+
+    def __getitem__(self, key):
+        self.reads.append(key)
+        return super().__getitem__(key)
+
+
+def test_record_lazy_decoding():
+    payload = CountingDict({"resource_key": "resource_xyz", "principal": "EDI-a", "permission": "read"})
+    rule = Rule(payload)
+    assert payload.reads == []  # Nothing decoded on construction
+    assert rule.permission == "read"
+    assert rule.permission == "read"
+    assert payload.reads == ["permission"]  # Decoded once, on first access
+
+
+def test_record_compact_and_interned():
+    payloads = [json.loads('{"resource_key": "r%d", "principal": "EDI-a", "permission": "read"}' % i) for i in range(2)]
+    rules = Rule.from_list(payloads, compact=True)
+    assert rules[0]._raw is None
+    assert rules[0].permission is rules[1].permission  # One shared string across records
+    assert rules[1].to_dict() == {"resource_key": "r1", "principal": "EDI-a", "permission": "read"}
+    assert not hasattr(rules[0], "__dict__")
+    with pytest.raises(AttributeError):
+        rules[0].permission = "write"
+    assert rules[0] == Rule(payloads[0])
+
+
+def test_record_field_aliases():
+    resource = Resource({"key": "r1", "label": "Data", "type": "collection", "children": []})
+    assert (resource.key, resource.label, resource.type, resource.parent) == ("r1", "Data", "collection", None)
+    group = Group({"group_name": "lab", "members": ["EDI-a", "EDI-b"]})
+    assert group.name == "lab" and group.members == ("EDI-a", "EDI-b")
+    profile = Profile({"edi_id": "EDI-a", "given_name": "Ada"})
+    assert profile.given_name == "Ada" and profile.email is None
+
+
+def test_issued_token_claims():
+    token = IssuedToken({"edi-token": TOKEN})
+    assert token.subject == "EDI-221c782cc3c84fcba888fadd7cbe708a"
+    assert token.principals == []
+    assert IssuedToken(TOKEN).expiry == token.expiry
+
+
+def test_iter_resource_rules_models(rule_client, cookies, headers, mocker):
+    rules = [{"resource_key": "resource_xyz", "principal": f"EDI-{i}", "permission": "write"} for i in range(3)]
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies)
+    response.iter_content.return_value = iter([json.dumps(rules).encode("utf-8")])
+    mocker.patch.object(requests.Session, "get", return_value=response)
+    records = list(rule_client.iter_resource_rules("resource_xyz", models=True))
+    assert [record.principal for record in records] == ["EDI-0", "EDI-1", "EDI-2"]
+    assert all(isinstance(record, Rule) and record._raw is None for record in records)
@@ -16,6 +16,9 @@
 """
 from unittest.mock import MagicMock
 
+import json
+from pathlib import Path
+
 import daiquiri
 import requests
 
@@ -29,9 +32,10 @@ def test_create_resource(resource_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"CREATE_RESOURCE\": \"OK\"}"
+        text="{\"CREATE_RESOURCE\": \"OK\"}",
+        content=b"{\"CREATE_RESOURCE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     resource_client.create_resource(
         resource_key="resource_xyz",
         resource_label="xyz",
@@ -47,9 +51,10 @@ def test_update_resource(resource_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"UPDATE_RESOURCE\": \"OK\"}"
+        text="{\"UPDATE_RESOURCE\": \"OK\"}",
+        content=b"{\"UPDATE_RESOURCE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "put", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "put", return_value=mock_requests_response)
     resource_client.update_resource(
         resource_key="resource_xyz",
         resource_label="xyz",
@@ -66,9 +71,10 @@ def test_delete_resource(resource_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"DELETE_RESOURCE\": \"OK\"}"
+        text="{\"DELETE_RESOURCE\": \"OK\"}",
+        content=b"{\"DELETE_RESOURCE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "delete", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "delete", return_value=mock_requests_response)
     resource_client.delete_resource(
         resource_key="resource_xyz"
     )
@@ -82,9 +88,10 @@ def test_read_resource(resource_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_RESOURCE\": \"OK\"}"
+        text="{\"READ_RESOURCE\": \"OK\"}",
+        content=b"{\"READ_RESOURCE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     resource_client.read_resource(
         resource_key="resource_xyz",
         ancestors=True,
@@ -100,11 +107,39 @@ def test_read_resources(resource_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_RESOURCES\": \"OK\"}"
+        text="{\"READ_RESOURCES\": \"OK\"}",
+        content=b"{\"READ_RESOURCES\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     resource_client.read_resources()
     assert resource_client.response.status_code == 200
     assert resource_client.response.text == "{\"READ_RESOURCES\": \"OK\"}"
 
 
+
+
+def test_read_resource_tree_tracks_changes(resource_client, cookies, headers, mocker):
+    tree = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())[0]
+    package, data = tree["key"], tree["children"][0]["key"]
+    ok = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text="{\"OK\": \"OK\"}", content=b"{\"OK\": \"OK\"}")
+    mocker.patch.object(
+        requests.Session,
+        "get",
+        return_value=MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text=json.dumps(tree), content=json.dumps(tree).encode("utf-8")),
+    )
+    mocker.patch.object(requests.Session, "post", return_value=ok)
+    mocker.patch.object(requests.Session, "put", return_value=ok)
+    mocker.patch.object(requests.Session, "delete", return_value=ok)
+
+    resource_tree = resource_client.read_resource_tree(package)
+    assert resource_client.resource_tree is resource_tree
+    assert resource_tree.subtree_size(package) == 6
+
+    assert resource_client.create_resource("new_csv", "new.csv", "data", data) == {"OK": "OK"}
+    assert resource_tree.ancestors("new_csv") == (package, data)
+    resource_client.create_resource("elsewhere", "elsewhere", "data", "unknown_parent")
+    assert "elsewhere" not in resource_tree
+    resource_client.update_resource("new_csv", "renamed.csv", "data", package)
+    assert resource_tree.parent("new_csv") == package
+    resource_client.delete_resource(data)
+    assert resource_tree.subtree_size(package) == 5
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_resource_tree
+
+:Synopsis:
+    Pytest for the indexed resource tree
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import json
+from pathlib import Path
+
+import daiquiri
+import pytest
+
+from iam_lib.models.resource_tree import ResourceTree
+
+
+logger = daiquiri.getLogger(__name__)
+
+TREE = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())
+PACKAGE = "eeb4361383494c83a3db01bc7472f4dc"
+DATA = "243af8d5244a46a3918545ebc5f3525c"
+CSV = "3d353fbb5de54fadb04a2cbf8ddf5247"
+METADATA = "ce9746fc23d7478982be44eda20359b7"
+
+
+def check_invariants(tree: ResourceTree):
+    # Indexes must always agree with a traversal from the roots
+    for node in tree:
+        expected_path = () if node.parent is None else tree.ancestors(node.parent) + (node.parent,)
+        assert node.path == expected_path
+        assert node.size == 1 + sum(tree.subtree_size(child) for child in node.children)
+        assert node.key in tree.by_type(node.type)
+    assert sum(1 for _ in tree) == len(tree)
+
+
+def test_resource_tree_lookups():
+    tree = ResourceTree(TREE)
+    assert len(tree) == 24
+    assert tree.roots == tuple(node["key"] for node in TREE)
+    assert tree.parent(CSV) == DATA
+    assert tree.ancestors(CSV) == (PACKAGE, DATA)
+    assert tree.subtree_size(PACKAGE) == 6
+    assert [node.key for node in tree.descendants(DATA)] == [CSV]
+    assert tree.by_type("package") == frozenset(node["key"] for node in TREE)
+    assert tree[CSV].principals[0]["permission"] == "READ"
+    check_invariants(tree)
+
+
+def test_resource_tree_updates():
+    tree = ResourceTree(TREE)
+    tree.add("new_csv", "new.csv", "data", DATA)
+    assert tree.subtree_size(PACKAGE) == 7
+    assert tree.ancestors("new_csv") == (PACKAGE, DATA)
+
+    tree.update(DATA, "Data", "collection", METADATA)  # Move the data collection under metadata
+    assert tree.ancestors(CSV) == (PACKAGE, METADATA, DATA)
+    assert tree.subtree_size(METADATA) == 6
+    tree.update(CSV, "landslide_risk.csv", "report", None)  # Move to a new root and change its type
+    assert tree.ancestors(CSV) == ()
+    assert CSV in tree.by_type("report") and CSV not in tree.by_type("data")
+    check_invariants(tree)
+
+    with pytest.raises(ValueError):
+        tree.update(PACKAGE, "edi.1145.1", "package", DATA)
+    assert tree.remove(METADATA) == 5
+    assert tree.subtree_size(PACKAGE) == 1
+    assert DATA not in tree
+    check_invariants(tree)
+
+
+def test_resource_tree_large():
+    tree = ResourceTree({"key": "root", "label": "root", "type": "package", "children": []})
+    for i in range(100):
+        tree.add(f"collection_{i}", f"collection {i}", "collection", "root")
+        for j in range(200):
+            tree.add(f"data_{i}_{j}", f"data {i} {j}", "data", f"collection_{i}")
+    assert tree.subtree_size("root") == 20101
+    assert len(tree.by_type("data")) == 20000
+    assert tree.ancestors("data_99_199") == ("root", "collection_99")
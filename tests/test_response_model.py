@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_response_model
+
+:Synopsis:
+    Pytest for response data conversion and streaming
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import asyncio
+import json
+from pathlib import Path
+import tracemalloc
+from unittest.mock import MagicMock
+from xml.sax.saxutils import escape
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.models.records import Resource
+from iam_lib.models.response_model import aiter_json_items, aiter_xml_items, iter_json_items, iter_xml_items, xml_data
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+def rules_body(records: int, chunk_size: int = 64 * 1024):
+    # Generate a JSON array of rules chunk by chunk, never holding the whole body
+    buffer = bytearray(b"[")
+    for i in range(records):
+        rule = {"resource_key": f"resource_{i}", "principal": f"EDI-{i:032x}", "permission": "changePermission"}
+        buffer += json.dumps(rule).encode("utf-8")
+        if i < records - 1:
+            buffer += b", "
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def to_xml(name: str, value, item: str = "item") -> str:
+    # Serialize decoded JSON as the XML equivalent understood by xml_data
+    if value is None:
+        return f"<{name}/>"
+    if isinstance(value, list):
+        return f"<{name}>" + "".join(to_xml(item, element) for element in value) + f"</{name}>"
+    if isinstance(value, dict):
+        return f"<{name}>" + "".join(to_xml(key, element, "resource") for key, element in value.items()) + f"</{name}>"
+    return f"<{name}>{escape(str(value))}</{name}>"
+
+
+def rules_xml(records: int, chunk_size: int = 64 * 1024):
+    buffer = bytearray(b"<?xml version='1.0' encoding='utf-8'?><rules>")
+    for i in range(records):
+        rule = {"resource_key": f"resource_{i}", "principal": f"EDI-{i:032x}", "permission": "changePermission"}
+        buffer += to_xml("rule", rule).encode("utf-8")
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"</rules>"
+    yield bytes(buffer)
+
+
+def peak_memory(items) -> tuple[int, int]:
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in items)
+        return count, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+def test_iter_json_items_chunk_boundaries(chunk_size):
+    items = [{"label": "Ünïcode ✓", "n": i} for i in range(5)] + [12345, -1.5e3, "text", [1, [2]], None, True]
+    body = json.dumps(items).encode("utf-8")
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    assert list(iter_json_items(chunks)) == items
+
+
+def test_iter_json_items_documents():
+    assert list(iter_json_items([b" [ ", b"]\n"])) == []
+    assert list(iter_json_items([b'{"READ_RULE":', b' "OK"}'])) == [{"READ_RULE": "OK"}]
+    for body in (b"[1, 2", b"[1 2]", b"[1,]", b"[1] 2"):
+        with pytest.raises(iam_lib.exceptions.IAMJSONDecodeError):
+            list(iter_json_items([body]))
+
+
+def test_iter_json_items_bounded_memory():
+    small_count, small_peak = peak_memory(iter_json_items(rules_body(10_000)))
+    large_count, large_peak = peak_memory(iter_json_items(rules_body(40_000)))
+    assert (small_count, large_count) == (10_000, 40_000)
+    body_size = sum(len(chunk) for chunk in rules_body(40_000))
+    assert body_size > 4_000_000
+    assert large_peak < 1_000_000  # Peak memory is a small fraction of the body ...
+    assert large_peak < 2 * small_peak + 100_000  # ... and does not grow with it
+
+
+def test_iter_principal_rules_streams(rule_client, cookies, headers, mocker):
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies)
+    response.iter_content.side_effect = lambda chunk_size: rules_body(20_000)
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=response)
+    count, peak = peak_memory(rule_client.iter_principal_rules())
+    assert count == 20_000
+    assert peak < 1_000_000
+    assert mock_get.call_args.kwargs["stream"] is True
+    response.close.assert_called_once()
+    assert rule_client.response is None
+
+
+def test_xml_data_matches_json():
+    tree = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())
+    assert xml_data(to_xml("resources", tree, "resource").encode("utf-8")) == tree
+    assert xml_data("<resource><key>a</key><children/><principals><principal><edi_id>b</edi_id></principal>"
+                    "</principals></resource>") == {"key": "a", "children": [], "principals": [{"edi_id": "b"}]}
+    assert xml_data('<x:group xmlns:x="urn:x" id="1"><x:member>a</x:member><x:member>b</x:member>'
+                    '<name> n </name></x:group>') == {"id": "1", "member": ["a", "b"], "name": "n"}
+    with pytest.raises(iam_lib.exceptions.IAMXMLDecodeError):
+        xml_data(b"<rules><rule></rules>")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_iter_xml_items_chunk_boundaries(chunk_size):
+    body = b"".join(rules_xml(5))
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    assert list(iter_xml_items(chunks)) == xml_data(body)
+    assert list(iter_xml_items([b"<rules>", b"</rules>"])) == []
+    with pytest.raises(iam_lib.exceptions.IAMXMLDecodeError):
+        list(iter_xml_items([b"<rules><rule>"]))
+
+
+def test_iter_xml_items_bounded_memory():
+    small_count, small_peak = peak_memory(iter_xml_items(rules_xml(5_000)))
+    large_count, large_peak = peak_memory(iter_xml_items(rules_xml(20_000)))
+    assert (small_count, large_count) == (5_000, 20_000)
+    assert sum(len(chunk) for chunk in rules_xml(20_000)) > 2_000_000
+    assert large_peak < 1_000_000
+    assert large_peak < 2 * small_peak + 100_000
+
+
+def test_iter_resources_xml(resource_client, cookies, headers, mocker):
+    resource_client.accept = "xml"
+    resources = [{"resource_key": f"resource_{i}", "resource_label": "Ünïcode ✓", "resource_type": "data"}
+                 for i in range(3)]
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies)
+    response.iter_content.return_value = [to_xml("resources", resources, "resource").encode("utf-8")]
+    mocker.patch.object(requests.Session, "get", return_value=response)
+    records = list(resource_client.iter_resources(models=True))
+    assert records == Resource.from_list(resources)
+    assert records[0].label == "Ünïcode ✓"
+
+
+def test_read_resource_tree_xml(resource_client, cookies, headers, mocker):
+    resource_client.accept = "xml"
+    tree = json.loads((Path(__file__).parent / "data" / "resource_tree.json").read_text())[0]
+    body = to_xml("resource", tree)
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, text=body,
+                         content=body.encode("utf-8"))
+    mocker.patch.object(requests.Session, "get", return_value=response)
+    resource_tree = resource_client.read_resource_tree(tree["key"])
+    assert resource_tree.subtree_size(tree["key"]) == 6
+    assert resource_client.read_resource(tree["key"]) == body  # Without structured, the XML str
+
+
+def test_aiter_json_items():
+    async def chunks():
+        for chunk in rules_body(1000, chunk_size=100):
+            yield chunk
+
+    async def main():
+        return [item async for item in aiter_json_items(chunks())]
+
+    items = asyncio.run(main())
+    assert len(items) == 1000
+    assert items[-1]["resource_key"] == "resource_999"
+
+
+def test_aiter_xml_items():
+    async def chunks():
+        for chunk in rules_xml(1000, chunk_size=100):
+            yield chunk
+
+    async def main():
+        return [item async for item in aiter_xml_items(chunks())]
+
+    items = asyncio.run(main())
+    assert len(items) == 1000
+    assert items[-1]["resource_key"] == "resource_999"
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_retry
+
+:Synopsis:
+    Pytest for the retry policy of requests failing to connect, on a fake clock
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+import urllib3.exceptions
+
+import iam_lib.exceptions
+from iam_lib.retry import parse_retry_after, RetryBudget, RetryPolicy, Throttle
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+class FakeClock:
+    # Monotonic clock advanced only by sleeping
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def policy_of(clock: FakeClock, **options) -> RetryPolicy:
+    # No jitter, so that each delay is the maximum of its backoff
+    options.setdefault("budget", RetryBudget(clock=clock))
+    options.setdefault("throttle", Throttle(clock=clock))
+    return RetryPolicy(clock=clock, sleep=clock.sleep, jitter=lambda: 1.0, **options)
+
+
+def refused() -> requests.ConnectionError:
+    # Connection never established: the request was not sent
+    reason = urllib3.exceptions.NewConnectionError(None, "Connection refused")
+    return requests.ConnectionError(urllib3.exceptions.MaxRetryError(None, "/", reason))
+
+
+def status(code: int, headers, cookies, retry_after: str = None) -> MagicMock:
+    headers = headers.copy()
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    return MagicMock(status_code=code, reason="Error", headers=headers, cookies=cookies, content=b"{}")
+
+
+def test_backoff_full_jitter():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=lambda: 1.0)
+    assert [policy.backoff(retry) for retry in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+    policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=lambda: 0.25)
+    assert policy.backoff(3) == 0.5
+
+
+def test_get_retried_with_backoff(client, clock, mocker):
+    client.retry_policy = policy_of(clock, attempts=4)
+    reset = requests.ConnectionError("Connection reset by peer")
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=reset)
+    with pytest.raises(iam_lib.exceptions.IAMRetryError) as e:
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 4
+    assert clock.sleeps == [0.5, 1.0, 2.0]
+    assert e.value.attempts == 4
+    assert e.value.last_error.__cause__ is reset
+    assert e.value.__cause__ is e.value.last_error
+
+
+def test_retry_recovers(client, clock, cookies, headers, mocker):
+    client.retry_policy = policy_of(clock)
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=[requests.Timeout("read"), response])
+    assert client.get("auth/v1/ping") is response
+    assert mock_get.call_count == 2 and clock.sleeps == [0.5]
+
+
+def test_deadline(client, clock, mocker):
+    client.retry_policy = policy_of(clock, attempts=10, deadline=3)
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("reset"))
+    with pytest.raises(iam_lib.exceptions.IAMRetryError):
+        client.get("auth/v1/ping")
+    assert clock.sleeps == [0.5, 1.0]  # The next retry, after 2.0 more seconds, would start at the deadline
+    assert mock_get.call_count == 3
+
+
+def test_post_retried_only_if_not_sent(client, clock, cookies, headers, mocker):
+    client.retry_policy = policy_of(clock)
+    reset = requests.ConnectionError("Connection reset by peer")
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=reset)
+    with pytest.raises(iam_lib.exceptions.IAMRequestError) as e:
+        client.post("auth/v1/rule")
+    assert mock_post.call_count == 1 and clock.sleeps == []
+    assert not isinstance(e.value, iam_lib.exceptions.IAMRetryError)
+    assert e.value.__cause__ is reset
+
+    response = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=[refused(), response])
+    assert client.post("auth/v1/rule") is response
+    assert mock_post.call_count == 2
+
+
+def test_retry_budget(client, clock, mocker):
+    budget = RetryBudget(capacity=2, refill_rate=0.5, clock=clock)
+    client.retry_policy = policy_of(clock, attempts=5, budget=budget)
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("reset"))
+    with pytest.raises(iam_lib.exceptions.IAMRetryError) as e:
+        client.get("auth/v1/ping")
+    # Two retries, then the budget, refilled by 0.75 token during the 1.5 seconds slept, is spent
+    assert e.value.attempts == 3
+    assert budget.budget_info() == (2, 1, 0.75, 2)
+    with pytest.raises(iam_lib.exceptions.IAMRequestError):
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 4  # No retry
+    clock.now += 10
+    assert budget.budget_info().tokens == 2
+
+
+def test_no_retry_policy(client, mocker):
+    client.retry_policy = None
+    mock_get = mocker.patch.object(requests.Session, "get", side_effect=requests.ConnectionError("reset"))
+    with pytest.raises(iam_lib.exceptions.IAMRequestError):
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 0 ") == 0.0
+    now = 1445412480.0  # Wed, 21 Oct 2015 07:28:00 GMT
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=lambda: now) == 30.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:27:00 GMT", now=lambda: now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_after(client, clock, cookies, headers, mocker):
+    client.retry_policy = policy_of(clock)
+    ok = status(200, headers, cookies)
+    mocker.patch.object(requests.Session, "get", side_effect=[status(429, headers, cookies, "7"), ok])
+    assert client.get("auth/v1/ping") is ok
+    assert clock.sleeps == [7.0]  # The service's delay instead of the backoff
+
+
+def test_transient_status_exhausted(client, clock, cookies, headers, mocker):
+    client.retry_policy = policy_of(clock)
+    unavailable = status(503, headers, cookies)
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=unavailable)
+    with pytest.raises(iam_lib.exceptions.IAMResponseError) as e:
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 3 and clock.sleeps == [0.5, 1.0]
+    assert e.value.response is unavailable and client.response is unavailable
+
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=status(404, headers, cookies))
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.get("auth/v1/ping")
+    assert mock_get.call_count == 1
+
+
+def test_post_retried_only_if_declined(client, clock, cookies, headers, mocker):
+    client.retry_policy = policy_of(clock)
+    ok = status(200, headers, cookies)
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=[status(503, headers, cookies), ok])
+    assert client.post("auth/v1/rule") is ok
+    assert mock_post.call_count == 2
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=[status(502, headers, cookies), ok])
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.post("auth/v1/rule")  # The gateway may have forwarded the request
+    assert mock_post.call_count == 1
+
+
+def test_shared_back_off(client, resource_client, clock, cookies, headers, mocker):
+    shared = Throttle(clock=clock)
+    client.retry_policy = policy_of(clock, attempts=1, throttle=shared)
+    resource_client.retry_policy = policy_of(clock, throttle=shared)
+    mocker.patch.object(requests.Session, "get", return_value=status(429, headers, cookies, "5"))
+    with pytest.raises(iam_lib.exceptions.IAMResponseError):
+        client.get("auth/v1/ping")
+    assert shared.throttle_info() == (1, 0, 1)
+
+    # Another client waits out the window before sending its request
+    ok = status(200, headers, cookies)
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=ok)
+    clock.now += 2
+    assert resource_client.get("auth/v1/resource/resource_xyz") is ok
+    assert clock.sleeps == [3.0] and mock_get.call_count == 1
+    assert shared.throttle_info() == (1, 1, 0)
+
+
+def test_back_off_past_deadline(client, clock, mocker):
+    client.retry_policy = policy_of(clock, deadline=10)
+    client.retry_policy.throttle.defer(f"{client.scheme}://{client.host}", 60)
+    mock_get = mocker.patch.object(requests.Session, "get")
+    with pytest.raises(iam_lib.exceptions.IAMThrottledError) as e:
+        client.get("auth/v1/ping")
+    assert e.value.retry_after == 60
+    mock_get.assert_not_called()
@@ -32,9 +32,10 @@ def test_create_rule(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"CREATE_RULE\": \"OK\"}"
+        text="{\"CREATE_RULE\": \"OK\"}",
+        content=b"{\"CREATE_RULE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "post", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "post", return_value=mock_requests_response)
     rule_client.create_rule(
         resource_key="resource_xyz",
         principal="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
@@ -50,9 +51,10 @@ def test_update_rule(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"UPDATE_RULE\": \"OK\"}"
+        text="{\"UPDATE_RULE\": \"OK\"}",
+        content=b"{\"UPDATE_RULE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "put", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "put", return_value=mock_requests_response)
     rule_client.update_rule(
         resource_key="resource_xyz",
         principal="EDI-3fa734a7cd6e40998a5c2b5486b6eced",
@@ -68,9 +70,10 @@ def test_delete_rule(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"DELETE_RULE\": \"OK\"}"
+        text="{\"DELETE_RULE\": \"OK\"}",
+        content=b"{\"DELETE_RULE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "delete", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "delete", return_value=mock_requests_response)
     rule_client.delete_rule(
         resource_key="resource_xyz",
         principal="EDI-3fa734a7cd6e40998a5c2b5486b6eced"
@@ -85,9 +88,10 @@ def test_read_rule(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_RULE\": \"OK\"}"
+        text="{\"READ_RULE\": \"OK\"}",
+        content=b"{\"READ_RULE\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     rule_client.read_rule(
         resource_key="resource_xyz",
         principal="EDI-3fa734a7cd6e40998a5c2b5486b6eced"
@@ -102,9 +106,10 @@ def test_read_principal_rules(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_PRINCIPAL_RULES\": \"OK\"}"
+        text="{\"READ_PRINCIPAL_RULES\": \"OK\"}",
+        content=b"{\"READ_PRINCIPAL_RULES\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     rule_client.read_principal_rules()
     assert rule_client.response.status_code == 200
     assert rule_client.response.text == "{\"READ_PRINCIPAL_RULES\": \"OK\"}"
@@ -116,9 +121,10 @@ def test_read_resource_rules(rule_client, cookies, headers, mocker):
         reason="OK",
         headers=headers,
         cookies=cookies,
-        text="{\"READ_RESOURCE_RULES\": \"OK\"}"
+        text="{\"READ_RESOURCE_RULES\": \"OK\"}",
+        content=b"{\"READ_RESOURCE_RULES\": \"OK\"}"
     )
-    mocker.patch.object(requests, "get", return_value=mock_requests_response)
+    mocker.patch.object(requests.Session, "get", return_value=mock_requests_response)
     rule_client.read_resource_rules(
         resource_key="resource_xyz",
     )
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_thread_safety
+
+:Synopsis:
+    Pytest stress test of one thread-safe client instance shared by a thread pool
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import random
+import time
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.api.authorized import AuthorizedClient
+from iam_lib.api.resource import ResourceClient
+from iam_lib.models.response_model import response_data
+from tests.config import Config
+from tests.conftest import TOKEN
+
+
+logger = daiquiri.getLogger(__name__)
+
+THREADS = 16
+CALLS = 100
+
+
+def make_client(client_class, **kwargs):
+    return client_class(
+        scheme=Config.SCHEME,
+        host=Config.AUTH_HOST,
+        accept=Config.ACCEPT,
+        public_key_path=Config.PUBLIC_KEY_PATH,
+        algorithm=Config.JWT_ALGORITHM,
+        token=TOKEN,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def echo_server(cookies, headers, mocker):
+    # Stand-in for the IAM service: a resource echoes its key; only even resources are authorized
+    def get(url, params=None, **kwargs):
+        time.sleep(random.random() / 10_000)  # Interleave the threads
+        if url.endswith("auth/v1/authorized"):
+            if int(params["resource_key"].rsplit("_", 1)[1]) % 2:
+                return MagicMock(status_code=403, reason="Forbidden", headers=headers, cookies=cookies, content=b"")
+            return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=b"{}")
+        if url.endswith("_missing"):
+            return MagicMock(status_code=404, reason="Not Found", headers=headers, cookies=cookies, content=b"")
+        content = json.dumps({"key": url.rsplit("/", 1)[1]}).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=content)
+
+    return mocker.patch.object(requests.Session, "get", side_effect=get)
+
+
+def test_thread_safe_client_stress(echo_server):
+    resource_client = make_client(ResourceClient, thread_safe=True)
+    authorized_client = make_client(AuthorizedClient, thread_safe=True)
+
+    def work(thread: int) -> int:
+        checked = 0
+        for call in range(CALLS):
+            key = f"resource_{thread}_{call}"
+            assert resource_client.read_resource(key) == {"key": key}
+            assert response_data(resource_client) == {"key": key}  # This thread's last response
+            assert authorized_client.is_authorized(key, "read") is (call % 2 == 0)
+            assert authorized_client.response.status_code == (200 if call % 2 == 0 else 403)
+            if call % 10 == 0:
+                with pytest.raises(iam_lib.exceptions.IAMResponseError):
+                    resource_client.read_resource(f"{key}_missing")
+                assert resource_client.response.status_code == 404
+            checked += 1
+        return checked
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        assert sum(executor.map(work, range(THREADS))) == THREADS * CALLS
+    assert echo_server.call_count == THREADS * CALLS * 2 + THREADS * CALLS // 10
+    assert resource_client.response is None  # No request made by this thread
+
+
+def test_shared_response_by_default(echo_server):
+    resource_client = make_client(ResourceClient)
+    assert not resource_client.thread_safe
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(resource_client.read_resource, "resource_0").result()
+    assert response_data(resource_client) == {"key": "resource_0"}
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_token
+
+:Synopsis:
+    Pytest for the token module
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+import os
+import time
+from pathlib import Path
+import shutil
+
+from cryptography.exceptions import UnsupportedAlgorithm
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+import daiquiri
+import jwt
+import pytest
+
+import iam_lib.exceptions
+from iam_lib.token import PublicKeyCache, Token, VerifiedTokenCache
+import iam_lib.token
+from tests.config import Config
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+
+def test_public_key_cache_loads_once(tmp_path, mocker):
+    public_key_path = shutil.copy(Config.PUBLIC_KEY_PATH, tmp_path / "public.pem")
+    public_keys = PublicKeyCache(check_interval=60)
+    load = mocker.spy(serialization, "load_pem_public_key")
+    key = public_keys.get(public_key_path)
+    assert public_keys.get(public_key_path) is key
+    assert load.call_count == 1
+
+
+def test_public_key_cache_reloads_on_change(tmp_path, mocker):
+    public_key_path = shutil.copy(Config.PUBLIC_KEY_PATH, tmp_path / "public.pem")
+    public_keys = PublicKeyCache(check_interval=0)
+    load = mocker.spy(serialization, "load_pem_public_key")
+    key = public_keys.get(public_key_path)
+    assert public_keys.get(public_key_path) is key
+    stat = os.stat(public_key_path)
+    os.utime(public_key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert public_keys.get(public_key_path) is not key
+    assert load.call_count == 2
+
+
+def test_public_key_cache_invalid(tmp_path):
+    public_keys = PublicKeyCache()
+    with pytest.raises(iam_lib.exceptions.IAMInvalidPublicKey):
+        public_keys.get((tmp_path / "missing.pem").as_posix())
+    Path(tmp_path / "garbage.pem").write_text("not a key")
+    with pytest.raises(iam_lib.exceptions.IAMInvalidPublicKey):
+        public_keys.get((tmp_path / "garbage.pem").as_posix())
+
+
+def test_public_key_cache_unreadable_or_unsupported(tmp_path, mocker):
+    public_key_path = shutil.copy(Config.PUBLIC_KEY_PATH, tmp_path / "public.pem")
+    public_keys = PublicKeyCache()
+    mocker.patch.object(Path, "read_bytes", side_effect=PermissionError("Permission denied"))
+    with pytest.raises(iam_lib.exceptions.IAMInvalidPublicKey, match="cannot be read"):
+        public_keys.get(public_key_path)
+    mocker.stopall()
+    mocker.patch.object(
+        serialization, "load_pem_public_key", side_effect=UnsupportedAlgorithm("Unsupported curve")
+    )
+    with pytest.raises(iam_lib.exceptions.IAMInvalidPublicKey, match="Unsupported curve"):
+        public_keys.get(public_key_path)
+
+
+def test_token_validate():
+    token = Token(make_token("EDI-221c782cc3c84fcba888fadd7cbe708a"))
+    token.validate(Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    with pytest.raises(iam_lib.exceptions.IAMInvalidToken):
+        Token(token.token[:-4] + "AAAA").validate(Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+
+
+def test_verified_token_cache_hits(tmp_path, mocker):
+    verified_tokens = VerifiedTokenCache(maxsize=2)
+    decode = mocker.spy(jwt, "decode")
+    token = make_token("EDI-221c782cc3c84fcba888fadd7cbe708a")
+    payload = verified_tokens.validate(token, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert verified_tokens.validate(token, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM) == payload
+    assert decode.call_count == 1
+    info = verified_tokens.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # Key identity is the key itself, not the path it was loaded from
+    other_key_path = shutil.copy(Config.PUBLIC_KEY_PATH, tmp_path / "public.pem")
+    verified_tokens.validate(token, other_key_path.as_posix(), Config.JWT_ALGORITHM)
+    assert verified_tokens.cache_info().hits == 2
+
+
+def test_verified_token_cache_expiry_and_eviction(mocker):
+    verified_tokens = VerifiedTokenCache(maxsize=2)
+    tokens = [make_token(f"EDI-{i:032x}") for i in range(3)]
+    for token in tokens:
+        verified_tokens.validate(token, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert verified_tokens.cache_info().currsize == 2
+    verified_tokens.validate(tokens[0], Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert verified_tokens.cache_info().hits == 0  # Least recently used token was evicted
+
+    verified_tokens.validate(tokens[2], Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert verified_tokens.cache_info().hits == 1
+    mocker.patch.object(iam_lib.token.time, "time", return_value=time.time() + 7200)
+    verified_tokens.validate(tokens[2], Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert verified_tokens.cache_info().misses == 5  # Expired entry is verified again
+
+
+def test_verified_token_cache_key_rotation(tmp_path, mocker):
+    public_key_path = shutil.copy(Config.PUBLIC_KEY_PATH, tmp_path / "public.pem").as_posix()
+    mocker.patch.object(iam_lib.token.public_keys, "check_interval", 0)
+    verified_tokens = VerifiedTokenCache()
+    decode = mocker.spy(jwt, "decode")
+    token = make_token("EDI-221c782cc3c84fcba888fadd7cbe708a")
+    verified_tokens.validate(token, public_key_path, Config.JWT_ALGORITHM)
+    verified_tokens.validate(token, public_key_path, Config.JWT_ALGORITHM)
+    assert decode.call_count == 1
+
+    # Rotate to a different key: the cached verification must not survive
+    rotated_key = ec.generate_private_key(ec.SECP256R1()).public_key()
+    Path(public_key_path).write_bytes(
+        rotated_key.public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    )
+    stat = os.stat(public_key_path)
+    os.utime(public_key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(iam_lib.exceptions.IAMInvalidToken):
+        verified_tokens.validate(token, public_key_path, Config.JWT_ALGORITHM)
+    assert decode.call_count == 2
+
+
+def test_verified_token_cache_returns_copies():
+    verified_tokens = VerifiedTokenCache()
+    token = make_token("EDI-221c782cc3c84fcba888fadd7cbe708a")
+    payload = verified_tokens.validate(token, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    payload["sub"] = "EDI-tampered"
+    payload["principals"].append("EDI-tampered")
+    cached = verified_tokens.validate(token, Config.PUBLIC_KEY_PATH, Config.JWT_ALGORITHM)
+    assert cached["sub"] == "EDI-221c782cc3c84fcba888fadd7cbe708a"
+    assert cached["principals"] == []
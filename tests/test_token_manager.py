@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+:Mod:
+    test_token_manager
+
+:Synopsis:
+    Pytest for the ahead-of-expiry token refresh manager
+
+:Author:
+    servilla
+
+:Created:
+    10/18/26
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import daiquiri
+import pytest
+import requests
+
+import iam_lib.exceptions
+from iam_lib.token import Token
+from iam_lib.token_manager import TokenManager
+from tests.conftest import TOKEN
+from tests.utilities import make_token
+
+
+logger = daiquiri.getLogger(__name__)
+
+SUBJECT = "EDI-221c782cc3c84fcba888fadd7cbe708a"
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def refresh_server(cookies, headers, mocker):
+    # Stand-in for the token refresh endpoint issuing a new token per call
+    issued = []
+
+    def post(url, data=None, **kwargs):
+        assert url.endswith("auth/v1/token/refresh")
+        token = make_token(SUBJECT, timedelta(hours=2))
+        issued.append((json.loads(data)["edi-token"], token))
+        content = json.dumps({"edi-token": token}).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=content)
+
+    mocker.patch.object(requests.Session, "post", side_effect=post)
+    return issued
+
+
+def near_expiry(token: str, remaining: float) -> FakeClock:
+    return FakeClock(Token(token).expiry - remaining)
+
+
+def test_token_manager_refresh_ahead(edi_token_client, resource_client, rule_client, refresh_server):
+    clock = near_expiry(TOKEN, 600)
+    manager = TokenManager(edi_token_client, TOKEN, refresh_ahead=300, clock=clock)
+    manager.attach(resource_client, rule_client)
+    assert manager.refresh() == TOKEN  # Not yet due
+    clock.now += 400
+    token = manager.refresh()
+    assert refresh_server == [(TOKEN, token)]
+    assert manager.token == token and manager.refreshes == 1
+    for client in (resource_client, rule_client):
+        assert client.token == token
+        assert client._cookies == {"edi-token": token}
+
+
+def test_token_manager_refreshes_before_request(edi_token_client, resource_client, refresh_server, mocker):
+    clock = near_expiry(TOKEN, 10)  # Within min_remaining: the background refresh has not run
+    manager = TokenManager(edi_token_client, TOKEN, min_remaining=30, clock=clock)
+    manager.attach(resource_client)
+    mock_get = mocker.patch.object(requests.Session, "get", return_value=MagicMock(status_code=200, content=b"{}"))
+    resource_client.read_resource("resource_xyz")
+    assert mock_get.call_args.kwargs["cookies"] == {"edi-token": refresh_server[0][1]}
+
+
+def test_token_manager_single_flight(edi_token_client, resource_client, cookies, headers, mocker):
+    release = threading.Event()
+    new_token = make_token(SUBJECT, timedelta(hours=2))
+
+    def post(url, **kwargs):
+        release.wait(5)
+        content = json.dumps({"edi-token": new_token}).encode("utf-8")
+        return MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=content)
+
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=post)
+    manager = TokenManager(edi_token_client, TOKEN, clock=near_expiry(TOKEN, 5))
+    manager.attach(resource_client)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(manager.ensure_fresh) for _ in range(8)]
+        time.sleep(0.05)
+        release.set()
+        for future in futures:
+            future.result()
+    assert mock_post.call_count == 1
+    assert resource_client.token == new_token
+
+
+def test_token_manager_background_thread(edi_token_client, resource_client, cookies, headers, mocker):
+    new_token = make_token(SUBJECT, timedelta(hours=2))
+    content = json.dumps({"edi-token": new_token}).encode("utf-8")
+    ok = MagicMock(status_code=200, reason="OK", headers=headers, cookies=cookies, content=content)
+    refused = requests.exceptions.ConnectionError("refused")
+    mock_post = mocker.patch.object(requests.Session, "post", side_effect=[refused] * 3 + [ok])
+    mocker.patch("iam_lib.api.client.time.sleep")  # The connection retry delay
+    manager = TokenManager(edi_token_client, TOKEN, retry_interval=0.01, clock=near_expiry(TOKEN, 60))
+    manager.attach(resource_client)
+    with manager:
+        deadline = time.monotonic() + 5
+        while manager.refreshes == 0 and time.monotonic() < deadline:
+            threading.Event().wait(0.01)
+    assert resource_client.token == new_token
+    assert mock_post.call_count == 4  # Retried after the failed refresh
+
+
+def test_token_manager_validation(edi_token_client, resource_client):
+    manager = TokenManager(edi_token_client, TOKEN)
+    with pytest.raises(ValueError):
+        manager.attach(edi_token_client)
+    manager.attach(resource_client)
+    manager.detach(resource_client)
+    assert resource_client._token_manager is None
+    edi_token_client.accept = "xml"
+    with pytest.raises(iam_lib.exceptions.IAMInvalidAccept):
+        TokenManager(edi_token_client, TOKEN)
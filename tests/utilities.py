@@ -26,7 +26,7 @@ from tests.config import Config
 logger = daiquiri.getLogger(__name__)
 
 
-def make_token(sub: str) -> str:
+def make_token(sub: str, lifetime: timedelta = timedelta(hours=1)) -> str:
     now = datetime.now(tz=timezone.utc)
     payload = {
         "sub": f"{sub}",
@@ -36,7 +36,7 @@ def make_token(sub: str) -> str:
         "iss": "https://auth.edirepository.org",
         "iat": now,
         "nbf": now,
-        "exp": now + timedelta(hours=1),
+        "exp": now + lifetime,
         "principals": [],
         "isEmailEnabled": False,
         "isEmailVerified": False,